@@ -1,25 +1,78 @@
+from config import STARTUP_PROFILE
+from lazy_imports import startup_profiler, is_installed
+
+if STARTUP_PROFILE:
+    # Times this script's first-run imports; stopped and logged at the bottom
+    startup_profiler.start()
+
 import streamlit as st
+import streamlit.components.v1 as components
 import random
 import time
 import os
 from dotenv import load_dotenv
 
+from assets import build_theme_asset, script_loader_html, static_script, theme_loader_html
+from chat_history import ChatHistoryView
+from config import (
+    STREAM_RESPONSES,
+    ASYNC_RESPONSES,
+    ASYNC_POLL_INTERVAL,
+    HEDGE_REQUESTS,
+    DEFERRED_GRADING,
+    GREETING_POOL_RESERVE,
+    SIDEBAR_SCRIPT,
+    OBSERVER_PROBE,
+    TURN_MODE,
+    MEMORY_REPORT,
+    STATS_REPORT,
+)
+from gemini_client import shared_client, pool_stats
+from grading import grade_answers, local_acknowledgement
+from greeting_pool import greeting_pool
+from hedging import hedger
+from i18n import N_, translate
+from language import SessionLanguage
+from lexicon import LEXICON
+from llm_worker import llm_workers
+from rate_limiter import gemini_guard, RateLimited
+from response_cache import response_cache
+from run_stats import script_run_stats, stats_log
+from session_store import session_store, new_token, SESSION_FIELDS
+from singleflight import llm_flights
+from tech_normalizer import split_stack
+from tech_questions import generate_questions
+from transcript import BoundedTranscript, memory_report
+from warmup import warmup
+
+script_run_stats.record_run()
+
 # Load environment variables
 load_dotenv()
 
-# Try to import Google GenAI, if not available, use fallback
-try:
-    import google.genai as genai
-    
+# Already running when started via `python warmup.py`; otherwise this
+# warms the process up for the sessions after this one
+warmup.start()
+
+@st.cache_resource
+def get_client(api_key):
+    """One pooled client per process, shared across sessions and reruns"""
+    return shared_client(api_key)
+
+def gemini():
+    """The client is created (and google.genai imported) on the first AI call, not at startup"""
+    return get_client(api_key)
+
+# Check Google GenAI is installed without importing it; if not, use fallback
+if is_installed("google.genai"):
     # Configure Google AI
     api_key = st.secrets.get("GOOGLE_API_KEY") or os.getenv("GOOGLE_API_KEY")
     if api_key:
-        client = genai.Client(api_key=api_key)
         AI_AVAILABLE = True
     else:
         AI_AVAILABLE = False
         st.error("⚠️ Google API key not found. Please configure it in Streamlit secrets.")
-except ImportError:
+else:
     AI_AVAILABLE = False
     st.warning("⚠️ Google AI not available. Using fallback responses.")
 
@@ -31,491 +84,53 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Force sidebar to be visible
-st.markdown("""
-<script>
-    // Force sidebar to be visible
-    const sidebar = document.querySelector('[data-testid="stSidebar"]');
-    if (sidebar) {
-        sidebar.style.display = 'block';
-        sidebar.style.visibility = 'visible';
-        sidebar.style.opacity = '1';
-    }
-</script>
-""", unsafe_allow_html=True)
+# ---------------- CSS & SIDEBAR SCRIPT ----------------
+def inject_assets():
+    """Load the theme and sidebar toggle once per browser session; later reruns send neither"""
+    if st.session_state.get("assets_injected"):
+        return
+    static = st.get_option("server.enableStaticServing")
 
-# ---------------- CSS ----------------
-st.markdown("""
-<style>
-/* Import Professional Fonts */
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap');
-
-/* Global Professional Styles */
-.stApp {
-    background: 
-        linear-gradient(135deg, rgba(15, 23, 42, 0.97) 0%, rgba(30, 41, 59, 0.95) 50%, rgba(51, 65, 85, 0.93) 100%),
-        radial-gradient(circle at 20% 80%, rgba(59, 130, 246, 0.1) 0%, transparent 50%),
-        radial-gradient(circle at 80% 20%, rgba(168, 85, 247, 0.1) 0%, transparent 50%);
-    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-    min-height: 100vh;
-    color: #f8fafc;
-}
-
-/* Hide Streamlit Branding */
-#MainMenu { visibility: hidden; }
-footer { visibility: hidden; }
-header { visibility: hidden; }
-.stDeployButton { visibility: hidden; }
-
-/* Professional Main Container */
-.main .block-container {
-    padding: 2rem 3rem;
-    max-width: none;
-    background: rgba(255, 255, 255, 0.02);
-    backdrop-filter: blur(20px);
-    border-radius: 24px;
-    border: 1px solid rgba(255, 255, 255, 0.08);
-    box-shadow: 
-        0 20px 40px rgba(0, 0, 0, 0.3),
-        inset 0 1px 0 rgba(255, 255, 255, 0.1);
-    margin: 1rem;
-}
-
-/* ENHANCED SIDEBAR STYLING - SIMPLE TOGGLE */
-.css-1d391kg, 
-.css-1lcbmhc, 
-.css-1outpf7, 
-.css-k1vhr4,
-.css-17eq0hr,
-[data-testid="stSidebar"],
-section[data-testid="stSidebar"],
-.css-1cypcdb,
-.css-1d391kg,
-.css-1lcbmhc {
-    display: block !important;
-    visibility: visible !important;
-    opacity: 1 !important;
-    width: 320px !important;
-    min-width: 320px !important;
-    max-width: 320px !important;
-    position: relative !important;
-    left: 0 !important;
-    transform: translateX(0) !important;
-    background: 
-        linear-gradient(180deg, rgba(15, 23, 42, 0.98) 0%, rgba(30, 41, 59, 0.96) 100%) !important;
-    backdrop-filter: blur(20px) !important;
-    border-right: 1px solid rgba(255, 255, 255, 0.12) !important;
-    box-shadow: 
-        4px 0 20px rgba(0, 0, 0, 0.3),
-        inset -1px 0 0 rgba(255, 255, 255, 0.05) !important;
-    z-index: 999 !important;
-    transition: transform 0.3s ease-in-out !important;
-}
-
-/* Collapsed sidebar state */
-.sidebar-collapsed .css-1d391kg,
-.sidebar-collapsed .css-1lcbmhc,
-.sidebar-collapsed .css-1outpf7,
-.sidebar-collapsed .css-k1vhr4,
-.sidebar-collapsed .css-17eq0hr,
-.sidebar-collapsed [data-testid="stSidebar"],
-.sidebar-collapsed section[data-testid="stSidebar"] {
-    transform: translateX(-300px) !important;
-}
-
-/* Sidebar Toggle Button */
-.sidebar-toggle {
-    position: fixed !important;
-    top: 20px !important;
-    left: 330px !important;
-    z-index: 1001 !important;
-    background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%) !important;
-    border: none !important;
-    border-radius: 8px !important;
-    width: 40px !important;
-    height: 40px !important;
-    display: flex !important;
-    align-items: center !important;
-    justify-content: center !important;
-    cursor: pointer !important;
-    box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3) !important;
-    transition: all 0.3s ease-in-out !important;
-    color: white !important;
-    font-size: 16px !important;
-    font-weight: bold !important;
-}
-
-.sidebar-toggle:hover {
-    background: linear-gradient(135deg, #2563eb 0%, #1e40af 100%) !important;
-    transform: translateY(-2px) !important;
-    box-shadow: 0 8px 20px rgba(59, 130, 246, 0.4) !important;
-}
-
-/* Collapsed state toggle button position */
-.sidebar-collapsed .sidebar-toggle {
-    left: 20px !important;
-}
-
-/* Force sidebar container to be visible */
-.css-1d391kg > div,
-.css-1lcbmhc > div,
-[data-testid="stSidebar"] > div,
-section[data-testid="stSidebar"] > div {
-    display: block !important;
-    visibility: visible !important;
-    opacity: 1 !important;
-    padding: 1.5rem !important;
-}
-
-/* Ensure sidebar toggle button doesn't hide sidebar */
-.css-1rs6os,
-.css-vk3wp9,
-[data-testid="collapsedControl"] {
-    display: none !important;
-}
-
-/* Professional Sidebar Text */
-[data-testid="stSidebar"] *,
-section[data-testid="stSidebar"] * {
-    color: #f1f5f9 !important;
-    font-family: 'Inter', sans-serif !important;
-}
-
-/* Sidebar Headers */
-[data-testid="stSidebar"] h1,
-[data-testid="stSidebar"] h2,
-[data-testid="stSidebar"] h3 {
-    color: #ffffff !important;
-    font-weight: 600 !important;
-    margin-bottom: 1rem !important;
-    padding-bottom: 0.5rem !important;
-    border-bottom: 1px solid rgba(255, 255, 255, 0.1) !important;
-}
-
-/* Professional Cards in Sidebar */
-[data-testid="stSidebar"] .element-container {
-    background: rgba(255, 255, 255, 0.05) !important;
-    border-radius: 12px !important;
-    padding: 1rem !important;
-    margin: 0.5rem 0 !important;
-    border: 1px solid rgba(255, 255, 255, 0.08) !important;
-    backdrop-filter: blur(10px) !important;
-}
-
-/* Sidebar Buttons */
-[data-testid="stSidebar"] .stButton > button {
-    background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%) !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 10px !important;
-    padding: 0.75rem 1.5rem !important;
-    font-weight: 500 !important;
-    font-size: 0.9rem !important;
-    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-    box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3) !important;
-    width: 100% !important;
-}
-
-[data-testid="stSidebar"] .stButton > button:hover {
-    background: linear-gradient(135deg, #2563eb 0%, #1e40af 100%) !important;
-    transform: translateY(-2px) !important;
-    box-shadow: 0 8px 20px rgba(59, 130, 246, 0.4) !important;
-}
-
-/* Professional Progress Bar */
-[data-testid="stSidebar"] .stProgress > div > div > div {
-    background: linear-gradient(90deg, #3b82f6 0%, #8b5cf6 50%, #06b6d4 100%) !important;
-    border-radius: 6px !important;
-    height: 8px !important;
-}
-
-[data-testid="stSidebar"] .stProgress > div > div {
-    background: rgba(255, 255, 255, 0.1) !important;
-    border-radius: 6px !important;
-    height: 8px !important;
-}
-
-/* Professional Status Indicators */
-.status-indicator {
-    display: inline-flex;
-    align-items: center;
-    padding: 0.5rem 1rem;
-    border-radius: 20px;
-    font-size: 0.85rem;
-    font-weight: 500;
-    margin: 0.25rem 0;
-}
-
-.status-complete {
-    background: linear-gradient(135deg, #10b981, #059669);
-    color: white;
-    box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);
-}
-
-.status-progress {
-    background: linear-gradient(135deg, #f59e0b, #d97706);
-    color: white;
-    box-shadow: 0 4px 12px rgba(245, 158, 11, 0.3);
-}
-
-.status-ready {
-    background: linear-gradient(135deg, #3b82f6, #2563eb);
-    color: white;
-    box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);
-}
-
-/* Professional Chat Messages */
-.stChatMessage {
-    padding: 1.5rem !important;
-    border-radius: 16px !important;
-    margin-bottom: 1.5rem !important;
-    backdrop-filter: blur(10px) !important;
-    border: 1px solid rgba(255, 255, 255, 0.1) !important;
-    box-shadow: 0 8px 24px rgba(0, 0, 0, 0.2) !important;
-}
-
-.stChatMessage[data-testid="user-message"] {
-    background: linear-gradient(135deg, rgba(59, 130, 246, 0.15), rgba(37, 99, 235, 0.1)) !important;
-    border-left: 4px solid #3b82f6 !important;
-    margin-left: 2rem !important;
-}
-
-.stChatMessage[data-testid="assistant-message"] {
-    background: linear-gradient(135deg, rgba(168, 85, 247, 0.15), rgba(147, 51, 234, 0.1)) !important;
-    border-left: 4px solid #a855f7 !important;
-    margin-right: 2rem !important;
-}
-
-/* Professional Chat Input */
-.stChatInput > div {
-    background: rgba(255, 255, 255, 0.08) !important;
-    backdrop-filter: blur(15px) !important;
-    border-radius: 16px !important;
-    border: 2px solid rgba(255, 255, 255, 0.12) !important;
-    box-shadow: 0 8px 24px rgba(0, 0, 0, 0.2) !important;
-}
-
-.stChatInput input {
-    color: #ffffff !important;
-    font-family: 'Inter', sans-serif !important;
-    font-size: 1rem !important;
-}
-
-.stChatInput input::placeholder {
-    color: rgba(255, 255, 255, 0.5) !important;
-}
-
-/* Professional Buttons */
-.stButton > button {
-    background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%) !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 12px !important;
-    padding: 0.75rem 2rem !important;
-    font-weight: 500 !important;
-    font-family: 'Inter', sans-serif !important;
-    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-    box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3) !important;
-}
-
-.stButton > button:hover {
-    background: linear-gradient(135deg, #2563eb 0%, #1e40af 100%) !important;
-    transform: translateY(-2px) !important;
-    box-shadow: 0 8px 20px rgba(59, 130, 246, 0.4) !important;
-}
-
-/* Professional Typography */
-h1, h2, h3, h4, h5, h6 {
-    font-family: 'Inter', sans-serif !important;
-    font-weight: 600 !important;
-    color: #ffffff !important;
-}
-
-/* Code and Technical Text */
-code, pre {
-    font-family: 'JetBrains Mono', monospace !important;
-    background: rgba(255, 255, 255, 0.1) !important;
-    border-radius: 6px !important;
-    padding: 0.25rem 0.5rem !important;
-}
-
-/* Professional Animations */
-@keyframes slideInRight {
-    from { opacity: 0; transform: translateX(30px); }
-    to { opacity: 1; transform: translateX(0); }
-}
-
-@keyframes fadeInUp {
-    from { opacity: 0; transform: translateY(20px); }
-    to { opacity: 1; transform: translateY(0); }
-}
-
-.slide-in-right {
-    animation: slideInRight 0.6s ease-out;
-}
-
-.fade-in-up {
-    animation: fadeInUp 0.8s ease-out;
-}
-
-/* Professional Scrollbar */
-::-webkit-scrollbar {
-    width: 8px;
-}
-
-::-webkit-scrollbar-track {
-    background: rgba(255, 255, 255, 0.05);
-    border-radius: 4px;
-}
-
-::-webkit-scrollbar-thumb {
-    background: linear-gradient(135deg, #3b82f6, #8b5cf6);
-    border-radius: 4px;
-}
-
-::-webkit-scrollbar-thumb:hover {
-    background: linear-gradient(135deg, #2563eb, #7c3aed);
-}
-
-/* Responsive Design */
-@media (max-width: 768px) {
-    [data-testid="stSidebar"] {
-        width: 300px !important;
-        min-width: 300px !important;
-    }
-    
-    .main .block-container {
-        padding: 1rem 1.5rem;
-        margin: 0.5rem;
-    }
-    
-    .stChatMessage[data-testid="user-message"] {
-        margin-left: 1rem !important;
-    }
-    
-    .stChatMessage[data-testid="assistant-message"] {
-        margin-right: 1rem !important;
-    }
-}
-
-/* Professional Loading States */
-.loading-shimmer {
-    background: linear-gradient(90deg, rgba(255,255,255,0.1) 25%, rgba(255,255,255,0.2) 50%, rgba(255,255,255,0.1) 75%);
-    background-size: 200% 100%;
-    animation: shimmer 2s infinite;
-}
-
-@keyframes shimmer {
-    0% { background-position: -200% 0; }
-    100% { background-position: 200% 0; }
-}
-
-/* Force sidebar visibility on load */
-body {
-    --sidebar-width: 320px;
-}
-
-/* Additional sidebar force rules */
-.stApp > div:first-child {
-    display: flex !important;
-}
-
-.stApp > div:first-child > div:first-child {
-    display: block !important;
-    width: 320px !important;
-    min-width: 320px !important;
-}
-</style>
-
-<script>
-// Enhanced sidebar visibility and toggle script
-function ensureSidebarVisible() {
-    const sidebar = document.querySelector('[data-testid="stSidebar"]');
-    const sidebarSection = document.querySelector('section[data-testid="stSidebar"]');
-    const collapsedControl = document.querySelector('[data-testid="collapsedControl"]');
-    
-    // Hide collapse control
-    if (collapsedControl) {
-        collapsedControl.style.display = 'none';
-    }
-    
-    // Force sidebar visibility
-    [sidebar, sidebarSection].forEach(element => {
-        if (element) {
-            element.style.display = 'block';
-            element.style.visibility = 'visible';
-            element.style.opacity = '1';
-            element.style.width = '320px';
-            element.style.minWidth = '320px';
-        }
-    });
-    
-    // Add sidebar toggle functionality
-    addSidebarToggle();
-}
-
-function addSidebarToggle() {
-    // Remove existing toggle if present
-    const existingToggle = document.querySelector('.sidebar-toggle');
-    if (existingToggle) {
-        existingToggle.remove();
-    }
-    
-    // Create toggle button
-    const toggleButton = document.createElement('button');
-    toggleButton.className = 'sidebar-toggle';
-    toggleButton.innerHTML = '<<';
-    toggleButton.title = 'Toggle Sidebar';
-    
-    // Add click handler
-    toggleButton.addEventListener('click', function() {
-        const body = document.body;
-        const isCollapsed = body.classList.contains('sidebar-collapsed');
-        
-        if (isCollapsed) {
-            body.classList.remove('sidebar-collapsed');
-            toggleButton.innerHTML = '<<';
-            // Store state
-            sessionStorage.setItem('sidebarCollapsed', 'false');
-        } else {
-            body.classList.add('sidebar-collapsed');
-            toggleButton.innerHTML = '>>';
-            // Store state
-            sessionStorage.setItem('sidebarCollapsed', 'true');
-        }
-    });
-    
-    // Add to page
-    document.body.appendChild(toggleButton);
-    
-    // Restore previous state
-    const savedState = sessionStorage.getItem('sidebarCollapsed');
-    if (savedState === 'true') {
-        document.body.classList.add('sidebar-collapsed');
-        toggleButton.innerHTML = '>>';
-    }
-}
+    href, css = build_theme_asset()
+    loaders = [theme_loader_html(href=href) if static else theme_loader_html(css=css)]
 
-// Run on page load
-document.addEventListener('DOMContentLoaded', ensureSidebarVisible);
+    scripts = ["sidebar_toggle_legacy.js" if SIDEBAR_SCRIPT == "legacy" else "sidebar_toggle.js"]
+    if OBSERVER_PROBE:
+        # Counts MutationObserver callbacks/s for before/after comparisons
+        scripts.insert(0, "observer_probe.js")
+    for filename in scripts:
+        src, code = static_script(filename)
+        element_id = f"talentscout-{filename.split('.')[0].replace('_', '-')}"
+        loaders.append(script_loader_html(element_id, src=src) if static else script_loader_html(element_id, code=code))
 
-// Run after Streamlit updates
-setTimeout(ensureSidebarVisible, 100);
-setTimeout(ensureSidebarVisible, 500);
-setTimeout(ensureSidebarVisible, 1000);
+    components.html("".join(loaders), height=0)
+    st.session_state.assets_injected = True
 
-// Watch for changes and re-apply
-const observer = new MutationObserver(ensureSidebarVisible);
-observer.observe(document.body, { childList: true, subtree: true });
-</script>
-""", unsafe_allow_html=True)
+inject_assets()
 
 EXIT_KEYWORDS = ["exit", "quit", "bye", "stop", "end"]
-GREETING_KEYWORDS = ["hello", "hi", "hey", "good morning", "good afternoon", "good evening", "namaste", "greetings", "hola", "bonjour", "guten tag", "ciao", "konnichiwa", "salaam", "shalom"]
 
 # ---------------- SESSION STATE ----------------
+# The conversation is stored server-side under a token kept in the URL, so
+# a reload, a restart or another replica can pick it up again. Only tokens
+# the store already knows are taken from the URL; anything else (a typo, a
+# guessed or chosen value) starts a fresh session under a server-made token.
+if "session_token" not in st.session_state:
+    token = st.query_params.get("session")
+    stored = session_store.load(token) if token else None
+    if stored is None:
+        token = new_token()
+    st.session_state.session_token = token
+    st.query_params["session"] = token
+    if stored:
+        st.session_state.update(stored)
+
+# Only the last TRANSCRIPT_KEEP messages stay in memory; older ones spill to the session backend
 if "chat" not in st.session_state:
-    st.session_state.chat = []
+    st.session_state.chat = session_store.new_transcript(st.session_state.session_token)
+elif not isinstance(st.session_state.chat, BoundedTranscript):
+    # Stored before transcripts were bounded
+    st.session_state.chat = session_store.new_transcript(st.session_state.session_token, st.session_state.chat)
 if "step" not in st.session_state:
     st.session_state.step = 0
 if "data" not in st.session_state:
@@ -528,29 +143,27 @@ if "question_answers" not in st.session_state:
     st.session_state.question_answers = []
 if "sidebar_collapsed" not in st.session_state:
     st.session_state.sidebar_collapsed = False
+if "history_view" not in st.session_state:
+    st.session_state.history_view = ChatHistoryView()
+if "reply_language" not in st.session_state:
+    st.session_state.reply_language = "en"
+if "language" not in st.session_state:
+    st.session_state.language = SessionLanguage()
+    # Resume in the language stored with the session
+    st.session_state.language.language = st.session_state.reply_language
 
 # ---------------- SIMPLE SENTIMENT ANALYSIS ----------------
 def analyze_sentiment(text):
     """Simple keyword-based sentiment analysis"""
-    text_lower = text.lower()
-    
-    positive_words = ['happy', 'excited', 'great', 'excellent', 'amazing', 'wonderful', 'good', 'love', 'like', 'awesome', 'fantastic']
-    negative_words = ['sad', 'angry', 'frustrated', 'disappointed', 'terrible', 'awful', 'bad', 'hate', 'dislike', 'worried', 'stressed']
-    nervous_words = ['nervous', 'anxious', 'worried', 'scared', 'afraid', 'tension', 'stress', 'panic', 'overwhelmed', 'intimidated', 'jittery', 'uneasy', 'apprehensive', 'restless', 'fidgety']
-    excited_words = ['excited', 'thrilled', 'pumped', 'enthusiastic', 'energetic', 'eager', 'stoked', 'hyped', 'elated', 'ecstatic', 'overjoyed', 'exhilarated']
-    
-    positive_count = sum(1 for word in positive_words if word in text_lower)
-    negative_count = sum(1 for word in negative_words if word in text_lower)
-    nervous_count = sum(1 for word in nervous_words if word in text_lower)
-    excited_count = sum(1 for word in excited_words if word in text_lower)
+    found = LEXICON.scan(text)
     
-    if nervous_count > 0:
+    if found.has("nervous"):
         return "nervous"
-    elif excited_count > 0:
+    elif found.has("excited"):
         return "excited"
-    elif positive_count > negative_count:
+    elif found.count("positive") > found.count("negative"):
         return "positive"
-    elif negative_count > positive_count:
+    elif found.count("negative") > found.count("positive"):
         return "negative"
     else:
         return "neutral"
@@ -558,253 +171,419 @@ def analyze_sentiment(text):
 # ---------------- GREETING DETECTION ----------------
 def detect_greeting(text):
     """Detect if user input contains greeting words"""
-    text_lower = text.lower().strip()
+    text = text.strip()
+    first = LEXICON.scan(text).first_position("greeting")
+    if first is None:
+        return False
     
-    # Check for exact greetings or greetings at start of message
-    for greeting in GREETING_KEYWORDS:
-        if text_lower == greeting or text_lower.startswith(greeting + " ") or text_lower.startswith(greeting + ","):
-            return True
-    
-    # Also check if greeting is anywhere in short messages (3 words or less)
-    if len(text_lower.split()) <= 3:
-        for greeting in GREETING_KEYWORDS:
-            if greeting in text_lower:
-                return True
-    
-    return False
+    # Greeting at the start of the message, or anywhere in short messages (3 words or less)
+    return first == 0 or len(text.split()) <= 3
 
 def get_excited_response():
     """Return a random energetic response for excited users"""
     excited_messages = [
-        "🎉 WOW! I love your energy! That excitement is contagious - let's channel it into this conversation! ⚡",
-        "🚀 AMAZING! Your enthusiasm is fantastic! This is going to be such a great conversation! 🌟",
-        "🔥 YES! I can feel your excitement through the screen! Let's keep this energy going! 💫",
-        "⭐ INCREDIBLE! Your excitement is absolutely wonderful! This positive energy is exactly what we love to see! 🎊",
-        "🎯 FANTASTIC! Your enthusiasm is inspiring! I'm excited to learn more about you too! 🌈",
-        "💥 BOOM! That excitement is PERFECT! You're bringing such great energy to this conversation! ✨",
-        "🎪 WOOHOO! I'm getting excited just from your message! This is going to be an awesome chat! 🎭",
-        "🌟 SPECTACULAR! Your excitement is lighting up the conversation! Let's ride this wave of positive energy! 🏄‍♂️"
+        N_("🎉 WOW! I love your energy! That excitement is contagious - let's channel it into this conversation! ⚡"),
+        N_("🚀 AMAZING! Your enthusiasm is fantastic! This is going to be such a great conversation! 🌟"),
+        N_("🔥 YES! I can feel your excitement through the screen! Let's keep this energy going! 💫"),
+        N_("⭐ INCREDIBLE! Your excitement is absolutely wonderful! This positive energy is exactly what we love to see! 🎊"),
+        N_("🎯 FANTASTIC! Your enthusiasm is inspiring! I'm excited to learn more about you too! 🌈"),
+        N_("💥 BOOM! That excitement is PERFECT! You're bringing such great energy to this conversation! ✨"),
+        N_("🎪 WOOHOO! I'm getting excited just from your message! This is going to be an awesome chat! 🎭"),
+        N_("🌟 SPECTACULAR! Your excitement is lighting up the conversation! Let's ride this wave of positive energy! 🏄‍♂️")
     ]
-    return random.choice(excited_messages)
+    return tr(random.choice(excited_messages))
 
 def get_comforting_response():
     """Return a random comforting response for nervous users"""
     comforting_messages = [
-        "💙 Don't worry, it's completely normal to feel nervous! Take a deep breath - you've got this! 🌟",
-        "🤗 I understand you're feeling nervous. Remember, this is just a conversation - be yourself and you'll do great! ✨",
-        "💪 Feeling nervous shows you care! That's actually a good sign. Let's take this step by step together. 😊",
-        "🌸 It's okay to feel nervous - everyone does! Just remember, we're here to get to know you better. Relax and be yourself! 💫",
-        "🧘‍♀️ Take a moment to breathe. You're doing great so far! There's no pressure - just be authentic. 🌈",
-        "💝 Nervousness is totally understandable! Think of this as a friendly chat rather than an interview. You're in good hands! 🤝",
-        "🌟 I can sense you're nervous, and that's perfectly fine! Remember, we want you to succeed. Let's go at your pace. 💙",
-        "🤲 Feeling anxious is natural! Just focus on sharing your genuine experiences. There are no wrong answers here! ☀️"
+        N_("💙 Don't worry, it's completely normal to feel nervous! Take a deep breath - you've got this! 🌟"),
+        N_("🤗 I understand you're feeling nervous. Remember, this is just a conversation - be yourself and you'll do great! ✨"),
+        N_("💪 Feeling nervous shows you care! That's actually a good sign. Let's take this step by step together. 😊"),
+        N_("🌸 It's okay to feel nervous - everyone does! Just remember, we're here to get to know you better. Relax and be yourself! 💫"),
+        N_("🧘‍♀️ Take a moment to breathe. You're doing great so far! There's no pressure - just be authentic. 🌈"),
+        N_("💝 Nervousness is totally understandable! Think of this as a friendly chat rather than an interview. You're in good hands! 🤝"),
+        N_("🌟 I can sense you're nervous, and that's perfectly fine! Remember, we want you to succeed. Let's go at your pace. 💙"),
+        N_("🤲 Feeling anxious is natural! Just focus on sharing your genuine experiences. There are no wrong answers here! ☀️")
     ]
-    return random.choice(comforting_messages)
+    return tr(random.choice(comforting_messages))
 
 def get_greeting_response():
     """Return a random greeting response"""
     greetings = [
-        "Hello! Nice to meet you! 👋",
-        "Hi there! Great to see you! 😊", 
-        "Hello! Welcome to TalentScout! 🤖",
-        "Hi! Nice to meet you! 😊",
-        "Hello! How are you doing today? 😊",
-        "Hi there! Welcome! 🌟",
-        "Hello! Glad you're here! 👋",
-        "Hi! Hope you're having a great day! ☀️",
-        "Namaste! Welcome to TalentScout! 🙏",
-        "Greetings! Nice to meet you! ✨",
-        "Hello there! Ready to get started? 🚀",
-        "Hi! Wonderful to have you here! 💫"
-    ]
-    return random.choice(greetings)
-
-# ---------------- TECH QUESTIONS ----------------
-TECH_QUESTIONS = {
-    "python": [
-        "Explain Python decorators.",
-        "What is the difference between list and tuple?",
-        "How does garbage collection work in Python?",
-        "What are Python generators and when would you use them?"
-    ],
-    "javascript": [
-        "Explain closures in JavaScript.",
-        "What is the difference between let, var, and const?",
-        "How does async/await work?",
-        "What is event bubbling?"
-    ],
-    "react": [
-        "What are React hooks?",
-        "Explain virtual DOM.",
-        "Difference between state and props?",
-        "What is JSX and how does it work?"
-    ],
-    "java": [
-        "What is the difference between abstract class and interface?",
-        "Explain Java memory management.",
-        "What are Java streams?",
-        "Difference between ArrayList and LinkedList?"
+        N_("Hello! Nice to meet you! 👋"),
+        N_("Hi there! Great to see you! 😊"),
+        N_("Hello! Welcome to TalentScout! 🤖"),
+        N_("Hi! Nice to meet you! 😊"),
+        N_("Hello! How are you doing today? 😊"),
+        N_("Hi there! Welcome! 🌟"),
+        N_("Hello! Glad you're here! 👋"),
+        N_("Hi! Hope you're having a great day! ☀️"),
+        N_("Namaste! Welcome to TalentScout! 🙏"),
+        N_("Greetings! Nice to meet you! ✨"),
+        N_("Hello there! Ready to get started? 🚀"),
+        N_("Hi! Wonderful to have you here! 💫")
     ]
-}
-
-def generate_questions(stack):
-    questions = []
-    for tech in stack:
-        tech = tech.lower().strip()
-        if tech in TECH_QUESTIONS:
-            available_questions = TECH_QUESTIONS[tech]
-            num_to_select = min(2, len(available_questions))
-            questions.extend(random.sample(available_questions, num_to_select))
-    
-    # Add general questions if not enough tech-specific ones
-    if len(questions) < 4:
-        general_questions = [
-            "Describe your problem-solving approach.",
-            "How do you handle debugging complex issues?",
-            "What's your experience with version control?",
-            "How do you stay updated with new technologies?"
-        ]
-        questions.extend(general_questions[:4-len(questions)])
-    
-    return questions[:4]
+    return tr(random.choice(greetings))
+
+# ---------------- LANGUAGE ----------------
+# Field each step's answer fills; names, contact details and stacks carry no language evidence
+STEP_FIELDS = ["name", "email", "phone", "experience", "position", "location", "tech_stack"]
+
+def tr(message):
+    """A bot prompt in the candidate's language, from the compiled catalog (no LLM call)"""
+    return translate(message, st.session_state.reply_language)
 
 # ---------------- AI RESPONSE GENERATION ----------------
+PRIMARY_MODEL = 'gemini-2.0-flash-exp'
+FALLBACK_MODEL = 'gemini-1.5-flash'
+
+def build_prompt(user_message, context=""):
+    """Create prompt based on context"""
+    if context == "greeting":
+        return f"You are a friendly HR assistant. The user said: '{user_message}'. Respond warmly and professionally in a conversational way. Keep it brief and welcoming."
+    elif context == "technical_answer":
+        return f"You are evaluating a technical answer from a job candidate. They answered: '{user_message}'. Provide brief, encouraging feedback (1-2 sentences) and ask them to continue or elaborate if needed."
+    elif context == "general":
+        return f"You are a helpful HR assistant. The user said: '{user_message}'. Respond professionally and helpfully. Keep it conversational and brief."
+    else:
+        return f"You are a professional HR assistant. Respond to: '{user_message}' in a helpful and friendly way."
+
+def call_model(model, prompt, reserve=0):
+    """One guarded Gemini call; raises RateLimited without touching the network"""
+    # Skip the network entirely while over quota or the breaker is open
+    if not gemini_guard.acquire(prompt, reserve):
+        raise RateLimited(model)
+    try:
+        # Generate response using new API
+        with pool_stats.track():
+            response = gemini().models.generate_content(
+                model=model,
+                contents=prompt
+            )
+        text = response.text.strip()
+    except Exception as e:
+        print(f"AI Error: {e}")
+        gemini_guard.record_failure(e)
+        raise
+    except BaseException:
+        # Interrupted without an outcome; don't hold a half-open probe forever
+        gemini_guard.release()
+        raise
+    gemini_guard.record_success()
+    return text
+
+def fetch_ai_text(prompt):
+    """Call Gemini for a built prompt; returns None when every model fails"""
+    if HEDGE_REQUESTS:
+        # Race the fallback model against a slow primary
+        try:
+            return hedger.call(lambda: call_model(PRIMARY_MODEL, prompt),
+                               lambda: call_model(FALLBACK_MODEL, prompt))
+        except Exception:
+            return None
+
+    # Try the primary model, then fallback models
+    for model in (PRIMARY_MODEL, FALLBACK_MODEL):
+        try:
+            return call_model(model, prompt)
+        except RateLimited:
+            return None
+        except Exception:
+            continue
+    return None
+
 def generate_ai_response(user_message, context=""):
     """Generate AI response using Google Gemini"""
     if not AI_AVAILABLE:
         return None
     
+    # Serve repeats like "hi" / "thanks" from the process-wide cache
+    cached = response_cache.get(context, user_message, PRIMARY_MODEL)
+    if cached is not None:
+        return cached
+    
+    prompt = build_prompt(user_message, context)
+    
+    # Identical prompts already in flight share a single Gemini call
     try:
-        # Create prompt based on context
-        if context == "greeting":
-            prompt = f"You are a friendly HR assistant. The user said: '{user_message}'. Respond warmly and professionally in a conversational way. Keep it brief and welcoming."
-        elif context == "technical_answer":
-            prompt = f"You are evaluating a technical answer from a job candidate. They answered: '{user_message}'. Provide brief, encouraging feedback (1-2 sentences) and ask them to continue or elaborate if needed."
-        elif context == "general":
-            prompt = f"You are a helpful HR assistant. The user said: '{user_message}'. Respond professionally and helpfully. Keep it conversational and brief."
-        else:
-            prompt = f"You are a professional HR assistant. Respond to: '{user_message}' in a helpful and friendly way."
-        
-        # Generate response using new API
-        response = client.models.generate_content(
-            model='gemini-2.0-flash-exp',
-            contents=prompt
-        )
-        return response.text.strip()
-        
-    except Exception as e:
-        print(f"AI Error: {e}")
-        # Try fallback models
+        text = llm_flights.do(prompt, lambda: fetch_ai_text(prompt))
+    except Exception:
+        # Joined a streaming call that failed partway; nothing complete to return or cache
+        return None
+    if not text:
+        return None
+    text = text.strip()
+    
+    response_cache.set(context, user_message, PRIMARY_MODEL, text)
+    return text
+
+def stream_ai_response(user_message, context=""):
+    """
+    Yield the Gemini response in chunks as they arrive.
+
+    Identical prompts in flight share one stream through llm_flights (a
+    concurrent non-streaming caller joins it too). Streams are not hedged:
+    the first chunk already reaches the candidate.
+    """
+    if not AI_AVAILABLE:
+        return
+
+    cached = response_cache.get(context, user_message, PRIMARY_MODEL)
+    if cached is not None:
+        yield cached
+        return
+
+    prompt = build_prompt(user_message, context)
+    chunks = []
+    try:
+        for chunk in llm_flights.stream(prompt, lambda: stream_model_chunks(prompt)):
+            chunks.append(chunk)
+            yield chunk
+    except Exception:
+        # Failed partway, here or in the stream we joined (singleflight.Abandoned):
+        # the candidate keeps what was shown, but it isn't cached
+        return
+
+    text = "".join(chunks).strip()
+    if text:
+        response_cache.set(context, user_message, PRIMARY_MODEL, text)
+
+def stream_model_chunks(prompt):
+    """
+    Stream one prompt from the primary model, falling back while nothing
+    has been sent. A failure after the first chunk is re-raised, so callers
+    can tell a cut-off answer from a complete one.
+    """
+    chunks = []
+    for model in (PRIMARY_MODEL, FALLBACK_MODEL):
+        if not gemini_guard.acquire(prompt):
+            break
         try:
-            response = client.models.generate_content(
-                model='gemini-1.5-flash',
-                contents=prompt
-            )
-            return response.text.strip()
-        except:
-            return None
+            with pool_stats.track():
+                for chunk in gemini().models.generate_content_stream(model=model, contents=prompt):
+                    if chunk.text:
+                        chunks.append(chunk.text)
+                        yield chunk.text
+            gemini_guard.record_success()
+            break
+        except Exception as e:
+            print(f"AI Error: {e}")
+            gemini_guard.record_failure(e)
+            # The candidate has already seen part of this answer; don't mix in another model's
+            if chunks:
+                raise
+        except BaseException:
+            # Stream abandoned (GeneratorExit) or interrupted; release a half-open probe
+            gemini_guard.release()
+            raise
+
+# Placeholder in a reply that is filled with the AI response for the turn
+AI_SLOT = "\x00ai\x00"
+
+def stream_reply(reply, user_message, context, fallback="", joiner=""):
+    """Yield the reply around AI_SLOT, streaming the AI part as it arrives"""
+    prefix, suffix = reply.split(AI_SLOT, 1)
+    if prefix:
+        yield prefix
+
+    streamed = False
+    for chunk in stream_ai_response(user_message, context):
+        streamed = True
+        yield chunk
+
+    if streamed:
+        if joiner:
+            yield joiner
+    elif fallback:
+        yield fallback
+
+    if suffix:
+        yield suffix
+
+def resolve_ai_slot(reply, ai_text, fallback="", joiner=""):
+    return reply.replace(AI_SLOT, ai_text + joiner if ai_text else fallback)
+
+def pick_pooled(kind, text=None):
+    """A pre-generated response; the pool is English, so other languages use the translated catalog"""
+    if st.session_state.reply_language != "en":
+        return None
+    return greeting_pool.pick(kind, text)
+
+def fill_ai_slot(reply, user_message, context, fallback="", joiner=""):
+    """
+    Replace AI_SLOT with the AI response (or fallback) and return the final reply.
+
+    In streaming and async modes None is returned and the reply is appended
+    later by stream_pending_reply() / pending_reply_bubble().
+    """
+    if context == "greeting":
+        # Pre-generated AI greetings need no per-request LLM call
+        pooled = pick_pooled("greeting", user_message)
+        if pooled:
+            return resolve_ai_slot(reply, pooled, fallback, joiner)
+
+    if ASYNC_RESPONSES and AI_AVAILABLE:
+        job = llm_workers.submit(generate_ai_response, user_message, context)
+        if job is None:
+            # Worker pool saturated - answer with the canned response
+            return resolve_ai_slot(reply, None, fallback, joiner)
+        st.session_state.pending_reply = {"job": job, "reply": reply, "fallback": fallback, "joiner": joiner}
+        return None
 
-# ---------------- MAIN UI ----------------
-# Title Section
-st.markdown("""
-<div style="text-align: center; margin-bottom: 3rem;">
-    <h1 style="background: linear-gradient(135deg, #f8fafc, #cbd5e0); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-size: 3rem; font-weight: 800;">🤖 TalentScout Hiring Assistant</h1>
-    <p style="color: #e2e8f0; font-size: 1.2rem;">AI-Powered Recruitment Screening</p>
-</div>
-""", unsafe_allow_html=True)
+    if STREAM_RESPONSES and AI_AVAILABLE:
+        # Streamed into the assistant bubble by stream_pending_reply() in this run
+        st.session_state.streaming_reply = {
+            "reply": reply, "user_message": user_message, "context": context, "fallback": fallback, "joiner": joiner
+        }
+        return None
 
-# Welcome Message
-if not st.session_state.chat:
-    st.markdown("""
-    <div style="background: rgba(168, 85, 247, 0.15); padding: 2rem; border-radius: 16px; margin-bottom: 2rem; border: 1px solid rgba(168, 85, 247, 0.3); text-align: center;">
-        <div style="font-size: 3rem; margin-bottom: 1rem;">🤖</div>
-        <div style="font-size: 1.3rem; font-weight: 600; color: #f1f5f9; margin-bottom: 1rem;">Hello! 👋 Welcome to TalentScout - Your AI-Powered Hiring Assistant.</div>
-        <div style="color: #cbd5e0; margin-bottom: 1.5rem; line-height: 1.6;">
-            I'm here to help you with our recruitment process. I'll collect some basic information about you and then ask relevant technical questions based on your skills.
-        </div>
-        <div style="color: #3b82f6; font-weight: 500; font-size: 1.1rem;">
-            Let's get started! Please enter your Full Name:
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    ai_text = generate_ai_response(user_message, context)
+    return resolve_ai_slot(reply, ai_text, fallback, joiner)
 
-# Chat History
-for role, message in st.session_state.chat:
-    with st.chat_message(role):
-        st.write(message)
+def stream_pending_reply():
+    """Stream the AI part of the current turn's reply, then store the final text"""
+    pending = st.session_state.pop("streaming_reply")
+    with st.chat_message("assistant"):
+        reply = st.write_stream(stream_reply(
+            pending["reply"], pending["user_message"], pending["context"], pending["fallback"], pending["joiner"]
+        ))
+    st.session_state.chat.append(("assistant", reply))
+
+@st.fragment(run_every=ASYNC_POLL_INTERVAL)
+def pending_reply_bubble():
+    """Poll the queued LLM job and append the reply when it is ready"""
+    pending = st.session_state.get("pending_reply")
+    if not pending:
+        return
+
+    status, ai_text = llm_workers.poll(pending["job"])
+    if status == "pending":
+        with st.chat_message("assistant"):
+            st.write("✍️ Typing...")
+        return
 
-# Chat Input
-user_input = st.chat_input("Type your response...")
+    reply = resolve_ai_slot(pending["reply"], ai_text, pending["fallback"], pending["joiner"])
+    st.session_state.chat.append(("assistant", reply))
+    del st.session_state.pending_reply
+    st.rerun()
+
+# ---------------- DEFERRED GRADING ----------------
+def grade_screening(question_answers, position="", experience=""):
+    """Grade all Q/A pairs with one guarded Gemini call"""
+    return grade_answers(question_answers, lambda prompt: call_model(PRIMARY_MODEL, prompt), position, experience)
+
+def store_grades(result):
+    if result:
+        st.session_state.data["technical_grades"] = result
+
+def start_grading():
+    """Queue grading of the finished screening on the worker pool"""
+    if not AI_AVAILABLE:
+        return
+    args = (list(st.session_state.question_answers),
+            st.session_state.data.get("position", ""),
+            st.session_state.data.get("experience", ""))
+    job = llm_workers.submit(grade_screening, *args)
+    if job is None:
+        store_grades(grade_screening(*args))
+    else:
+        st.session_state.grading_job = job
+
+@st.fragment(run_every=2)
+def grading_status():
+    """Poll the grading job and store the grades on the candidate record"""
+    job = st.session_state.get("grading_job")
+    if not job:
+        return
+
+    status, result = llm_workers.poll(job)
+    if status == "pending":
+        st.caption("📝 Grading technical answers...")
+        return
+
+    del st.session_state.grading_job
+    store_grades(result)
+    st.rerun()
 
 # ---------------- CHAT LOGIC ----------------
-if user_input:
+def handle_turn(user_input):
+    """Process one candidate message and append the reply to the chat"""
+    step = st.session_state.step
+    greeting_only = step == 0 and detect_greeting(user_input) and len(user_input.strip().split()) <= 3
+    field = STEP_FIELDS[step] if step < len(STEP_FIELDS) and not greeting_only else None
+    st.session_state.reply_language = st.session_state.language.detect(user_input, field)
+
     if any(word in user_input.lower() for word in EXIT_KEYWORDS):
-        st.session_state.chat.append(("assistant", "🙏 Thank you for your time! Our HR team will contact you soon."))
-        st.stop()
+        st.session_state.chat.append(("assistant", tr("🙏 Thank you for your time! Our HR team will contact you soon.")))
+        return
 
     # Check for greetings first
-    if detect_greeting(user_input):
+    # If it's just a greeting (not part of answering a question), respond with greeting
+    if greeting_only:
         # Try AI response first
-        ai_greeting = generate_ai_response(user_input, "greeting")
-        if ai_greeting:
-            greeting_response = ai_greeting
-        else:
-            greeting_response = get_greeting_response()
-        
-        # If it's just a greeting (not part of answering a question), respond with greeting
-        if st.session_state.step == 0 and len(user_input.strip().split()) <= 3:
-            st.session_state.chat.append(("user", user_input))
-            st.session_state.chat.append(("assistant", f"{greeting_response}\n\nI'm here to help you with our recruitment process. Let's get started!\n\nPlease enter your Full Name:"))
-            st.rerun()
+        reply = fill_ai_slot(
+            f"{AI_SLOT}\n\n" + tr("I'm here to help you with our recruitment process. Let's get started!\n\nPlease enter your Full Name:"),
+            user_input, "greeting", fallback=get_greeting_response()
+        )
+        st.session_state.chat.append(("user", user_input))
+        if reply is not None:
+            st.session_state.chat.append(("assistant", reply))
+        return
 
     # Simple sentiment analysis
     sentiment = analyze_sentiment(user_input)
     
     st.session_state.chat.append(("user", user_input))
 
+    # Set by branches whose reply contains AI_SLOT
+    ai_context = None
+    ai_fallback = ""
+    ai_joiner = ""
+
     # ---------------- SCREENING FLOW ----------------
     if st.session_state.step == 0:
         st.session_state.data["name"] = user_input
-        reply = f"Nice to meet you, {user_input}! 😊\n\nPlease provide your email address:"
+        reply = tr("Nice to meet you, {name}! 😊\n\nPlease provide your email address:").format(name=user_input)
         st.session_state.step += 1
 
     elif st.session_state.step == 1:
         st.session_state.data["email"] = user_input
-        reply = "Great! What's your phone number?"
+        reply = tr("Great! What's your phone number?")
         st.session_state.step += 1
 
     elif st.session_state.step == 2:
         st.session_state.data["phone"] = user_input
-        reply = "How many years of professional experience do you have?"
+        reply = tr("How many years of professional experience do you have?")
         st.session_state.step += 1
 
     elif st.session_state.step == 3:
         st.session_state.data["experience"] = user_input
-        reply = "What position are you applying for?"
+        reply = tr("What position are you applying for?")
         st.session_state.step += 1
 
     elif st.session_state.step == 4:
         st.session_state.data["position"] = user_input
-        reply = "What's your current location?"
+        reply = tr("What's your current location?")
         st.session_state.step += 1
 
     elif st.session_state.step == 5:
         st.session_state.data["location"] = user_input
-        reply = "Please list your technical skills/stack (comma separated):"
+        reply = tr("Please list your technical skills/stack (comma separated):")
         st.session_state.step += 1
 
     elif st.session_state.step == 6:
-        stack = [s.strip() for s in user_input.split(",")]
+        stack = split_stack(user_input)
         st.session_state.data["tech_stack"] = stack
         
         # Generate questions
-        st.session_state.tech_questions = generate_questions(stack)
+        st.session_state.tech_questions = generate_questions(stack, st.session_state.data.get("experience", ""))
         st.session_state.current_question_index = 0
         st.session_state.question_answers = []
         
         # Ask first question
         first_question = st.session_state.tech_questions[0]
-        reply = f"Perfect! Based on your skills, I'll now ask you some technical questions one by one.\n\n**Question 1 of 4:**\n{first_question}\n\nPlease share your answer:"
+        reply = (tr("Perfect! Based on your skills, I'll now ask you some technical questions one by one.") + "\n\n"
+                 + tr("**Question {number} of 4:**\n{question}\n\nPlease share your answer:").format(number=1, question=first_question))
         st.session_state.step += 1
 
     elif st.session_state.step == 7:
@@ -826,38 +605,39 @@ if user_input:
             next_q_index = st.session_state.current_question_index
             next_question = st.session_state.tech_questions[next_q_index]
             
-            # Try to get AI feedback on the answer
-            ai_feedback = generate_ai_response(user_input, "technical_answer")
-            if ai_feedback:
-                encouragement = ai_feedback
+            if DEFERRED_GRADING:
+                # Acknowledge instantly - all answers are graded together at the end
+                acknowledgement = pick_pooled("encouragement") or tr(local_acknowledgement())
             else:
+                # Try to get AI feedback on the answer
+                ai_context = "technical_answer"
                 # Fallback to random encouragements
-                encouragements = ["Great answer! 👍", "Excellent response! 🌟", "Well explained! 💯", "Nice insight! ✨"]
-                encouragement = random.choice(encouragements)
+                encouragements = [N_("Great answer! 👍"), N_("Excellent response! 🌟"), N_("Well explained! 💯"), N_("Nice insight! ✨")]
+                ai_fallback = pick_pooled("encouragement") or tr(random.choice(encouragements))
+                acknowledgement = AI_SLOT
             
-            reply = f"{encouragement}\n\n**Question {next_q_index + 1} of 4:**\n{next_question}\n\nPlease share your answer:"
+            reply = f"{acknowledgement}\n\n" + tr("**Question {number} of 4:**\n{question}\n\nPlease share your answer:").format(
+                number=next_q_index + 1, question=next_question
+            )
         else:
             # All questions completed
-            reply = f"Excellent work! 🎉\n\nYou've successfully completed all 4 technical questions. Thank you for taking the time to share your knowledge and experience with us.\n\nOur HR team will review your responses along with your profile and get back to you soon. Feel free to ask me any questions about the company or role while you wait!"
+            reply = tr("Excellent work! 🎉\n\nYou've successfully completed all 4 technical questions. Thank you for taking the time to share your knowledge and experience with us.\n\nOur HR team will review your responses along with your profile and get back to you soon. Feel free to ask me any questions about the company or role while you wait!")
             st.session_state.step += 1
+            if DEFERRED_GRADING:
+                start_grading()
 
     elif st.session_state.step >= 8:
         # Check if it's a greeting during completed state
         if detect_greeting(user_input) and len(user_input.strip().split()) <= 3:
             # Try AI response first
-            ai_greeting = generate_ai_response(user_input, "greeting")
-            if ai_greeting:
-                greeting_response = ai_greeting
-            else:
-                greeting_response = get_greeting_response()
-            reply = f"{greeting_response} ✅ Your screening is complete! Feel free to ask me any questions about the company or role while you wait for our response."
+            ai_context = "greeting"
+            ai_fallback = get_greeting_response()
+            reply = f"{AI_SLOT} " + tr("✅ Your screening is complete! Feel free to ask me any questions about the company or role while you wait for our response.")
         else:
             # Try AI response for general questions
-            ai_response = generate_ai_response(user_input, "general")
-            if ai_response:
-                reply = f"{ai_response}\n\n✅ Your screening is complete! Feel free to ask me any questions about the company or role while you wait for our response."
-            else:
-                reply = "✅ Your screening is complete! Feel free to ask me any questions about the company or role while you wait for our response."
+            ai_context = "general"
+            ai_joiner = "\n\n"
+            reply = AI_SLOT + tr("✅ Your screening is complete! Feel free to ask me any questions about the company or role while you wait for our response.")
     
     # Add sentiment-based modifications
     if sentiment == "nervous":
@@ -867,27 +647,72 @@ if user_input:
         excited_msg = get_excited_response()
         reply = f"{excited_msg}\n\n{reply}"
     elif sentiment == "negative":
-        reply = "😊 Don't worry. " + reply
+        reply = tr("😊 Don't worry.") + " " + reply
     elif sentiment == "positive":
-        reply = "🚀 Awesome! " + reply
+        reply = tr("🚀 Awesome!") + " " + reply
 
     # Personalize if we have user data
     if st.session_state.data.get("name"):
         reply = f"{st.session_state.data['name']}, {reply}"
 
-    st.session_state.chat.append(("assistant", reply))
-    st.rerun()
+    if ai_context:
+        reply = fill_ai_slot(reply, user_input, ai_context, ai_fallback, ai_joiner)
+
+    if reply is not None:
+        st.session_state.chat.append(("assistant", reply))
+
+def on_chat_submit():
+    """chat_input callback: the turn is processed before the script runs, so it costs one run"""
+    user_input = st.session_state.chat_input
+    if user_input:
+        handle_turn(user_input)
+
+
+# Keep the pre-generated greeting pool fresh without blocking this run
+if AI_AVAILABLE:
+    # Low priority: only spends requests beyond GREETING_POOL_RESERVE, so live turns keep their quota
+    greeting_pool.refresh_if_stale(lambda prompt: call_model(PRIMARY_MODEL, prompt, reserve=GREETING_POOL_RESERVE))
+
+def persist_session():
+    """Save the conversation once per change (new message, step, answer or grade)"""
+    signature = (len(st.session_state.chat), sidebar_signature())
+    if st.session_state.get("persisted_signature") != signature:
+        session_store.save(st.session_state.session_token, st.session_state)
+        st.session_state.persisted_signature = signature
+
+def service_stats():
+    """Process-wide counters of the shared API client, caches and stores"""
+    return {
+        "connection_pool": pool_stats.snapshot(),
+        "response_cache": response_cache.stats(),
+        "single_flight": llm_flights.stats(),
+        "hedging": hedger.stats(),
+        "rate_limiter": gemini_guard.stats(),
+        "workers": llm_workers.stats(),
+        "session_store": session_store.stats(),
+        "script_runs": script_run_stats.runs,
+    }
+
+# At most one "[stats]" line per STATS_LOG_INTERVAL across all sessions
+stats_log.maybe_log(service_stats)
 
 # ---------------- SIDEBAR ----------------
-with st.sidebar:
-    # Header
-    st.markdown("""
-    <div style="text-align: center; padding: 1rem; background: linear-gradient(135deg, #3b82f6, #a855f7); border-radius: 12px; margin-bottom: 1.5rem;">
-        <h2 style="color: white; margin: 0; font-size: 1.5rem;">🤖 TalentScout</h2>
-        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 0.9rem;">AI Hiring Assistant</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
+def sidebar_signature():
+    """Everything the sidebar shows; a change needs a full rerun and a session save"""
+    return (
+        st.session_state.step,
+        repr(st.session_state.data),
+        len(st.session_state.tech_questions),
+        st.session_state.current_question_index,
+        bool(st.session_state.get("grading_job")),
+    )
+
+@st.fragment
+def sidebar_progress():
+    """Progress, candidate profile and question checklist"""
+    script_run_stats.record_fragment_run("sidebar_progress")
+    st.session_state.sidebar_signature = sidebar_signature()
+
     # Progress Section
     if st.session_state.data or st.session_state.step > 0:
         st.markdown("### 📋 Application Progress")
@@ -909,9 +734,16 @@ with st.sidebar:
         for key, value in st.session_state.data.items():
             if key == "tech_stack":
                 st.markdown(f"**💻 {key.replace('_', ' ').title()}:** {', '.join(value)}")
+            elif key == "technical_grades":
+                st.markdown(f"**📝 Technical Score:** {value['average']}/10")
+                for i, grade in enumerate(value["grades"]):
+                    st.markdown(f"Q{i+1}: {grade['score']:g}/10 - {grade['rationale']}")
             else:
                 st.markdown(f"**{key.replace('_', ' ').title()}:** {value}")
         
+        if st.session_state.get("grading_job"):
+            grading_status()
+        
         st.markdown("---")
     
     # Technical Questions Progress
@@ -941,10 +773,112 @@ with st.sidebar:
         st.info("🚀 Ready to Start")
     
     st.markdown("---")
+
+# Rendered before the chat pane so its signature is current when the pane checks it
+with st.sidebar:
+    # Header
+    st.markdown("""
+    <div style="text-align: center; padding: 1rem; background: linear-gradient(135deg, #3b82f6, #a855f7); border-radius: 12px; margin-bottom: 1.5rem;">
+        <h2 style="color: white; margin: 0; font-size: 1.5rem;">🤖 TalentScout</h2>
+        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 0.9rem;">AI Hiring Assistant</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    sidebar_progress()
+    
+    if MEMORY_REPORT:
+        report = memory_report(st.session_state, SESSION_FIELDS + ("history_view",))
+        st.caption(f"🧠 Session state: {report['total'] / 1024:.1f} KiB "
+                   f"(chat {report.get('chat', 0) / 1024:.1f} KiB, {st.session_state.chat.spilled} messages spilled)")
+    
+    if STATS_REPORT:
+        with st.expander("📈 Service stats"):
+            st.json(service_stats())
     
     # Restart button
     if st.button("🔄 Restart", use_container_width=True):
+        session_store.delete(st.session_state.session_token)
+        st.session_state.chat.delete()
+        st.query_params.clear()
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.rerun()
-# Force redeploy timestamp: 2025-01-08 17:30:00
\ No newline at end of file
+
+# ---------------- MAIN UI ----------------
+# Title Section
+st.markdown("""
+<div style="text-align: center; margin-bottom: 3rem;">
+    <h1 style="background: linear-gradient(135deg, #f8fafc, #cbd5e0); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-size: 3rem; font-weight: 800;">🤖 TalentScout Hiring Assistant</h1>
+    <p style="color: #e2e8f0; font-size: 1.2rem;">AI-Powered Recruitment Screening</p>
+</div>
+""", unsafe_allow_html=True)
+
+@st.fragment
+def chat_pane():
+    """
+    Chat history and input. A message submitted here reruns only this
+    fragment; the whole app reruns only when the turn changed what the
+    sidebar shows (no timers, so idle sessions cost nothing).
+    """
+    if sidebar_signature() != st.session_state.get("sidebar_signature"):
+        st.rerun(scope="app")
+    script_run_stats.record_fragment_run("chat_pane")
+
+    # Welcome Message
+    if not st.session_state.chat:
+        st.markdown("""
+        <div style="background: rgba(168, 85, 247, 0.15); padding: 2rem; border-radius: 16px; margin-bottom: 2rem; border: 1px solid rgba(168, 85, 247, 0.3); text-align: center;">
+            <div style="font-size: 3rem; margin-bottom: 1rem;">🤖</div>
+            <div style="font-size: 1.3rem; font-weight: 600; color: #f1f5f9; margin-bottom: 1rem;">Hello! 👋 Welcome to TalentScout - Your AI-Powered Hiring Assistant.</div>
+            <div style="color: #cbd5e0; margin-bottom: 1.5rem; line-height: 1.6;">
+                I'm here to help you with our recruitment process. I'll collect some basic information about you and then ask relevant technical questions based on your skills.
+            </div>
+            <div style="color: #3b82f6; font-weight: 500; font-size: 1.1rem;">
+                Let's get started! Please enter your Full Name:
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Chat History: the latest messages as bubbles, older ones on request
+    chat = st.session_state.chat
+    history = st.session_state.history_view
+    start = history.window_start(len(chat))
+    if start:
+        earlier = history.archive_start(len(chat))
+        if earlier:
+            st.button(f"⬆️ Load earlier messages ({earlier})", on_click=history.load_earlier, args=(len(chat),))
+        archived = history.archive_markdown(chat)
+        if archived:
+            with st.container(border=True):
+                st.markdown(archived)
+    for role, message in chat[start:]:
+        with st.chat_message(role):
+            st.write(message)
+
+    # Reply still being generated in the background
+    if st.session_state.get("pending_reply"):
+        pending_reply_bubble()
+
+    # Reply being streamed for the turn handled in the chat_input callback
+    if st.session_state.get("streaming_reply"):
+        stream_pending_reply()
+
+    # Chat Input
+    waiting = bool(st.session_state.get("pending_reply"))
+    if TURN_MODE == "rerun":
+        # Previous flow: handle the turn mid-script, then rerun (two runs per message)
+        user_input = st.chat_input("Type your response...", disabled=waiting)
+        if user_input:
+            handle_turn(user_input)
+            st.rerun()
+    else:
+        st.chat_input("Type your response...", key="chat_input", on_submit=on_chat_submit, disabled=waiting)
+
+    persist_session()
+
+chat_pane()
+
+if startup_profiler.running:
+    startup_profiler.stop()
+    print(startup_profiler.format_report())
+# Force redeploy timestamp: 2025-01-08 17:30:00
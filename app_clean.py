@@ -1,9 +1,14 @@
 import streamlit as st
-from textblob import TextBlob
-from langdetect import detect
 import random
 import time
 
+# textblob and langdetect are loaded on first use, not at startup
+from lazy_imports import lazy_import
+from i18n import N_, translate
+from language import SessionLanguage
+from tech_normalizer import split_stack
+from tech_questions import generate_questions
+
 # ---------------- CSS LOADING ----------------
 def load_css():
     """Load external CSS file or fallback to inline styles"""
@@ -78,8 +83,12 @@ st.set_page_config(page_title="TalentScout Hiring Assistant", layout="centered")
 load_css()
 
 EXIT_KEYWORDS = ["exit", "quit", "bye", "stop", "end"]
+# Field answered at each screening step (steps 7+ are free text)
+STEP_FIELDS = ["name", "email", "phone", "experience", "position", "location", "tech_stack"]
 
 # ---------------- SESSION STATE ----------------
+if "language" not in st.session_state:
+    st.session_state.language = SessionLanguage()
 if "chat" not in st.session_state:
     st.session_state.chat = []
 if "step" not in st.session_state:
@@ -101,7 +110,7 @@ def analyze_sentiment(text):
     Enhanced sentiment analysis that returns a dictionary with detailed information
     """
     try:
-        blob = TextBlob(text)
+        blob = lazy_import("textblob").TextBlob(text)
         polarity = blob.sentiment.polarity
         subjectivity = blob.sentiment.subjectivity
         
@@ -163,71 +172,10 @@ def analyze_sentiment_fallback(text):
 
 # ---------------- LANGUAGE ----------------
 def detect_language(text):
-    try:
-        return detect(text)
-    except:
-        return "en"
-
-def translate(text, target="en"):
-    # Simple fallback translation - just return original text
-    return text
-
-# ---------------- TECH QUESTIONS ----------------
-TECH_QUESTIONS = {
-    "python": [
-        "Explain Python decorators.",
-        "What is the difference between list and tuple?",
-        "How does garbage collection work in Python?",
-        "What are Python generators and when would you use them?"
-    ],
-    "django": [
-        "Explain Django ORM.",
-        "What is middleware in Django?",
-        "Difference between function-based and class-based views?",
-        "How does Django handle database migrations?"
-    ],
-    "react": [
-        "What are React hooks?",
-        "Explain virtual DOM.",
-        "Difference between state and props?",
-        "What is JSX and how does it work?"
-    ],
-    "javascript": [
-        "Explain closures in JavaScript.",
-        "What is the difference between let, var, and const?",
-        "How does async/await work?",
-        "What is event bubbling?"
-    ],
-    "java": [
-        "What is the difference between abstract class and interface?",
-        "Explain Java memory management.",
-        "What are Java streams?",
-        "Difference between ArrayList and LinkedList?"
-    ]
-}
-
-def generate_questions(stack):
-    questions = []
-    for tech in stack:
-        tech = tech.lower()
-        if tech in TECH_QUESTIONS:
-            # Get 2 questions per technology
-            available_questions = TECH_QUESTIONS[tech]
-            num_to_select = min(2, len(available_questions))
-            questions.extend(random.sample(available_questions, num_to_select))
-    
-    # Add general programming questions if not enough tech-specific ones
-    if len(questions) < 4:
-        general_questions = [
-            "Describe your problem-solving approach.",
-            "How do you handle debugging complex issues?",
-            "What's your experience with version control?",
-            "How do you stay updated with new technologies?"
-        ]
-        questions.extend(general_questions[:4-len(questions)])
-    
-    # Return exactly 4 questions
-    return questions[:4]
+    """Session language; skips non-linguistic fields and re-detects only when unsure"""
+    step = st.session_state.step
+    field = STEP_FIELDS[step] if step < len(STEP_FIELDS) else None
+    return st.session_state.language.detect(text, field)
 
 # ---------------- PERSONALIZED RESPONSE ----------------
 def personalize(msg):
@@ -270,13 +218,15 @@ user_input = st.chat_input("Type your response...")
 
 # ---------------- CHAT LOGIC ----------------
 if user_input:
+    # Catalog prompts go out in the candidate's language; each is translated before it is filled in
+    lang = detect_language(user_input)
+
     if any(word in user_input.lower() for word in EXIT_KEYWORDS):
-        st.session_state.chat.append(("assistant", "🙏 Thank you for your time! Our HR team will contact you soon."))
+        st.session_state.chat.append(("assistant", translate("🙏 Thank you for your time! Our HR team will contact you soon.", lang)))
         st.stop()
 
     # Analyze sentiment
     sentiment_data = analyze_sentiment(user_input)
-    lang = detect_language(user_input)
     text = translate(user_input, "en")
 
     st.session_state.chat.append(("user", user_input))
@@ -284,46 +234,47 @@ if user_input:
     # ---------------- JOB SCREENING FLOW ----------------
     if st.session_state.step == 0:
         st.session_state.data["name"] = text
-        reply = f"Nice to meet you, {text}! 😊\n\nPlease provide your email address:"
+        reply = translate("Nice to meet you, {name}! 😊\n\nPlease provide your email address:", lang).format(name=text)
         st.session_state.step += 1
 
     elif st.session_state.step == 1:
         st.session_state.data["email"] = text
-        reply = "Great! What's your phone number?"
+        reply = translate("Great! What's your phone number?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 2:
         st.session_state.data["phone"] = text
-        reply = "How many years of professional experience do you have?"
+        reply = translate("How many years of professional experience do you have?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 3:
         st.session_state.data["experience"] = text
-        reply = "What position are you applying for?"
+        reply = translate("What position are you applying for?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 4:
         st.session_state.data["position"] = text
-        reply = "What's your current location?"
+        reply = translate("What's your current location?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 5:
         st.session_state.data["location"] = text
-        reply = "Please list your technical skills/stack (comma separated):"
+        reply = translate("Please list your technical skills/stack (comma separated):", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 6:
-        stack = [s.strip() for s in text.split(",")]
+        stack = split_stack(text)
         st.session_state.data["tech_stack"] = stack
         
         # Generate questions and store them
-        st.session_state.tech_questions = generate_questions(stack)
+        st.session_state.tech_questions = generate_questions(stack, st.session_state.data.get("experience", ""))
         st.session_state.current_question_index = 0
         st.session_state.question_answers = []
         
         # Ask the first technical question
         first_question = st.session_state.tech_questions[0]
-        reply = f"Perfect! Based on your skills, I'll now ask you some technical questions one by one.\n\n**Question 1 of 4:**\n{first_question}\n\nPlease share your answer:"
+        reply = (translate("Perfect! Based on your skills, I'll now ask you some technical questions one by one.", lang) + "\n\n"
+                 + translate("**Question {number} of 4:**\n{question}\n\nPlease share your answer:", lang).format(number=1, question=first_question))
         st.session_state.step += 1
 
     elif st.session_state.step == 7:
@@ -347,27 +298,28 @@ if user_input:
             
             # Provide encouraging feedback and ask next question
             encouragements = [
-                "Great answer! 👍",
-                "Excellent response! 🌟", 
-                "Well explained! 💯",
-                "Nice insight! ✨"
+                N_("Great answer! 👍"),
+                N_("Excellent response! 🌟"),
+                N_("Well explained! 💯"),
+                N_("Nice insight! ✨")
             ]
             
-            encouragement = random.choice(encouragements)
-            reply = f"{encouragement}\n\n**Question {next_q_index + 1} of 4:**\n{next_question}\n\nPlease share your answer:"
+            encouragement = translate(random.choice(encouragements), lang)
+            reply = f"{encouragement}\n\n" + translate("**Question {number} of 4:**\n{question}\n\nPlease share your answer:", lang).format(
+                number=next_q_index + 1, question=next_question)
         else:
             # All questions completed
-            reply = f"Excellent work! 🎉\n\nYou've successfully completed all 4 technical questions. Thank you for taking the time to share your knowledge and experience with us.\n\nOur HR team will review your responses along with your profile and get back to you soon. Feel free to ask me any questions about the company or role while you wait!"
+            reply = translate("Excellent work! 🎉\n\nYou've successfully completed all 4 technical questions. Thank you for taking the time to share your knowledge and experience with us.\n\nOur HR team will review your responses along with your profile and get back to you soon. Feel free to ask me any questions about the company or role while you wait!", lang)
             st.session_state.step += 1
 
     elif st.session_state.step >= 8:
-        reply = "✅ Your screening is complete! Feel free to ask me any questions about the company or role while you wait for our response."
+        reply = translate("✅ Your screening is complete! Feel free to ask me any questions about the company or role while you wait for our response.", lang)
     
     # Add sentiment-based modifications
     if sentiment_data.get("category") == "negative":
-        reply = "😊 Don't worry. " + reply
+        reply = translate("😊 Don't worry.", lang) + " " + reply
     elif sentiment_data.get("category") == "positive":
-        reply = "🚀 Awesome! " + reply
+        reply = translate("🚀 Awesome!", lang) + " " + reply
 
     # Personalize if we have user data
     if st.session_state.data:
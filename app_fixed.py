@@ -2,7 +2,9 @@ import streamlit as st
 from textblob import TextBlob
 from langdetect import detect
 # from googletrans import Translator  # Removed - not available
-import random
+from i18n import translate
+from tech_normalizer import split_stack
+from tech_questions import generate_questions
 
 # ---------------- CONFIG ----------------
 st.set_page_config(page_title="TalentScout Hiring Assistant", layout="centered")
@@ -34,48 +36,6 @@ def detect_language(text):
     except:
         return "en"
 
-def translate(text, target="en"):
-    # Simple fallback translation - just return original text
-    # In a real app, you could use Google Translate API or other services
-    return text
-
-# ---------------- TECH QUESTIONS ----------------
-TECH_QUESTIONS = {
-    "python": [
-        "Explain Python decorators.",
-        "What is the difference between list and tuple?",
-        "How does garbage collection work in Python?"
-    ],
-    "django": [
-        "Explain Django ORM.",
-        "What is middleware in Django?",
-        "Difference between function-based and class-based views?"
-    ],
-    "react": [
-        "What are React hooks?",
-        "Explain virtual DOM.",
-        "Difference between state and props?"
-    ],
-    "node": [
-        "What is event-driven architecture?",
-        "Explain middleware in Express.js.",
-        "What is non-blocking I/O?"
-    ],
-    "sql": [
-        "Difference between INNER JOIN and LEFT JOIN?",
-        "What is normalization?",
-        "Explain indexing."
-    ]
-}
-
-def generate_questions(stack):
-    questions = []
-    for tech in stack:
-        tech = tech.lower()
-        if tech in TECH_QUESTIONS:
-            questions.extend(random.sample(TECH_QUESTIONS[tech], 2))
-    return questions[:5]
-
 # ---------------- PERSONALIZED RESPONSE ----------------
 def personalize(msg):
     name = st.session_state.data.get("name", "")
@@ -131,12 +91,14 @@ for role, message in st.session_state.chat:
 user_input = st.chat_input("Ask me anything...")
 
 if user_input:
+    # Catalog prompts go out in the candidate's language; each is translated before it is filled in
+    lang = detect_language(user_input)
+
     if any(word in user_input.lower() for word in EXIT_KEYWORDS):
-        st.session_state.chat.append(("assistant", "🙏 Thank you for your time! Our HR team will contact you soon."))
+        st.session_state.chat.append(("assistant", translate("🙏 Thank you for your time! Our HR team will contact you soon.", lang)))
         st.stop()
 
     sentiment = analyze_sentiment(user_input)
-    lang = detect_language(user_input)
     text = translate(user_input, "en")
 
     st.session_state.chat.append(("user", user_input))
@@ -144,52 +106,52 @@ if user_input:
     # Check if user wants to start job screening
     if any(word in user_input.lower() for word in ["start screening", "apply", "job application", "screening"]):
         st.session_state.step = 1
-        reply = "Great! Let's start the job screening process. 🚀\n\nWhat is your full name?"
+        reply = translate("Great! Let's start the job screening process. 🚀\n\nWhat is your full name?", lang)
     
     # ---------------- JOB SCREENING FLOW ----------------
     elif st.session_state.step == 1:
         st.session_state.data["name"] = text
-        reply = "Nice to meet you! Please provide your email address."
+        reply = translate("Nice to meet you! Please provide your email address.", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 2:
         st.session_state.data["email"] = text
-        reply = "Your phone number?"
+        reply = translate("Your phone number?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 3:
         st.session_state.data["phone"] = text
-        reply = "How many years of experience do you have?"
+        reply = translate("How many years of experience do you have?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 4:
         st.session_state.data["experience"] = text
-        reply = "What position are you applying for?"
+        reply = translate("What position are you applying for?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 5:
         st.session_state.data["position"] = text
-        reply = "Your current location?"
+        reply = translate("Your current location?", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 6:
         st.session_state.data["location"] = text
-        reply = "Please list your tech stack (comma separated)."
+        reply = translate("Please list your tech stack (comma separated).", lang)
         st.session_state.step += 1
 
     elif st.session_state.step == 7:
-        stack = [s.strip() for s in text.split(",")]
+        stack = split_stack(text)
         st.session_state.data["tech_stack"] = stack
-        questions = generate_questions(stack)
+        questions = generate_questions(stack, st.session_state.data.get("experience", ""))
 
-        reply = "Great! Here are some technical questions:\n\n"
+        reply = translate("Great! Here are some technical questions:", lang) + "\n\n"
         for q in questions:
             reply += f"• {q}\n"
-        reply += "\nThank you for completing the screening! 🎉"
+        reply += "\n" + translate("Thank you for completing the screening! 🎉", lang)
         st.session_state.step += 1
 
     elif st.session_state.step >= 8:
-        reply = "✅ Screening complete. We will get back to you shortly.\n\nFeel free to ask me any other questions!"
+        reply = translate("✅ Screening complete. We will get back to you shortly.\n\nFeel free to ask me any other questions!", lang)
     
     # ---------------- GENERAL AI RESPONSES ----------------
     else:
@@ -198,13 +160,13 @@ if user_input:
         
         # Add screening suggestion if not in screening mode
         if st.session_state.step == 0:
-            reply += "\n\n💼 **Want to apply for a job?** Just say 'start screening' to begin!"
+            reply += "\n\n" + translate("💼 **Want to apply for a job?** Just say 'start screening' to begin!", lang)
 
     # Add sentiment-based modifications
     if sentiment == "negative":
-        reply = "😊 Don't worry. " + reply
+        reply = translate("😊 Don't worry.", lang) + " " + reply
     elif sentiment == "positive":
-        reply = "🚀 Awesome! " + reply
+        reply = translate("🚀 Awesome!", lang) + " " + reply
 
     # Personalize if we have user data
     if st.session_state.data:
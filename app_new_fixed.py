@@ -2,6 +2,7 @@ import streamlit as st
 import os
 import random
 import time
+from lazy_imports import is_installed
 
 # CSS Cache buster
 CSS_VERSION = str(int(time.time()))
@@ -11,9 +12,10 @@ try:
     from dotenv import load_dotenv
     import google.genai as genai
     
-    # Advanced Features Imports
-    from textblob import TextBlob
-    from langdetect import detect
+    # Advanced Features: checked without importing; load with lazy_import() on first use
+    for module in ("textblob", "langdetect"):
+        if not is_installed(module):
+            raise ImportError(f"No module named '{module}'")
     import re
     
     # Import fallback system
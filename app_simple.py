@@ -2,6 +2,9 @@ import streamlit as st
 import random
 import time
 
+from tech_normalizer import split_stack
+from tech_questions import generate_questions
+
 # ---------------- CONFIG ----------------
 st.set_page_config(
     page_title="TalentScout Hiring Assistant", 
@@ -123,55 +126,6 @@ def analyze_sentiment(text):
     else:
         return "neutral"
 
-# ---------------- TECH QUESTIONS ----------------
-TECH_QUESTIONS = {
-    "python": [
-        "Explain Python decorators.",
-        "What is the difference between list and tuple?",
-        "How does garbage collection work in Python?",
-        "What are Python generators and when would you use them?"
-    ],
-    "javascript": [
-        "Explain closures in JavaScript.",
-        "What is the difference between let, var, and const?",
-        "How does async/await work?",
-        "What is event bubbling?"
-    ],
-    "react": [
-        "What are React hooks?",
-        "Explain virtual DOM.",
-        "Difference between state and props?",
-        "What is JSX and how does it work?"
-    ],
-    "java": [
-        "What is the difference between abstract class and interface?",
-        "Explain Java memory management.",
-        "What are Java streams?",
-        "Difference between ArrayList and LinkedList?"
-    ]
-}
-
-def generate_questions(stack):
-    questions = []
-    for tech in stack:
-        tech = tech.lower().strip()
-        if tech in TECH_QUESTIONS:
-            available_questions = TECH_QUESTIONS[tech]
-            num_to_select = min(2, len(available_questions))
-            questions.extend(random.sample(available_questions, num_to_select))
-    
-    # Add general questions if not enough tech-specific ones
-    if len(questions) < 4:
-        general_questions = [
-            "Describe your problem-solving approach.",
-            "How do you handle debugging complex issues?",
-            "What's your experience with version control?",
-            "How do you stay updated with new technologies?"
-        ]
-        questions.extend(general_questions[:4-len(questions)])
-    
-    return questions[:4]
-
 # ---------------- MAIN UI ----------------
 # Title Section
 st.markdown("""
@@ -247,11 +201,11 @@ if user_input:
         st.session_state.step += 1
 
     elif st.session_state.step == 6:
-        stack = [s.strip() for s in user_input.split(",")]
+        stack = split_stack(user_input)
         st.session_state.data["tech_stack"] = stack
         
         # Generate questions
-        st.session_state.tech_questions = generate_questions(stack)
+        st.session_state.tech_questions = generate_questions(stack, st.session_state.data.get("experience", ""))
         st.session_state.current_question_index = 0
         st.session_state.question_answers = []
         
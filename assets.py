@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Static assets: minified, content-hashed theme and the sidebar scripts
+
+Streamlit serves ./static at app/static/ when server.enableStaticServing is
+on, so the browser downloads and caches them once instead of receiving
+them inline on every rerun.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+
+THEME_SOURCE = "theme.css"
+STATIC_DIR = "static"
+STATIC_URL = "app/static"
+THEME_ELEMENT_ID = "talentscout-theme"
+
+
+def js_literal(value):
+    """JSON-encode a value for embedding inside an inline <script>"""
+    return json.dumps(value).replace("</", "<\\/")
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+@functools.lru_cache(maxsize=None)
+def build_theme_asset(source=THEME_SOURCE, static_dir=STATIC_DIR):
+    """
+    Write static/theme.<hash>.min.css (once per content version).
+
+    Returns (href, minified_css); href changes whenever theme.css does,
+    so browsers can cache it indefinitely.
+    """
+    with open(source, encoding="utf-8") as f:
+        css = minify_css(f.read())
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    filename = f"theme.{digest}.min.css"
+
+    path = os.path.join(static_dir, filename)
+    if not os.path.exists(path):
+        os.makedirs(static_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(css)
+        os.replace(tmp_path, path)
+
+    # ?v= makes Streamlit's static handler send a long-lived Cache-Control
+    return f"{STATIC_URL}/{filename}?v={digest}", css
+
+
+def theme_loader_html(href=None, css=None):
+    """
+    Script for a zero-height component that adds the theme to the parent
+    page's <head>. The element outlives the component, so it only has to be
+    sent once per browser session. Falls back to inline CSS text when
+    static serving is disabled.
+    """
+    return f"""<script>
+(function () {{
+    const doc = window.parent.document;
+    const href = {js_literal(href)};
+    const css = {js_literal(css)};
+    let el = doc.getElementById({js_literal(THEME_ELEMENT_ID)});
+    if (el && (href ? el.dataset.href === href : el.tagName === "STYLE")) {{
+        return;
+    }}
+    if (el) {{
+        el.remove();
+    }}
+    if (href) {{
+        el = doc.createElement("link");
+        el.rel = "stylesheet";
+        el.href = new URL(href, doc.baseURI).href;
+        el.dataset.href = href;
+    }} else {{
+        el = doc.createElement("style");
+        el.textContent = css;
+    }}
+    el.id = {js_literal(THEME_ELEMENT_ID)};
+    doc.head.appendChild(el);
+}})();
+</script>"""
+
+
+@functools.lru_cache(maxsize=None)
+def static_script(filename, static_dir=STATIC_DIR):
+    """Return (versioned URL, source) for a script committed under static/"""
+    with open(os.path.join(static_dir, filename), encoding="utf-8") as f:
+        code = f.read()
+    digest = hashlib.sha256(code.encode("utf-8")).hexdigest()[:12]
+    return f"{STATIC_URL}/{filename}?v={digest}", code
+
+
+def script_loader_html(element_id, src=None, code=None):
+    """
+    Script for a zero-height component that runs a script in the parent
+    page once. Scripts load in insertion order; `code` is used inline
+    when static serving is disabled.
+    """
+    return f"""<script>
+(function () {{
+    const doc = window.parent.document;
+    if (doc.getElementById({js_literal(element_id)})) {{
+        return;
+    }}
+    const el = doc.createElement("script");
+    el.id = {js_literal(element_id)};
+    const src = {js_literal(src)};
+    if (src) {{
+        el.src = new URL(src, doc.baseURI).href;
+        el.async = false;
+    }} else {{
+        el.textContent = {js_literal(code)};
+    }}
+    doc.head.appendChild(el);
+}})();
+</script>"""
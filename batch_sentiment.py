@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Batch sentiment scoring for transcript analytics
+
+Scores many messages with the same keyword rules as app.py's
+analyze_sentiment, using NumPy instead of one call per message:
+
+1. The batch is lowercased and joined once, and one regex built from the
+   lexicon's sentiment terms runs over it in a single pass.
+2. Matches become a sparse (message x term) matrix with 0/1 entries
+   (COO row/column arrays).
+3. Multiplying it by the dense (term x category) membership matrix
+   gives per-message category counts, from which category and polarity
+   are derived in vectorized form.
+
+The categories match analyze_sentiment. Polarity is this module's own
+coarse model: +/-POLARITY by whether the message has more of the
+lexicon's positive or negative terms. It is not comparable to
+app_clean.py's polarity, which is TextBlob's continuous score (its
+keyword fallback uses a different word list).
+
+    python batch_sentiment.py --db data/sessions.db --workers 4
+    python batch_sentiment.py --bench 1000000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from config import SESSION_DB_PATH
+from lexicon import LEXICON, trie_pattern
+from session_store import SQLiteBackend, decode_state
+
+# Category codes returned by score_batch; index into CATEGORY_LABELS
+CATEGORY_LABELS = np.array(["neutral", "positive", "negative", "nervous", "excited"])
+NEUTRAL, POSITIVE, NEGATIVE, NERVOUS, EXCITED = range(5)
+SENTIMENT_CATEGORIES = ("positive", "negative", "nervous", "excited")
+# Magnitude of the coarse polarity: the sign of (positive - negative) lexicon terms
+POLARITY = 0.3
+# Joins messages for the single regex pass; never part of a term
+SEPARATOR = "\x00"
+DEFAULT_CHUNK_SIZE = 100_000
+
+TERMS = sorted({term for category in SENTIMENT_CATEGORIES for term in LEXICON.categories[category]})
+TERM_INDEX = {term: i for i, term in enumerate(TERMS)}
+# Message separator or a sentiment term, with the same word-boundary rules as LEXICON
+TOKEN_REGEX = re.compile(rf"{SEPARATOR}|\b{trie_pattern(TERMS)}\b")
+TOKEN_IDS = {**TERM_INDEX, SEPARATOR: -1}
+# (term x category) membership matrix; a term may count for several categories
+MEMBERSHIP = np.array(
+    [[term in LEXICON.categories[category] for category in SENTIMENT_CATEGORIES] for term in TERMS],
+    dtype=np.float32,
+)
+
+
+def term_matrix(messages):
+    """
+    Sparse (message x term) 0/1 matrix as (rows, cols) index arrays.
+    A term counts once per message, as in analyze_sentiment.
+    """
+    text = SEPARATOR.join(message.replace(SEPARATOR, " ") for message in messages).lower()
+    # One C-level pass; separators come back in order and number the rows
+    found = TOKEN_REGEX.findall(text)
+    ids = np.fromiter(map(TOKEN_IDS.__getitem__, found), dtype=np.int64, count=len(found))
+    is_separator = ids < 0
+    rows = np.cumsum(is_separator)[~is_separator]
+    cols = ids[~is_separator]
+
+    # Distinct (message, term) pairs; sort + diff is much faster than np.unique here
+    keys = np.sort(rows * len(TERMS) + cols)
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+    return keys // len(TERMS), keys % len(TERMS)
+
+
+def category_counts(rows, cols, n_messages):
+    """(message x category) counts: the sparse term matrix times MEMBERSHIP"""
+    counts = np.empty((n_messages, len(SENTIMENT_CATEGORIES)), dtype=np.float32)
+    for j in range(len(SENTIMENT_CATEGORIES)):
+        counts[:, j] = np.bincount(rows, weights=MEMBERSHIP[cols, j], minlength=n_messages)
+    return counts
+
+
+def score_chunk(messages):
+    """(categories, polarity) for one list of messages, in this process"""
+    if not messages:
+        return np.empty(0, dtype=np.int8), np.empty(0, dtype=np.float32)
+    rows, cols = term_matrix(messages)
+    counts = category_counts(rows, cols, len(messages))
+    positive, negative, nervous, excited = counts.T
+
+    # Same precedence as analyze_sentiment: nervous, excited, then positive vs negative
+    categories = np.select(
+        [nervous > 0, excited > 0, positive > negative, negative > positive],
+        [NERVOUS, EXCITED, POSITIVE, NEGATIVE],
+        default=NEUTRAL,
+    ).astype(np.int8)
+    polarity = (np.sign(positive - negative) * POLARITY).astype(np.float32)
+    return categories, polarity
+
+
+def score_batch(messages, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Score a list of messages.
+
+    Returns (categories, polarity): int8 codes into CATEGORY_LABELS and
+    float32 coarse polarity in {-POLARITY, 0, POLARITY}. workers > 1 scores chunks in a
+    process pool.
+    """
+    messages = list(messages)
+    chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(score_chunk, chunks))
+    else:
+        results = [score_chunk(chunk) for chunk in chunks]
+    if not results:
+        return score_chunk([])
+    return np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+
+def read_transcripts(backend, tokens=None, role="user"):
+    """
+    Messages with the given role from sessions in a session backend (all
+    of them unless tokens is given). Spilled chunks are read back from the
+    backend along with the recent messages in the session document.
+    """
+    messages = []
+    for token in backend.tokens() if tokens is None else tokens:
+        stored = backend.load(token)
+        if stored is None:
+            continue
+        state = decode_state(stored[0], backend, token)
+        for message_role, message in state.get("chat", ()):
+            if role is None or message_role == role:
+                messages.append(message)
+    return messages
+
+
+def synthetic_messages(count, seed=0):
+    rng = random.Random(seed)
+    words = TERMS + ["the", "python", "interview", "code", "team", "project", "unlikely", "this", "answer"] * 8
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(3, 25))) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch sentiment over stored transcripts")
+    parser.add_argument("tokens", nargs="*", help="session tokens (default: every stored session)")
+    parser.add_argument("--db", default=SESSION_DB_PATH, help="SQLite session database")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--bench", type=int, metavar="N", help="score N synthetic messages instead")
+    args = parser.parse_args()
+
+    messages = synthetic_messages(args.bench) if args.bench else read_transcripts(SQLiteBackend(args.db), args.tokens or None)
+    started = time.perf_counter()
+    categories, polarity = score_batch(messages, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    print(f"🧪 Scored {len(messages):,} messages in {elapsed:.2f}s with {args.workers} worker(s)")
+    labels, counts = np.unique(categories, return_counts=True)
+    for label, count in zip(labels, counts):
+        print(f"{CATEGORY_LABELS[label]:>9}: {count:,}")
+    if len(polarity):
+        print(f"mean polarity: {polarity.mean():+.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
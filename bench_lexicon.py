@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-message keyword matching cost
+
+Compares the previous per-list substring scans (sentiment + greeting +
+fallback intents) with one pass over the compiled LEXICON.
+
+    python bench_lexicon.py
+"""
+
+import timeit
+
+from config import GREETING_KEYWORDS
+from lexicon import CATEGORIES, LEXICON
+
+MESSAGES = [
+    "hi",
+    "Good morning! I'm really excited about this opportunity.",
+    "I have 5 years of experience as a backend engineer working with Python and SQL.",
+    "Honestly I'm a bit nervous, technical interviews always stress me out.",
+    "Decorators wrap a function so you can add behaviour before and after it runs without changing its code.",
+    "That seems unlikely to matter, but I'd rather use a list comprehension here.",
+    "What are the next steps in the process and when will I hear back from the team?",
+]
+
+SENTIMENT = ("positive", "negative", "nervous", "excited")
+FALLBACK = ("enthusiasm", "worry", "start", "tech", "experience")
+
+
+def legacy(text):
+    """One `word in text` scan per list, as before the lexicon"""
+    text_lower = text.lower()
+    counts = [sum(1 for word in CATEGORIES[name] if word in text_lower) for name in SENTIMENT]
+    greeting = any(greeting in text_lower for greeting in GREETING_KEYWORDS)
+    intents = [any(word in text_lower for word in CATEGORIES[name]) for name in FALLBACK]
+    fallback_greeting = any(greeting in text_lower for greeting in GREETING_KEYWORDS)
+    return counts, greeting, intents, fallback_greeting
+
+
+def compiled(text):
+    """Single pass over the compiled lexicon (uncached)"""
+    found = LEXICON.match(text)
+    counts = [found.count(name) for name in SENTIMENT]
+    greeting = found.first_position("greeting")
+    intents = [found.has(name) for name in FALLBACK]
+    return counts, greeting, intents
+
+
+def per_message_us(fn, number=2000):
+    seconds = timeit.timeit(lambda: [fn(message) for message in MESSAGES], number=number)
+    return seconds / (number * len(MESSAGES)) * 1e6
+
+
+if __name__ == "__main__":
+    print("🧪 Keyword matching cost per message")
+    print("=" * 50)
+    before = per_message_us(legacy)
+    after = per_message_us(compiled)
+    print(f"substring scans : {before:6.2f} µs/message")
+    print(f"compiled lexicon: {after:6.2f} µs/message ({before / after:.1f}x)")
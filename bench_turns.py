@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark script executions and wall time per chat turn
+
+Plays a full screening conversation through Streamlit's AppTest for each
+TURN_MODE ("rerun" = previous mid-script handling, "callback" = chat_input
+on_submit) and reports script runs and milliseconds per turn. AI is
+disabled so only the app's own work is measured.
+
+    python bench_turns.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+CONVERSATION = [
+    "hi",
+    "Jane Doe",
+    "jane@example.com",
+    "+1 555 0100",
+    "5",
+    "Backend Engineer",
+    "Berlin",
+    "python, react",
+    "Decorators wrap a function to extend its behaviour.",
+    "Lists are mutable, tuples are not.",
+    "Hooks let function components use state.",
+    "The virtual DOM is an in-memory tree diffed before updating the DOM.",
+    "What are the next steps?",
+]
+
+
+def measure():
+    """Run in a child process with TURN_MODE already set"""
+    from streamlit.testing.v1 import AppTest
+    from run_stats import script_run_stats
+
+    app = AppTest.from_file("app.py", default_timeout=60)
+    app.secrets["GOOGLE_API_KEY"] = ""
+    app.run()
+
+    runs, times = [], []
+    for message in CONVERSATION:
+        before = script_run_stats.runs
+        started = time.perf_counter()
+        app.chat_input[0].set_value(message).run()
+        times.append((time.perf_counter() - started) * 1000)
+        runs.append(script_run_stats.runs - before)
+
+    print(json.dumps({"runs": runs, "times": times, "messages": len(app.session_state["chat"])}))
+
+
+def main():
+    print("🧪 Script runs per chat turn")
+    print("=" * 50)
+
+    results = {}
+    for mode in ("rerun", "callback"):
+        env = dict(os.environ, TURN_MODE=mode, STREAM_RESPONSES="false", ASYNC_RESPONSES="false")
+        output = subprocess.run([sys.executable, __file__, "--child"], env=env, capture_output=True, text=True, check=True)
+        results[mode] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    for mode, result in results.items():
+        turns = len(result["runs"])
+        print(f"{mode:>8} | runs/turn {sum(result['runs']) / turns:.2f} | "
+              f"ms/turn {sum(result['times']) / turns:7.1f} | chat messages {result['messages']}")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        measure()
+    else:
+        main()
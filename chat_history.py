@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Windowed chat history: the last N messages as bubbles, older ones as one
+markdown block shown a page at a time
+"""
+
+from config import CHAT_HISTORY_WINDOW, CHAT_HISTORY_PAGE, CHAT_HISTORY_CACHE_CHARS
+
+ROLE_LABELS = {"user": "🧑 **You**", "assistant": "🤖 **Assistant**"}
+SEPARATOR = "\n\n---\n\n"
+
+
+def format_message(role, message):
+    """Markdown for one archived message"""
+    return f"{ROLE_LABELS.get(role, role)}: {message}"
+
+
+class ChatHistoryView:
+    """
+    Per-session view over the chat list.
+
+    "Load earlier" pins the revealed archive to an absolute message index,
+    so the range only grows: new pages are prepended, and messages that
+    scroll out of the window are appended. The formatted block is kept
+    (while it is under `max_cached` characters), so a turn usually formats
+    one message.
+    """
+
+    def __init__(self, window=CHAT_HISTORY_WINDOW, page_size=CHAT_HISTORY_PAGE, max_cached=CHAT_HISTORY_CACHE_CHARS):
+        self.window = max(1, window)
+        self.page_size = max(1, page_size)
+        self.max_cached = max_cached
+        self.revealed_from = None
+        self._range = (0, 0)
+        self._text = ""
+
+    def window_start(self, total):
+        """Index of the first message rendered as a bubble"""
+        return max(0, total - self.window)
+
+    def archive_start(self, total):
+        """Index of the first archived message currently revealed"""
+        window_start = self.window_start(total)
+        if self.revealed_from is None:
+            return window_start
+        return min(self.revealed_from, window_start)
+
+    def load_earlier(self, total):
+        """Reveal one more page above the current archive start"""
+        self.revealed_from = max(0, self.archive_start(total) - self.page_size)
+
+    def archive_markdown(self, chat):
+        """Revealed archived messages as one markdown block ("" when none)"""
+        start, end = self.archive_start(len(chat)), self.window_start(len(chat))
+        if start >= end:
+            self._range, self._text = (0, 0), ""
+            return ""
+
+        cached_start, cached_end = self._range
+        if self._text and start <= cached_start and cached_end <= end:
+            blocks = ([format_message(role, message) for role, message in chat[start:cached_start]]
+                      + [self._text]
+                      + [format_message(role, message) for role, message in chat[cached_end:end]])
+        else:
+            blocks = [format_message(role, message) for role, message in chat[start:end]]
+        text = SEPARATOR.join(blocks)
+
+        if len(text) <= self.max_cached:
+            self._range, self._text = (start, end), text
+        else:
+            self._range, self._text = (0, 0), ""
+        return text
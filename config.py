@@ -1 +1,143 @@
+import os
+
 APP_NAME = "TalentScout Hiring Assistant"
+
+GREETING_KEYWORDS = ["hello", "hi", "hey", "good morning", "good afternoon", "good evening", "namaste", "greetings", "hola", "bonjour", "guten tag", "ciao", "konnichiwa", "salaam", "shalom"]
+
+# ---------------- AI RESPONSE CACHE ----------------
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", "600"))
+# Seconds an AI response stays valid, per prompt context (0 disables caching)
+CACHE_TTL_SECONDS = {
+    "greeting": int(os.getenv("CACHE_TTL_GREETING", "3600")),
+    "technical_answer": int(os.getenv("CACHE_TTL_TECHNICAL_ANSWER", "900")),
+    "general": int(os.getenv("CACHE_TTL_GENERAL", "600")),
+}
+
+# ---------------- AI STREAMING ----------------
+# Stream Gemini output into the assistant bubble as tokens arrive
+STREAM_RESPONSES = os.getenv("STREAM_RESPONSES", "true").lower() == "true"
+
+# ---------------- GEMINI RATE LIMITS ----------------
+# Requests / tokens per minute allowed by our Gemini quota
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "15"))
+GEMINI_TPM = int(os.getenv("GEMINI_TPM", "1000000"))
+# Consecutive 429/5xx errors before the circuit breaker opens
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))
+# Seconds the breaker stays open before a half-open probe
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+
+# ---------------- GEMINI HTTP POOL ----------------
+# Override the API endpoint, e.g. http://127.0.0.1:8787 for fake_gemini.py
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "")
+GEMINI_POOL_MAX_CONNECTIONS = int(os.getenv("GEMINI_POOL_MAX_CONNECTIONS", "20"))
+GEMINI_POOL_MAX_KEEPALIVE = int(os.getenv("GEMINI_POOL_MAX_KEEPALIVE", "10"))
+GEMINI_POOL_KEEPALIVE_EXPIRY = float(os.getenv("GEMINI_POOL_KEEPALIVE_EXPIRY", "60"))
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30"))
+
+# ---------------- BACKGROUND LLM WORKERS ----------------
+# Run AI calls in a worker pool and fill in the reply when ready
+ASYNC_RESPONSES = os.getenv("ASYNC_RESPONSES", "false").lower() == "true"
+LLM_WORKERS = int(os.getenv("LLM_WORKERS", "8"))
+# Running + queued jobs allowed across all sessions
+LLM_MAX_PENDING = int(os.getenv("LLM_MAX_PENDING", "32"))
+# Seconds before a job's reply falls back to the canned response
+LLM_JOB_TIMEOUT = float(os.getenv("LLM_JOB_TIMEOUT", "20"))
+ASYNC_POLL_INTERVAL = float(os.getenv("ASYNC_POLL_INTERVAL", "0.5"))
+
+# ---------------- HEDGED REQUESTS ----------------
+# Fire the fallback model when the primary is slower than the hedge delay
+HEDGE_REQUESTS = os.getenv("HEDGE_REQUESTS", "false").lower() == "true"
+# Seconds, or "p90" to use the primary model's observed latency percentile
+HEDGE_DELAY = os.getenv("HEDGE_DELAY", "p90")
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "0.9"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_WORKERS = int(os.getenv("HEDGE_WORKERS", "16"))
+
+# ---------------- GREETING POOL ----------------
+GREETING_POOL_PATH = os.getenv("GREETING_POOL_PATH", "data/greeting_pool.json")
+GREETING_POOL_SIZE = int(os.getenv("GREETING_POOL_SIZE", "40"))
+# Seconds before the pool is regenerated in the background
+GREETING_POOL_MAX_AGE = int(os.getenv("GREETING_POOL_MAX_AGE", str(7 * 24 * 3600)))
+# Seconds between background attempts to complete a stale or partial pool
+GREETING_POOL_RETRY = int(os.getenv("GREETING_POOL_RETRY", "600"))
+# Requests per minute the background refresh leaves untouched for live candidates
+GREETING_POOL_RESERVE = int(os.getenv("GREETING_POOL_RESERVE", "10"))
+
+# ---------------- DEFERRED GRADING ----------------
+# Acknowledge technical answers locally and grade them all in one LLM call
+DEFERRED_GRADING = os.getenv("DEFERRED_GRADING", "false").lower() == "true"
+
+# ---------------- SIDEBAR SCRIPT ----------------
+# "component" (scoped, rAF-debounced observer) or "legacy" (body-wide observer)
+SIDEBAR_SCRIPT = os.getenv("SIDEBAR_SCRIPT", "component")
+# Load static/observer_probe.js to log MutationObserver callbacks per second
+OBSERVER_PROBE = os.getenv("OBSERVER_PROBE", "false").lower() == "true"
+
+# ---------------- TURN HANDLING ----------------
+# "callback" handles each message in the chat_input callback (one script run);
+# "rerun" is the previous mid-script handling + st.rerun(), kept for benchmarks
+TURN_MODE = os.getenv("TURN_MODE", "callback")
+
+# ---------------- CHAT HISTORY ----------------
+# Messages rendered as chat bubbles; older ones sit behind "Load earlier"
+CHAT_HISTORY_WINDOW = int(os.getenv("CHAT_HISTORY_WINDOW", "20"))
+# Older messages revealed per "Load earlier" click
+CHAT_HISTORY_PAGE = int(os.getenv("CHAT_HISTORY_PAGE", "20"))
+# Largest revealed archive block kept formatted between runs; bigger ones are rebuilt on demand
+CHAT_HISTORY_CACHE_CHARS = int(os.getenv("CHAT_HISTORY_CACHE_CHARS", "65536"))
+
+# ---------------- SESSION STORE ----------------
+# "memory" (this process only) or "sqlite" (shared by replicas on one volume)
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory")
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "data/sessions.db")
+# Sessions kept in the write-through cache, and seconds before a cached
+# session is dropped (it is also re-read whenever another replica saved it)
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "1024"))
+SESSION_CACHE_TTL = int(os.getenv("SESSION_CACHE_TTL", "300"))
+# "memory" backend: sessions kept at most, and seconds before an idle one is forgotten
+SESSION_MEMORY_MAX = int(os.getenv("SESSION_MEMORY_MAX", "10000"))
+SESSION_IDLE_TTL = int(os.getenv("SESSION_IDLE_TTL", str(24 * 3600)))
+
+# ---------------- TRANSCRIPT MEMORY ----------------
+# Messages kept in memory per session (keep >= CHAT_HISTORY_WINDOW so the
+# visible bubbles never need the backend); older ones are stored compressed
+# in the session backend
+TRANSCRIPT_KEEP = int(os.getenv("TRANSCRIPT_KEEP", "40"))
+# Show the session's resident state size in the sidebar
+MEMORY_REPORT = os.getenv("MEMORY_REPORT", "false").lower() == "true"
+
+# ---------------- SERVICE STATS ----------------
+# Show connection pool, cache, single-flight, hedging, guard and session-store counters in the sidebar
+STATS_REPORT = os.getenv("STATS_REPORT", "false").lower() == "true"
+# Seconds between "[stats]" log lines with the same counters (0 = off)
+STATS_LOG_INTERVAL = float(os.getenv("STATS_LOG_INTERVAL", "0"))
+
+# ---------------- STARTUP PROFILING ----------------
+# Log per-module import times for the first script run and for each lazy import
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
+
+# ---------------- WARM-UP ----------------
+# Written once langdetect, TextBlob and the Gemini client are preloaded
+WARMUP_READY_FILE = os.getenv("WARMUP_READY_FILE", "/tmp/talentscout.ready")
+# Local port answering GET /ready with 200 (warm) or 503 (warming); 0 disables
+WARMUP_READY_PORT = int(os.getenv("WARMUP_READY_PORT", "0"))
+
+# ---------------- LANGUAGE DETECTION ----------------
+# Keep the session's language while its confidence stays at or above this
+LANGUAGE_MIN_CONFIDENCE = float(os.getenv("LANGUAGE_MIN_CONFIDENCE", "0.9"))
+# Confidence kept per message without re-detection, so long sessions re-check
+LANGUAGE_CONFIDENCE_DECAY = float(os.getenv("LANGUAGE_CONFIDENCE_DECAY", "0.97"))
+# Pure-ASCII messages shorter than this skip langdetect
+LANGUAGE_SHORT_TEXT = int(os.getenv("LANGUAGE_SHORT_TEXT", "40"))
+LANGUAGE_SEED = int(os.getenv("LANGUAGE_SEED", "0"))
+
+# ---------------- TRANSLATIONS ----------------
+# Languages whose compiled catalog is used; any other detected language gets English
+I18N_LANGUAGES = [lang.strip() for lang in os.getenv("I18N_LANGUAGES", "es,fr,de").split(",") if lang.strip()]
+LOCALE_DIR = os.getenv("LOCALE_DIR", "locale")
+
+# ---------------- QUESTION BANK ----------------
+# JSONL file, one question per line: id, tech, difficulty, topic, question
+# (relative paths are resolved against the app directory)
+QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH", "data/question_bank.jsonl")
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Gemini API, for load and latency testing
+
+Serves the generateContent / streamGenerateContent REST endpoints used by
+google-genai, with configurable latency, injected errors and canned or
+echo responses. Point the app at it with:
+
+    python fake_gemini.py --port 8787 --latency lognormal:-0.7,0.6 --errors 429=0.05,500=0.02
+    GEMINI_BASE_URL=http://127.0.0.1:8787 GOOGLE_API_KEY=fake streamlit run app.py
+
+FakeGenaiClient offers the same behaviour in-process for unit tests.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ERROR_STATUS = {
+    429: ("RESOURCE_EXHAUSTED", "Resource has been exhausted (e.g. check quota)."),
+    500: ("INTERNAL", "An internal error has occurred."),
+    503: ("UNAVAILABLE", "The model is overloaded. Please try again later."),
+}
+
+
+def parse_latency(spec):
+    """
+    Build a latency sampler (seconds) from a spec string:
+
+    fixed:0.2 | uniform:0.1,0.8 | normal:0.5,0.1 | lognormal:-0.7,0.6
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda rng: rng.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def parse_errors(spec):
+    """Parse "429=0.05,500=0.02,timeout=0.01" into {kind: probability}"""
+    errors = {}
+    for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+        kind, _, rate = item.partition("=")
+        errors[kind if kind == "timeout" else int(kind)] = float(rate)
+    return errors
+
+
+class FakeAPIError(Exception):
+    """Raised by FakeGenaiClient; carries the HTTP code like google.genai.errors.APIError"""
+
+    def __init__(self, code, status, message):
+        super().__init__(f"{code} {status}. {message}")
+        self.code = code
+        self.status = status
+
+
+class FakeBehavior:
+    """Latency, error and response settings, optionally overridden per model"""
+
+    def __init__(self, latency="fixed:0", errors=None, mode="echo", canned_text="Thanks for sharing! 😊",
+                 timeout_seconds=60.0, chunks=4, seed=None, model_latency=None):
+        self.latency = parse_latency(latency)
+        self.model_latency = {model: parse_latency(spec) for model, spec in (model_latency or {}).items()}
+        self.errors = parse_errors(errors) if isinstance(errors, str) else dict(errors or {})
+        self.mode = mode
+        self.canned_text = canned_text
+        self.timeout_seconds = timeout_seconds
+        self.chunks = chunks
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def plan(self, model):
+        """Decide (delay, error) for one request: error is None, an HTTP code or "timeout" """
+        with self._lock:
+            self.requests += 1
+            sampler = self.model_latency.get(model, self.latency)
+            delay = sampler(self._rng)
+            roll = self._rng.random()
+        for kind, rate in self.errors.items():
+            if roll < rate:
+                if kind == "timeout":
+                    return self.timeout_seconds, "timeout"
+                return delay, kind
+            roll -= rate
+        return delay, None
+
+    def reply_text(self, prompt):
+        if self.mode == "canned":
+            return self.canned_text
+        return f"[fake] {prompt[:200]}"
+
+    def split(self, text):
+        size = max(1, -(-len(text) // self.chunks))
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def response_body(text):
+    return {
+        "candidates": [{
+            "content": {"role": "model", "parts": [{"text": text}]},
+            "finishReason": "STOP",
+            "index": 0,
+        }],
+        "usageMetadata": {"promptTokenCount": 0, "candidatesTokenCount": len(text) // 4},
+    }
+
+
+def error_body(code):
+    status, message = ERROR_STATUS.get(code, ("UNKNOWN", "Injected error."))
+    return {"error": {"code": code, "message": message, "status": status}}
+
+
+def prompt_text(payload):
+    """Concatenate the text parts of a generateContent request body"""
+    parts = []
+    for content in payload.get("contents", []):
+        for part in content.get("parts", []):
+            parts.append(part.get("text", ""))
+    return "".join(parts)
+
+
+# ---------------- HTTP SERVER ----------------
+ENDPOINT = re.compile(r"^/[^/]+/models/(?P<model>[^:/]+):(?P<method>generateContent|streamGenerateContent)")
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    behavior = FakeBehavior()
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, code, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        match = ENDPOINT.match(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if not match:
+            self.send_json(404, error_body(404))
+            return
+
+        delay, error = self.behavior.plan(match.group("model"))
+        time.sleep(delay)
+        if error == "timeout":
+            return
+        if error is not None:
+            self.send_json(error, error_body(error))
+            return
+
+        text = self.behavior.reply_text(prompt_text(payload))
+        if match.group("method") == "generateContent":
+            self.send_json(200, response_body(text))
+            return
+
+        # Server-sent events, one candidate chunk per event
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for chunk in self.behavior.split(text):
+            self.wfile.write(f"data: {json.dumps(response_body(chunk))}\r\n\r\n".encode("utf-8"))
+            self.wfile.flush()
+
+
+def start_server(behavior, host="127.0.0.1", port=0):
+    """Start the fake API on a daemon thread; returns the server (see server.server_port)"""
+    handler = type("Handler", (FakeGeminiHandler,), {"behavior": behavior})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-gemini", daemon=True).start()
+    return server
+
+
+# ---------------- IN-PROCESS CLIENT ----------------
+class _Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeModels:
+    def __init__(self, behavior):
+        self.behavior = behavior
+
+    def _run(self, model, contents):
+        delay, error = self.behavior.plan(model)
+        time.sleep(delay)
+        if error == "timeout":
+            raise TimeoutError(f"Request to {model} timed out")
+        if error is not None:
+            status, message = ERROR_STATUS.get(error, ("UNKNOWN", "Injected error."))
+            raise FakeAPIError(error, status, message)
+        return self.behavior.reply_text(contents if isinstance(contents, str) else str(contents))
+
+    def generate_content(self, model, contents, config=None):
+        return _Chunk(self._run(model, contents))
+
+    def generate_content_stream(self, model, contents, config=None):
+        for chunk in self.behavior.split(self._run(model, contents)):
+            yield _Chunk(chunk)
+
+
+class FakeGenaiClient:
+    """Drop-in for genai.Client in tests: client.models.generate_content(...)"""
+
+    def __init__(self, behavior=None):
+        self.behavior = behavior or FakeBehavior()
+        self.models = _FakeModels(self.behavior)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fake Gemini API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", default="lognormal:-0.7,0.6", help="fixed:S | uniform:A,B | normal:MU,SD | lognormal:MU,SIGMA")
+    parser.add_argument("--model-latency", action="append", default=[], help="MODEL=SPEC, e.g. gemini-2.0-flash-exp=lognormal:0,1")
+    parser.add_argument("--errors", default="", help="e.g. 429=0.05,500=0.02,timeout=0.01")
+    parser.add_argument("--mode", choices=["echo", "canned"], default="echo")
+    parser.add_argument("--canned-text", default="Thanks for sharing! 😊")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    behavior = FakeBehavior(
+        latency=args.latency,
+        errors=args.errors,
+        mode=args.mode,
+        canned_text=args.canned_text,
+        seed=args.seed,
+        model_latency=dict(item.split("=", 1) for item in args.model_latency),
+    )
+    server = start_server(behavior, args.host, args.port)
+    print(f"🤖 Fake Gemini API listening on http://{args.host}:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Process-wide Google GenAI client with a bounded, keep-alive HTTP pool
+"""
+
+import threading
+from contextlib import contextmanager
+
+from config import (
+    GEMINI_BASE_URL,
+    GEMINI_POOL_MAX_CONNECTIONS,
+    GEMINI_POOL_MAX_KEEPALIVE,
+    GEMINI_POOL_KEEPALIVE_EXPIRY,
+    GEMINI_TIMEOUT_SECONDS,
+)
+from lazy_imports import lazy_import
+
+
+class PoolStats:
+    """Counters used to size the connection pool for our concurrency"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.client = None
+
+    @contextmanager
+    def track(self):
+        """Wrap every Gemini call so in-flight and peak concurrency are recorded"""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def open_connections(self):
+        """Connections currently held by the httpx pool (None if not inspectable)"""
+        try:
+            pool = self.client._api_client._httpx_client._transport._pool
+            return len(pool.connections)
+        except AttributeError:
+            return None
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "max_connections": GEMINI_POOL_MAX_CONNECTIONS,
+                "max_keepalive_connections": GEMINI_POOL_MAX_KEEPALIVE,
+                "open_connections": self.open_connections(),
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+            }
+
+
+pool_stats = PoolStats()
+
+
+def create_client(api_key):
+    """Build a genai.Client whose HTTP connections are reused across calls"""
+    genai = lazy_import("google.genai")
+    types = lazy_import("google.genai.types")
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=GEMINI_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=GEMINI_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=GEMINI_POOL_KEEPALIVE_EXPIRY,
+    )
+    base_options = {"timeout": int(GEMINI_TIMEOUT_SECONDS * 1000)}
+    if GEMINI_BASE_URL:
+        # e.g. the local stand-in from fake_gemini.py
+        base_options["base_url"] = GEMINI_BASE_URL
+
+    try:
+        http_options = types.HttpOptions(client_args={"limits": limits}, **base_options)
+        client = genai.Client(api_key=api_key, http_options=http_options)
+    except (TypeError, ValueError):
+        # Older google-genai releases don't accept client_args
+        client = genai.Client(api_key=api_key, http_options=types.HttpOptions(**base_options))
+
+    pool_stats.client = client
+    return client
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def shared_client(api_key):
+    """One client per API key for the whole process (app sessions and warm-up)"""
+    with _clients_lock:
+        if api_key not in _clients:
+            _clients[api_key] = create_client(api_key)
+        return _clients[api_key]
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Pre-generated pool of AI greeting / encouragement responses
+
+Run as a batch job to (re)build the pool on disk:
+
+    python greeting_pool.py --count 40
+
+At runtime replies are served from memory in O(1) and the pool is
+refreshed in a background thread once it is older than
+GREETING_POOL_MAX_AGE.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+
+from config import (
+    GREETING_KEYWORDS,
+    GREETING_POOL_PATH,
+    GREETING_POOL_MAX_AGE,
+    GREETING_POOL_RETRY,
+    GREETING_POOL_SIZE,
+)
+from lexicon import LEXICON
+from utils import parse_json_reply
+
+ENCOURAGEMENT_KEY = "default"
+# Every (kind, key) a complete pool has
+POOL_KEYS = [("greeting", keyword) for keyword in GREETING_KEYWORDS] + [("encouragement", ENCOURAGEMENT_KEY)]
+
+
+def greeting_prompt(keyword, count):
+    return (
+        f"You are a friendly HR assistant. The user said: '{keyword}'. "
+        f"Write {count} different warm, professional and brief replies (one or two sentences each, "
+        "you may use one emoji). Return only a JSON array of strings."
+    )
+
+
+def encouragement_prompt(count):
+    return (
+        "You are an HR assistant acknowledging a job candidate's answer to a technical question. "
+        f"Write {count} different short, encouraging acknowledgements (under 10 words, you may use one emoji). "
+        "Return only a JSON array of strings."
+    )
+
+
+def parse_response_list(text):
+    """Parse a JSON array of strings from a model reply, tolerating code fences"""
+    items = parse_json_reply(text)
+    if not isinstance(items, list):
+        return []
+    return [item.strip() for item in items if isinstance(item, str) and item.strip()]
+
+
+def match_keyword(text):
+    """Return the longest greeting keyword contained in the message"""
+    matches = LEXICON.scan(text).terms("greeting")
+    return max(matches, key=len) if matches else None
+
+
+def generate_pool(generate, count=GREETING_POOL_SIZE, keys=POOL_KEYS):
+    """
+    Build a fresh pool (or just `keys`) using `generate(prompt) -> str`.
+
+    Keys whose generation fails are left out so the caller can keep the
+    previous responses for them.
+    """
+    pool = {"greeting": {}, "encouragement": {}}
+    for kind, key in keys:
+        prompt = greeting_prompt(key, count) if kind == "greeting" else encouragement_prompt(count)
+        try:
+            responses = parse_response_list(generate(prompt))
+        except Exception as e:
+            print(f"Greeting pool error for {kind} '{key}': {e}")
+            continue
+        if responses:
+            pool[kind][key] = responses
+    return pool
+
+
+class GreetingPool:
+    """In-memory view of the pool file with background refresh"""
+
+    def __init__(self, path=GREETING_POOL_PATH, max_age=GREETING_POOL_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._pool = None
+        self._generated_at = 0.0
+        # kind -> key -> generation time
+        self._updated = {}
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._last_attempt = 0.0
+
+    def _load(self):
+        if self._pool is not None:
+            return self._pool
+        with self._lock:
+            if self._pool is None:
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        data = json.load(f)
+                    self._pool = data.get("pool", {})
+                    self._generated_at = data.get("generated_at", 0.0)
+                    self._updated = data.get("updated", {})
+                except (OSError, ValueError):
+                    self._pool = {}
+        return self._pool
+
+    def pick(self, kind, text=None):
+        """Random pooled response for a greeting message or kind, or None"""
+        section = self._load().get(kind, {})
+        key = ENCOURAGEMENT_KEY if kind == "encouragement" else match_keyword(text or "")
+        responses = section.get(key)
+        return random.choice(responses) if responses else None
+
+    def stale_keys(self):
+        """(kind, key) pairs that are missing or older than max_age"""
+        pool = self._load()
+        now = time.time()
+        with self._lock:
+            return [
+                (kind, key) for kind, key in POOL_KEYS
+                if key not in pool.get(kind, {})
+                or now - self._updated.get(kind, {}).get(key, self._generated_at) > self.max_age
+            ]
+
+    def is_stale(self):
+        return bool(self.stale_keys())
+
+    def update(self, pool):
+        """Merge a freshly generated pool and persist it atomically"""
+        with self._lock:
+            merged = {kind: dict(section) for kind, section in (self._pool or {}).items()}
+            now = time.time()
+            for kind, section in pool.items():
+                merged.setdefault(kind, {}).update(section)
+                for key in section:
+                    self._updated.setdefault(kind, {})[key] = now
+            self._pool = merged
+            # Keys missing after a partial refresh (e.g. quota ran out) stay stale and are retried
+            if all(key in merged.get(kind, {}) for kind, key in POOL_KEYS):
+                self._generated_at = now
+            data = {"generated_at": self._generated_at, "updated": self._updated, "pool": merged}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def refresh_if_stale(self, generate, retry_interval=GREETING_POOL_RETRY):
+        """
+        Regenerate the stale keys on a daemon thread (at most one at a time).
+        `generate` should draw on a low-priority budget so live turns win.
+        """
+        if not self.is_stale():
+            return False
+        with self._lock:
+            if self._refreshing or time.time() - self._last_attempt < retry_interval:
+                return False
+            self._refreshing = True
+            self._last_attempt = time.time()
+
+        def run():
+            try:
+                self.update(generate_pool(generate, keys=self.stale_keys()))
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="greeting-pool-refresh", daemon=True).start()
+        return True
+
+
+# Shared by every Streamlit session in this process
+greeting_pool = GreetingPool()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from dotenv import load_dotenv
+    from gemini_client import create_client
+
+    parser = argparse.ArgumentParser(description="Generate the AI greeting pool")
+    parser.add_argument("--count", type=int, default=GREETING_POOL_SIZE, help="responses per keyword")
+    parser.add_argument("--model", default="gemini-1.5-flash")
+    args = parser.parse_args()
+
+    load_dotenv()
+    client = create_client(os.getenv("GOOGLE_API_KEY"))
+
+    def generate(prompt):
+        return client.models.generate_content(model=args.model, contents=prompt).text
+
+    print("🤖 Generating greeting pool")
+    print("=" * 50)
+    pool = generate_pool(generate, args.count)
+    greeting_pool.update(pool)
+    for kind, section in pool.items():
+        for key, responses in section.items():
+            print(f"{kind:>13} | {key:<15} | {len(responses)} responses")
+    print(f"\n✅ Saved to {greeting_pool.path}")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Hedged requests: fire a backup model when the primary is slow
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from config import HEDGE_DELAY, HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_WORKERS
+
+
+class LatencyTracker:
+    """Rolling window of call latencies (seconds)"""
+
+    def __init__(self, window=200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, fraction):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        # Nearest rank: the smallest sample with at least `fraction` of samples at or below it
+        index = min(len(samples) - 1, max(0, math.ceil(fraction * len(samples)) - 1))
+        return samples[index]
+
+
+class Hedger:
+    """
+    Runs the primary call and, if it hasn't succeeded within the hedge delay,
+    races a backup call against it. The first successful result wins; the
+    loser is cancelled if still queued, otherwise its result is discarded.
+
+    The delay is either a fixed number of seconds or "p90"-style, i.e. the
+    configured percentile of recent primary latencies. Only primaries run
+    through call() are timed, so long batch calls (grading, the greeting
+    pool) don't inflate the delay used for interactive replies.
+    """
+
+    def __init__(self, delay=HEDGE_DELAY, percentile=HEDGE_PERCENTILE, min_samples=HEDGE_MIN_SAMPLES,
+                 max_workers=HEDGE_WORKERS, default_delay=2.0):
+        self.fixed_delay = None if str(delay).lower().startswith("p") else float(delay)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.latency = LatencyTracker()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.backup_wins = 0
+
+    def delay(self):
+        """Seconds to wait for the primary before firing the backup"""
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        if len(self.latency) < self.min_samples:
+            return self.default_delay
+        return self.latency.percentile(self.percentile)
+
+    def call(self, primary, backup):
+        """Return the first successful result of primary() / backup()"""
+        with self._lock:
+            self.calls += 1
+
+        first = self._executor.submit(self._timed, primary)
+        done, _ = wait([first], timeout=self.delay())
+        if done and first.exception() is None:
+            return first.result()
+
+        with self._lock:
+            self.hedged += 1
+
+        last_error = first.exception() if done else None
+        racing = {} if done else {first: "primary"}
+        racing[self._executor.submit(backup)] = "backup"
+
+        while racing:
+            finished, _ = wait(racing, return_when=FIRST_COMPLETED)
+            for future in finished:
+                label = racing.pop(future)
+                if future.exception() is None:
+                    for loser in racing:
+                        loser.cancel()
+                    if label == "backup":
+                        with self._lock:
+                            self.backup_wins += 1
+                    return future.result()
+                last_error = future.exception()
+
+        raise last_error
+
+    def _timed(self, primary):
+        started = time.monotonic()
+        result = primary()
+        # Recorded even when the backup already won: it is the primary's real latency
+        self.latency.record(time.monotonic() - started)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "backup_wins": self.backup_wins,
+                "hedge_delay": self.delay(),
+            }
+
+
+# Shared by every Streamlit session in this process
+hedger = Hedger()
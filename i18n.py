@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Pre-translated bot prompts
+
+Bot-facing strings are looked up in gettext catalogs compiled from
+locale/<lang>/LC_MESSAGES/talentscout.po. Each .mo file is loaded the first
+time its language is needed and then shared by every session in the
+process, so replying in the candidate's language costs no LLM call.
+
+    python i18n.py extract   # refresh locale/talentscout.pot from the sources
+    python i18n.py compile   # .po -> .mo
+    python i18n.py check     # untranslated messages per language
+"""
+
+import ast
+import argparse
+import array
+import functools
+import gettext
+import os
+import struct
+import sys
+
+from config import I18N_LANGUAGES, LOCALE_DIR
+
+DOMAIN = "talentscout"
+PO_HEADER = "Content-Type: text/plain; charset=UTF-8\n"
+# Files scanned by `extract`, and the calls that mark translatable strings
+SOURCE_FILES = ["app.py", "app_clean.py", "app_fixed.py", "prompts.py", "fallback_responses.py", "grading.py"]
+MARKERS = {"N_", "tr", "translate"}
+
+
+def N_(message):
+    """Mark a string for extraction; it is translated where it's used"""
+    return message
+
+
+def normalize_language(lang):
+    """langdetect code ("es", "zh-cn") -> catalog name ("es", "zh")"""
+    return (lang or "en").split("-")[0].split("_")[0].lower()
+
+
+def mo_path(lang, locale_dir=LOCALE_DIR):
+    return os.path.join(locale_dir, lang, "LC_MESSAGES", f"{DOMAIN}.mo")
+
+
+@functools.lru_cache(maxsize=None)
+def catalog(lang, locale_dir=LOCALE_DIR, languages=tuple(I18N_LANGUAGES)):
+    """The compiled catalog for a language, loaded once per process"""
+    lang = normalize_language(lang)
+    path = mo_path(lang, locale_dir)
+    if lang not in languages or not os.path.exists(path):
+        return gettext.NullTranslations()
+    with open(path, "rb") as f:
+        return gettext.GNUTranslations(f)
+
+
+def translate(message, lang):
+    return catalog(normalize_language(lang)).gettext(message)
+
+
+# ---------------- CATALOG TOOLS ----------------
+def extract_messages(paths):
+    """Translatable string constants passed to the MARKERS, in source order"""
+    messages = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        calls = sorted(
+            (node for node in ast.walk(tree)
+             if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in MARKERS
+             and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)),
+            key=lambda node: node.lineno,
+        )
+        for node in calls:
+            messages.setdefault(node.args[0].value, f"{path}:{node.lineno}")
+    return messages
+
+
+def po_quote(text):
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\t", "\\t")
+    lines = escaped.split("\n")
+    if len(lines) == 1:
+        return f'"{escaped}"'
+    parts = [line + "\\n" for line in lines[:-1]] + ([lines[-1]] if lines[-1] else [])
+    return '""\n' + "\n".join(f'"{part}"' for part in parts)
+
+
+def write_po(path, entries, header=PO_HEADER):
+    """entries: [(msgid, msgstr, reference)]"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'msgid ""\nmsgstr {po_quote(header)}\n')
+        for msgid, msgstr, reference in entries:
+            f.write(f"\n#: {reference}\nmsgid {po_quote(msgid)}\nmsgstr {po_quote(msgstr)}\n")
+
+
+def read_po(path):
+    """{msgid: msgstr} from a .po file (header included under "")"""
+    entries = {}
+    msgid = msgstr = None
+    target = None
+
+    def flush():
+        if msgid is not None:
+            entries[msgid] = msgstr or ""
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("msgid "):
+                flush()
+                msgid, msgstr, target = ast.literal_eval(line[6:]), None, "id"
+            elif line.startswith("msgstr "):
+                msgstr, target = ast.literal_eval(line[7:]), "str"
+            elif line.startswith('"') and target == "id":
+                msgid += ast.literal_eval(line)
+            elif line.startswith('"') and target == "str":
+                msgstr += ast.literal_eval(line)
+    flush()
+    return entries
+
+
+def write_mo(path, entries):
+    """GNU .mo writer; untranslated entries are left out so lookups fall back to English"""
+    entries = {k: v for k, v in entries.items() if v}
+    keys = sorted(entries)
+    ids = strs = b""
+    offsets = []
+    for key in keys:
+        msgid, msgstr = key.encode("utf-8"), entries[key].encode("utf-8")
+        offsets.append((len(ids), len(msgid), len(strs), len(msgstr)))
+        ids += msgid + b"\0"
+        strs += msgstr + b"\0"
+
+    keystart = 7 * 4 + 16 * len(keys)
+    valuestart = keystart + len(ids)
+    koffsets, voffsets = [], []
+    for id_offset, id_length, str_offset, str_length in offsets:
+        koffsets += [id_length, id_offset + keystart]
+        voffsets += [str_length, str_offset + valuestart]
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(struct.pack("Iiiiiii", 0x950412DE, 0, len(keys), 7 * 4, 7 * 4 + len(keys) * 8, 0, 0))
+        f.write(array.array("i", koffsets + voffsets).tobytes())
+        f.write(ids)
+        f.write(strs)
+
+
+def po_paths(locale_dir=LOCALE_DIR):
+    for lang in sorted(os.listdir(locale_dir)):
+        path = os.path.join(locale_dir, lang, "LC_MESSAGES", f"{DOMAIN}.po")
+        if os.path.exists(path):
+            yield lang, path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the translated prompt catalogs")
+    parser.add_argument("command", choices=["extract", "compile", "check"])
+    args = parser.parse_args()
+
+    if args.command == "extract":
+        messages = extract_messages(SOURCE_FILES)
+        write_po(os.path.join(LOCALE_DIR, f"{DOMAIN}.pot"), [(m, "", ref) for m, ref in messages.items()])
+        print(f"✅ {len(messages)} messages -> {LOCALE_DIR}/{DOMAIN}.pot")
+        return 0
+
+    if args.command == "compile":
+        for lang, path in po_paths():
+            write_mo(mo_path(lang), read_po(path))
+            print(f"✅ {path} -> {mo_path(lang)}")
+        return 0
+
+    messages = extract_messages(SOURCE_FILES)
+    missing_any = False
+    for lang, path in po_paths():
+        translated = read_po(path)
+        missing = [m for m in messages if not translated.get(m)]
+        missing_any = missing_any or bool(missing)
+        print(f"{'❌' if missing else '✅'} {lang}: {len(messages) - len(missing)}/{len(messages)} translated")
+        for message in missing:
+            print(f"    {messages[message]}: {message[:60]!r}")
+    return 1 if missing_any else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
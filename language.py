@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Per-session language detection
+
+langdetect is slow and meaningless on emails, phone numbers or "5", so
+SessionLanguage only runs it when a message is real prose and the
+session's current guess has lost confidence. The detector is seeded so
+the same text always gets the same answer.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+from config import (
+    LANGUAGE_MIN_CONFIDENCE,
+    LANGUAGE_CONFIDENCE_DECAY,
+    LANGUAGE_SHORT_TEXT,
+    LANGUAGE_SEED,
+)
+from lazy_imports import lazy_import
+
+DEFAULT_LANGUAGE = "en"
+# Screening fields whose answers say nothing about the candidate's language
+SKIP_FIELDS = {"name", "email", "phone", "experience", "location", "tech_stack"}
+
+EMAIL_RE = re.compile(r"^\S+@\S+\.\S+$")
+URL_RE = re.compile(r"^(https?://|www\.)\S+$", re.I)
+LETTER_RE = re.compile(r"[^\W\d_]")
+
+_seed_lock = threading.Lock()
+_seeded = False
+
+
+def is_linguistic(text):
+    """False for input langdetect can't judge: numbers, emails, URLs, single tokens"""
+    text = text.strip()
+    if not text or EMAIL_RE.match(text) or URL_RE.match(text):
+        return False
+    letters = len(LETTER_RE.findall(text))
+    return letters >= 3 and letters >= len(text) / 2 and len(text.split()) >= 2
+
+
+def detect_probabilities(text):
+    """[(language, probability), ...] from the seeded langdetect model"""
+    global _seeded
+    langdetect = lazy_import("langdetect")
+    if not _seeded:
+        with _seed_lock:
+            # DetectorFactory is process-wide; seeding makes detection deterministic
+            langdetect.DetectorFactory.seed = LANGUAGE_SEED
+            _seeded = True
+    return [(guess.lang, guess.prob) for guess in langdetect.detect_langs(text)]
+
+
+class SessionLanguage:
+    """
+    The candidate's language for one session.
+
+    Each message that could carry evidence decays the confidence in the
+    current guess; langdetect runs again only once it falls below
+    min_confidence, or straight away when non-ASCII text arrives in a
+    session believed to be English. Texts already seen are remembered and
+    add no new evidence: they return the session's current language.
+    """
+
+    def __init__(self, detect=detect_probabilities, min_confidence=LANGUAGE_MIN_CONFIDENCE,
+                 decay=LANGUAGE_CONFIDENCE_DECAY, short_text=LANGUAGE_SHORT_TEXT, memo_size=128):
+        self._detect = detect
+        self.min_confidence = min_confidence
+        self.decay = decay
+        self.short_text = short_text
+        self.memo_size = memo_size
+        self.language = DEFAULT_LANGUAGE
+        self.confidence = 0.0
+        self._memo = OrderedDict()
+        self.detections = 0
+        self.skipped = 0
+
+    def detect(self, text, field=None):
+        """Language of the session after seeing `text` (answer to `field`)"""
+        if field in SKIP_FIELDS or not is_linguistic(text):
+            self.skipped += 1
+            return self.language
+
+        key = " ".join(text.lower().split())
+        if key in self._memo:
+            # The session may have moved on since; report where it is now
+            self._memo.move_to_end(key)
+            return self.language
+
+        ascii_text = text.isascii()
+        if ascii_text and len(text) < self.short_text:
+            # Too short for n-gram statistics; keep the current guess
+            return self._remember(key, self.language)
+
+        self.confidence *= self.decay
+        if not ascii_text and self.language == DEFAULT_LANGUAGE:
+            self.confidence = 0.0
+        if self.confidence < self.min_confidence:
+            self._redetect(text)
+        return self._remember(key, self.language)
+
+    def _redetect(self, text):
+        self.detections += 1
+        try:
+            guesses = self._detect(text)
+        except Exception:
+            # langdetect missing, or no features in the text
+            return
+        if guesses:
+            self.language, self.confidence = max(guesses, key=lambda guess: guess[1])
+
+    def _remember(self, key, language):
+        self._memo[key] = language
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return language
+
+    def stats(self):
+        return {
+            "language": self.language,
+            "confidence": round(self.confidence, 3),
+            "detections": self.detections,
+            "skipped": self.skipped,
+        }
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Lazy loading of heavy dependencies and startup import profiling
+
+google.genai, textblob and langdetect are imported on first use instead of
+at app start. STARTUP_PROFILE=true logs how long each import took.
+
+Measure cold import times (each module in a fresh interpreter):
+
+    python lazy_imports.py [--budget-ms 1500] [module ...]
+"""
+
+import argparse
+import builtins
+import importlib
+import importlib.util
+import subprocess
+import sys
+import threading
+import time
+
+from config import STARTUP_PROFILE
+
+# Modules imported before the first paint of app.py
+EAGER_MODULES = [
+    "streamlit", "dotenv", "assets", "chat_history", "config", "gemini_client", "grading",
+    "greeting_pool", "hedging", "llm_worker", "rate_limiter", "response_cache", "run_stats",
+    "session_store", "singleflight", "transcript",
+]
+# Loaded lazily on first use
+LAZY_MODULES = ["google.genai", "textblob", "langdetect"]
+
+_lock = threading.Lock()
+# Seconds spent importing each lazily loaded module
+lazy_import_times = {}
+
+
+def is_installed(name):
+    """True if `name` can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_import(name):
+    """
+    Import a module on first use. sys.modules caches it for the process;
+    the lock keeps concurrent sessions from timing the same import twice.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        if name in sys.modules:
+            return sys.modules[name]
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        lazy_import_times[name] = time.perf_counter() - started
+    if STARTUP_PROFILE:
+        print(f"[startup-profile] lazy import {name}: {lazy_import_times[name] * 1000:.0f} ms")
+    return module
+
+
+class StartupProfiler:
+    """
+    Times every first-time import between start() and stop() by wrapping
+    builtins.__import__. Times are cumulative (a module includes the
+    imports it triggers), like the cumulative column of -X importtime.
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self.total = None
+        self._original_import = None
+        self._started = None
+        self._done = False
+
+    @property
+    def running(self):
+        return self._original_import is not None
+
+    def start(self):
+        """Begin profiling; later calls (reruns) are no-ops"""
+        if self._done or self.running:
+            return
+        original = self._original_import = builtins.__import__
+        self._started = time.perf_counter()
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            started = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                self.timings.setdefault(name, time.perf_counter() - started)
+
+        builtins.__import__ = timed_import
+
+    def stop(self):
+        if not self.running:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+        self.total = time.perf_counter() - self._started
+        self._done = True
+
+    def report(self, top=15):
+        """Slowest imports first, as (module, seconds)"""
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    def format_report(self, top=15):
+        lines = [f"[startup-profile] first script run: {(self.total or 0) * 1000:.0f} ms"]
+        lines += [f"[startup-profile]   {seconds * 1000:8.1f} ms  {name}" for name, seconds in self.report(top)]
+        return "\n".join(lines)
+
+
+startup_profiler = StartupProfiler()
+
+
+def cold_import_time(name):
+    """Seconds to import `name` in a fresh interpreter"""
+    code = f"import time; t = time.perf_counter(); import {name}; print(time.perf_counter() - t)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time per module")
+    parser.add_argument("modules", nargs="*", help="modules to time (default: app.py's eager and lazy imports)")
+    parser.add_argument("--budget-ms", type=float, help="fail if the eager imports together exceed this")
+    args = parser.parse_args()
+
+    print("🧪 Cold import times")
+    print("=" * 50)
+
+    eager_total = 0.0
+    for name in args.modules or EAGER_MODULES + LAZY_MODULES:
+        seconds = cold_import_time(name)
+        lazy = name in LAZY_MODULES
+        if seconds is None:
+            print(f"{'':>10}  {name} (not installed)")
+            continue
+        if not lazy:
+            eager_total += seconds
+        print(f"{seconds * 1000:8.1f} ms  {name}{' (lazy)' if lazy else ''}")
+
+    # Modules share dependencies, so the sum is an upper bound
+    print(f"eager imports, upper bound: {eager_total * 1000:.0f} ms")
+    if args.budget_ms is not None and eager_total * 1000 > args.budget_ms:
+        print(f"❌ over the {args.budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
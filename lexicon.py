@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Keyword lexicon compiled into one word-boundary regex
+
+Sentiment, greeting and fallback-intent detection all scan a message once
+through the shared LEXICON instead of running `word in text` per list.
+Matching is on whole words, so "like" no longer matches "unlikely".
+"""
+
+import functools
+import re
+
+from config import GREETING_KEYWORDS
+
+CATEGORIES = {
+    # analyze_sentiment
+    "positive": ["happy", "excited", "great", "excellent", "amazing", "wonderful", "good", "love", "like", "awesome", "fantastic"],
+    "negative": ["sad", "angry", "frustrated", "disappointed", "terrible", "awful", "bad", "hate", "dislike", "worried", "stressed"],
+    "nervous": ["nervous", "anxious", "worried", "scared", "afraid", "tension", "stress", "panic", "overwhelmed", "intimidated", "jittery", "uneasy", "apprehensive", "restless", "fidgety"],
+    "excited": ["excited", "thrilled", "pumped", "enthusiastic", "energetic", "eager", "stoked", "hyped", "elated", "ecstatic", "overjoyed", "exhilarated"],
+    # detect_greeting, greeting pool
+    "greeting": GREETING_KEYWORDS,
+    # get_fallback_response intents
+    "enthusiasm": ["excited", "happy", "great", "awesome", "wonderful", "amazing", "fantastic"],
+    "worry": ["nervous", "worried", "scared", "anxious", "concerned", "afraid"],
+    "start": ["start", "begin", "apply", "application", "applications", "screening"],
+    "tech": ["python", "javascript", "java", "react", "node", "sql", "programming", "coding", "developer", "engineer"],
+    "experience": ["experience", "years", "worked", "job", "jobs", "position", "positions", "role", "roles"],
+}
+
+
+def trie_pattern(terms):
+    """
+    Regex for a set of terms, factored by common prefix ("ha(?:ppy|te)").
+    Python's re then tries one branch per character instead of every
+    alternative at every position; longer terms still win.
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [(r"\s+" if char == " " else re.escape(char)) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return build(trie)
+
+
+class LexiconMatch:
+    """Terms found in one message, grouped by category"""
+
+    def __init__(self, found, first_position):
+        self._found = found
+        self._first_position = first_position
+
+    def has(self, category):
+        return category in self._found
+
+    def count(self, category):
+        """Distinct terms of the category present in the message"""
+        return len(self._found.get(category, ()))
+
+    def terms(self, category):
+        return list(self._found.get(category, ()))
+
+    def first_position(self, category):
+        """Offset of the category's first match, or None"""
+        return self._first_position.get(category)
+
+
+class Lexicon:
+    """
+    Category -> terms, compiled into a single prefix-factored regex.
+
+    The longest term wins, so multi-word phrases ("good morning") beat
+    their prefixes; a term may belong to several categories.
+
+    scan() memoizes recent messages, so the sentiment, greeting and
+    fallback detectors share one pass over each message.
+    """
+
+    def __init__(self, categories):
+        self.categories = {name: list(terms) for name, terms in categories.items()}
+        self._term_categories = {}
+        for name, terms in self.categories.items():
+            for term in terms:
+                self._term_categories.setdefault(term.lower(), []).append(name)
+
+        self._regex = re.compile(rf"\b{trie_pattern(self._term_categories)}\b")
+        self.scan = functools.lru_cache(maxsize=256)(self.match)
+
+    def match(self, text):
+        """Uncached single pass over the message"""
+        found = {}
+        first_position = {}
+        for match in self._regex.finditer(text.lower()):
+            term = " ".join(match.group().split())
+            for category in self._term_categories[term]:
+                found.setdefault(category, {})[term] = None
+                first_position.setdefault(category, match.start())
+        return LexiconMatch(found, first_position)
+
+
+LEXICON = Lexicon(CATEGORIES)
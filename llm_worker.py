@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Bounded background worker pool for LLM calls
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import LLM_WORKERS, LLM_MAX_PENDING, LLM_JOB_TIMEOUT
+
+
+class LLMJob:
+    """A submitted LLM call and the time it was queued"""
+
+    def __init__(self, future, timeout):
+        self.future = future
+        self.timeout = timeout
+        self.submitted_at = time.monotonic()
+
+    def expired(self):
+        return time.monotonic() - self.submitted_at > self.timeout
+
+
+class LLMWorkerPool:
+    """
+    Runs LLM jobs off the Streamlit script thread.
+
+    At most `max_pending` jobs (running + queued) exist across all sessions;
+    submit() returns None instead of queueing more, so a Gemini slowdown
+    can't pile up work on the server.
+    """
+
+    def __init__(self, max_workers=LLM_WORKERS, max_pending=LLM_MAX_PENDING, job_timeout=LLM_JOB_TIMEOUT):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.job_timeout = job_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-worker")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs); returns an LLMJob or None when saturated"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return None
+        with self._lock:
+            self.pending += 1
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._release)
+        return LLMJob(future, self.job_timeout)
+
+    def _release(self, future):
+        self._slots.release()
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def poll(self, job):
+        """Return ("pending", None), ("done", result) or ("timeout", None)"""
+        if job.future.done():
+            try:
+                return "done", job.future.result()
+            except Exception as e:
+                print(f"LLM job error: {e}")
+                return "done", None
+        if job.expired():
+            job.future.cancel()
+            with self._lock:
+                self.timed_out += 1
+            return "timeout", None
+        return "pending", None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+
+
+# Shared by every Streamlit session in this process
+llm_workers = LLMWorkerPool()
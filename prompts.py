@@ -1,9 +1,12 @@
-def get_prompt(prompt_type):
+from i18n import N_, translate
+
+
+def get_prompt(prompt_type, lang="en"):
     prompts = {
-        "greeting": (
+        "greeting": N_(
             "Hello! 👋 Welcome to TalentScout Hiring Assistant.\n\n"
             "I will collect some basic information and then ask technical questions.\n\n"
             "Let's start with your **Full Name**:"
         )
     }
-    return prompts.get(prompt_type, "")
\ No newline at end of file
+    return translate(prompts[prompt_type], lang) if prompt_type in prompts else ""
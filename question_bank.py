@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Technical question bank loaded from QUESTION_BANK_PATH
+
+Every question is tagged with a technology, a difficulty and a topic. The
+file is read once per process and indexed as tech -> difficulty ->
+question positions, so picking questions for a stack is a few dict
+lookups regardless of the bank's size.
+
+    python question_bank.py              # questions per technology
+    python question_bank.py --bench 50000
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+from config import QUESTION_BANK_PATH
+
+DIFFICULTIES = ("easy", "medium", "hard")
+# Tech id of the questions used when a stack has too few specific ones
+GENERAL = "general"
+
+Question = namedtuple("Question", ["id", "tech", "difficulty", "topic", "text"])
+
+# Used when the bank file is missing, unreadable or has no general questions,
+# so a screening always has questions to ask
+BUILTIN_GENERAL = [
+    Question("builtin-general-1", GENERAL, "easy", "problem-solving", "Describe your problem-solving approach."),
+    Question("builtin-general-2", GENERAL, "easy", "debugging", "How do you handle debugging complex issues?"),
+    Question("builtin-general-3", GENERAL, "easy", "version-control", "What's your experience with version control?"),
+    Question("builtin-general-4", GENERAL, "easy", "learning", "How do you stay updated with new technologies?"),
+]
+
+
+def resolve_path(path):
+    """Relative bank paths are taken from the app directory, not the working directory"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+
+
+def difficulties_for(experience):
+    """Difficulties to draw from, best fit first, for a free-text years-of-experience answer"""
+    match = re.search(r"\d+(?:\.\d+)?", experience or "")
+    if match is None:
+        return ("medium", "easy", "hard")
+    years = float(match.group())
+    if years < 2:
+        return ("easy", "medium", "hard")
+    if years < 5:
+        return ("medium", "easy", "hard")
+    return ("hard", "medium", "easy")
+
+
+class QuestionBank:
+    """
+    Questions plus the indexes built from them.
+
+    Positions into self.questions are the internal ids; the by-tech index
+    holds them as tuples per difficulty so sampling never copies the bank.
+    """
+
+    def __init__(self, questions):
+        self.questions = []
+        self._positions = {}
+        self._index = {}
+        for question in questions:
+            if question.difficulty not in DIFFICULTIES:
+                raise ValueError(f"{question.id}: unknown difficulty {question.difficulty!r}")
+            if question.id in self._positions:
+                raise ValueError(f"duplicate question id {question.id!r}")
+            self._positions[question.id] = len(self.questions)
+            self._index.setdefault(question.tech, {}).setdefault(question.difficulty, []).append(len(self.questions))
+            self.questions.append(question)
+        self._index = {
+            tech: {difficulty: tuple(positions) for difficulty, positions in by_difficulty.items()}
+            for tech, by_difficulty in self._index.items()
+        }
+        self.load_seconds = 0.0
+        self.skipped = 0
+
+    @classmethod
+    def load(cls, path=QUESTION_BANK_PATH):
+        """
+        Read a JSONL bank. Malformed records (bad JSON, missing fields,
+        unknown difficulty, duplicate id) are skipped with a warning and
+        counted in `skipped`. If the file can't be read or has no general
+        questions, BUILTIN_GENERAL is used for them (and a warning printed).
+        """
+        started = time.perf_counter()
+        path = resolve_path(path)
+        questions = []
+        seen_ids = set()
+        skipped = 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        question = Question(record["id"], record["tech"].lower(), record["difficulty"],
+                                            record.get("topic", ""), record["question"])
+                        if question.difficulty not in DIFFICULTIES:
+                            raise ValueError(f"unknown difficulty {question.difficulty!r}")
+                        if question.id in seen_ids:
+                            raise ValueError(f"duplicate question id {question.id!r}")
+                    except (ValueError, KeyError, TypeError, AttributeError) as e:
+                        skipped += 1
+                        print(f"Skipping {path}:{line_number}: bad question record ({e!r})")
+                        continue
+                    seen_ids.add(question.id)
+                    questions.append(question)
+        except OSError as e:
+            print(f"Question bank unavailable ({e}); using the built-in general questions")
+        if not any(question.tech == GENERAL for question in questions):
+            if questions:
+                print(f"Question bank {path} has no '{GENERAL}' questions; using the built-in ones")
+            questions.extend(BUILTIN_GENERAL)
+        bank = cls(questions)
+        bank.skipped = skipped
+        bank.load_seconds = time.perf_counter() - started
+        return bank
+
+    def __contains__(self, tech):
+        return tech in self._index
+
+    def __len__(self):
+        return len(self.questions)
+
+    def techs(self):
+        return sorted(self._index)
+
+    def get(self, question_id):
+        return self.questions[self._positions[question_id]]
+
+    def ids(self, tech, difficulty=None):
+        """Question ids for a tech, optionally of one difficulty"""
+        by_difficulty = self._index.get(tech, {})
+        difficulties = DIFFICULTIES if difficulty is None else (difficulty,)
+        return [self.questions[p].id for d in difficulties for p in by_difficulty.get(d, ())]
+
+    def sample(self, tech, count, difficulties=DIFFICULTIES, rng=random):
+        """
+        Up to `count` random questions for a tech, drawn from the first
+        difficulty that has enough and preferring distinct topics.
+        """
+        by_difficulty = self._index.get(tech, {})
+        candidates = []
+        for difficulty in difficulties:
+            positions = by_difficulty.get(difficulty, ())
+            # A few spares per slot so repeated topics can be skipped
+            candidates.extend(rng.sample(positions, min(len(positions), count * 3)))
+            if len(candidates) >= count * 3:
+                break
+
+        picked, topics, repeats = [], set(), []
+        for position in candidates:
+            question = self.questions[position]
+            if question.topic in topics:
+                repeats.append(question)
+                continue
+            topics.add(question.topic)
+            picked.append(question)
+            if len(picked) == count:
+                break
+        picked.extend(repeats[:count - len(picked)])
+        return picked
+
+    def stats(self):
+        return {
+            "questions": len(self.questions),
+            "techs": len(self._index),
+            "skipped": self.skipped,
+            "load_ms": round(self.load_seconds * 1000, 1),
+        }
+
+
+question_bank = QuestionBank.load()
+
+
+def synthetic_bank(path, count, techs=200, seed=0):
+    """Write a bank of `count` generated questions (for benchmarks)"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            tech = f"tech{i % techs}"
+            record = {"id": f"{tech}-{i}", "tech": tech, "difficulty": rng.choice(DIFFICULTIES),
+                      "topic": f"topic{rng.randrange(12)}", "question": f"Synthetic question {i} about {tech}?"}
+            f.write(json.dumps(record) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or benchmark the technical question bank")
+    parser.add_argument("--bench", type=int, metavar="N", help="load and query a synthetic bank of N questions")
+    args = parser.parse_args()
+
+    if not args.bench:
+        for tech in question_bank.techs():
+            counts = ", ".join(f"{d} {len(question_bank.ids(tech, d))}" for d in DIFFICULTIES)
+            print(f"{tech:>18}: {counts}")
+        print(question_bank.stats())
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bank.jsonl")
+        synthetic_bank(path, args.bench)
+        bank = QuestionBank.load(path)
+    rounds = 10_000
+    started = time.perf_counter()
+    for i in range(rounds):
+        bank.sample(f"tech{i % 200}", 2, difficulties_for("3 years"))
+    elapsed = time.perf_counter() - started
+    print(f"🧪 Loaded {len(bank):,} questions in {bank.load_seconds * 1000:.1f} ms")
+    print(f"sample(): {elapsed / rounds * 1e6:.1f} µs per technology")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Quota-aware rate limiting and circuit breaking in front of the Gemini API
+"""
+
+import threading
+import time
+
+from config import (
+    GEMINI_RPM,
+    GEMINI_TPM,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+)
+
+
+class RateLimited(Exception):
+    """Raised when the guard refuses a call because of quota or an open breaker"""
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) used against the TPM budget"""
+    return max(1, len(text) // 4)
+
+
+def is_quota_or_server_error(error):
+    """True for 429 / 5xx errors, which mean the API itself is unavailable"""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if isinstance(code, int):
+        return code == 429 or 500 <= code < 600
+    message = str(error)
+    return any(marker in message for marker in ("429", "RESOURCE_EXHAUSTED", "500", "502", "503", "504", "UNAVAILABLE"))
+
+
+def is_transport_error(error):
+    """True for timeouts and connection failures (stdlib or httpx), where the API never answered"""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    names = {cls.__name__ for cls in type(error).__mro__}
+    return bool(names & {"TimeoutException", "TransportError", "NetworkError"})
+
+
+class TokenBucket:
+    """Refills `rate_per_minute` tokens per minute up to `capacity`"""
+
+    def __init__(self, rate_per_minute, capacity=None, clock=time.monotonic):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = float(self.capacity)
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self, amount=1):
+        self._refill()
+        return self.tokens >= amount
+
+    def consume(self, amount=1):
+        self.tokens -= amount
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive API failures.
+
+    While open every request is rejected; after `reset_timeout` seconds a
+    single half-open probe is let through and its outcome closes or re-opens
+    the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def allow_request(self):
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self._clock() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.probe_in_flight = False
+
+    def release_probe(self):
+        """The call ended without an outcome (e.g. an abandoned stream); let another probe through"""
+        self.probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = self._clock()
+
+
+class GeminiGuard:
+    """Shared RPM/TPM limiter plus circuit breaker for all Gemini calls"""
+
+    def __init__(self, rpm=GEMINI_RPM, tpm=GEMINI_TPM, failure_threshold=BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout=BREAKER_RESET_TIMEOUT, clock=time.monotonic):
+        self.requests = TokenBucket(rpm, clock=clock)
+        self.tokens = TokenBucket(tpm, clock=clock)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, clock=clock)
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def acquire(self, prompt, reserve=0):
+        """
+        Reserve quota for one call; False means skip the network and use a fallback.
+        Low-priority callers pass `reserve` and only proceed while that many
+        requests would still be left for everyone else.
+        """
+        cost = estimate_tokens(prompt)
+        with self._lock:
+            if not (self.requests.available(1 + reserve) and self.tokens.available(cost)):
+                self.rejected += 1
+                return False
+            if not self.breaker.allow_request():
+                self.rejected += 1
+                return False
+            self.requests.consume()
+            self.tokens.consume(cost)
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.breaker.record_success()
+
+    def release(self):
+        with self._lock:
+            self.breaker.release_probe()
+
+    def record_failure(self, error):
+        with self._lock:
+            if is_quota_or_server_error(error) or is_transport_error(error):
+                self.breaker.record_failure()
+            else:
+                # The API answered (e.g. a 400), so it is reachable
+                self.breaker.record_success()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "breaker_state": self.breaker.state,
+                "consecutive_failures": self.breaker.failures,
+                "requests_available": int(self.requests.tokens),
+                "tokens_available": int(self.tokens.tokens),
+                "rejected": self.rejected,
+            }
+
+
+# Shared by every Streamlit session in this process
+gemini_guard = GeminiGuard()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Process-wide cache for AI responses (LRU + per-context TTL)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from config import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS, CACHE_DEFAULT_TTL
+
+
+def normalize_message(text):
+    """Lowercase, trim and collapse whitespace so "Hi " and "hi" share an entry"""
+    return " ".join(text.lower().split()).strip(" .!?")
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache keyed on (context, normalized message, model).
+
+    Entries expire after the TTL configured for their context; a TTL of 0
+    disables caching for that context.
+    """
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttls=None, default_ttl=CACHE_DEFAULT_TTL, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttls = dict(CACHE_TTL_SECONDS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, context):
+        return self.ttls.get(context, self.default_ttl)
+
+    def make_key(self, context, user_message, model):
+        return (context, normalize_message(user_message), model)
+
+    def get(self, context, user_message, model):
+        """Return the cached response or None on a miss/expired entry"""
+        if self.ttl_for(context) <= 0:
+            return None
+        key = self.make_key(context, user_message, model)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, context, user_message, model, value):
+        ttl = self.ttl_for(context)
+        if ttl <= 0 or value is None:
+            return
+        key = self.make_key(context, user_message, model)
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Shared by every Streamlit session in this process
+response_cache = ResponseCache()
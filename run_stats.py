@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Process-wide count of Streamlit script and fragment executions, and a
+throttled logger for the service counters
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+
+from config import STATS_LOG_INTERVAL
+
+
+class ScriptRunStats:
+    """Incremented at the top of app.py on every script run and in each fragment"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.fragment_runs = Counter()
+
+    def record_run(self):
+        with self._lock:
+            self.runs += 1
+
+    def record_fragment_run(self, name):
+        with self._lock:
+            self.fragment_runs[name] += 1
+
+
+class PeriodicStatsLog:
+    """Prints a stats snapshot at most once per `interval` seconds, however many sessions ask"""
+
+    def __init__(self, interval, clock=time.monotonic):
+        self.interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last = None
+
+    def maybe_log(self, collect):
+        """Call collect() and print its result if the interval has passed; True when it did"""
+        if self.interval <= 0:
+            return False
+        now = self._clock()
+        with self._lock:
+            if self._last is not None and now - self._last < self.interval:
+                return False
+            self._last = now
+        print(f"[stats] {json.dumps(collect(), default=str, sort_keys=True)}")
+        return True
+
+
+script_run_stats = ScriptRunStats()
+# Shared by every session in this process, so the log is throttled process-wide
+stats_log = PeriodicStatsLog(STATS_LOG_INTERVAL)
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Server-side conversation state keyed by a session token
+
+Backends store one versioned JSON document per session. SessionStore adds
+a write-through cache in front, so rehydrating a session normally only
+reads the version from the backend.
+"""
+
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from config import (
+    SESSION_BACKEND,
+    SESSION_DB_PATH,
+    SESSION_CACHE_SIZE,
+    SESSION_CACHE_TTL,
+    SESSION_MEMORY_MAX,
+    SESSION_IDLE_TTL,
+)
+from transcript import BoundedTranscript
+
+# st.session_state keys that make up a conversation
+SESSION_FIELDS = ("chat", "step", "data", "tech_questions", "current_question_index", "question_answers", "reply_language")
+
+
+def new_token():
+    return secrets.token_urlsafe(16)
+
+
+def decode_state(document, backend, token):
+    """Parse a stored document; chat comes back as a transcript or a list of (role, message) tuples"""
+    state = json.loads(document)
+    if isinstance(state.get("chat"), dict):
+        state["chat"] = BoundedTranscript.from_document(state["chat"], backend, token)
+    elif "chat" in state:
+        state["chat"] = [tuple(message) for message in state["chat"]]
+    return state
+
+
+def encode_value(value):
+    if isinstance(value, BoundedTranscript):
+        return value.to_document()
+    return value
+
+
+class MemoryBackend:
+    """
+    Sessions in a dict; lost on restart and not shared between processes.
+    Keeps at most `max_sessions`, dropping the least recently used, and
+    forgets sessions idle for longer than `idle_ttl` seconds. Spilled
+    transcript chunks stay compressed in memory and go with their session.
+    """
+
+    def __init__(self, max_sessions=SESSION_MEMORY_MAX, idle_ttl=SESSION_IDLE_TTL, clock=time.monotonic):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self._clock = clock
+        self._documents = OrderedDict()
+        self._spills = {}
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def _evict(self, token):
+        del self._documents[token]
+        self._spills.pop(token, None)
+        self.evicted += 1
+
+    def _get(self, token):
+        entry = self._documents.get(token)
+        if entry is None:
+            return None
+        if self._clock() - entry[2] > self.idle_ttl:
+            self._evict(token)
+            return None
+        return entry
+
+    def load(self, token):
+        """(document, version) or None"""
+        with self._lock:
+            entry = self._get(token)
+            if entry is None:
+                return None
+            self._documents[token] = (entry[0], entry[1], self._clock())
+            self._documents.move_to_end(token)
+            return entry[0], entry[1]
+
+    def version(self, token):
+        with self._lock:
+            entry = self._get(token)
+            return entry[1] if entry else None
+
+    def save(self, token, document):
+        """Store the document and return its new version"""
+        with self._lock:
+            entry = self._get(token)
+            version = entry[1] + 1 if entry else 1
+            self._documents[token] = (document, version, self._clock())
+            self._documents.move_to_end(token)
+            while len(self._documents) > self.max_sessions:
+                self._evict(next(iter(self._documents)))
+            return version
+
+    def save_spill(self, token, start, blob):
+        with self._lock:
+            self._spills.setdefault(token, {})[start] = blob
+
+    def load_spill(self, token):
+        """[(start, blob)] in message order"""
+        with self._lock:
+            return sorted(self._spills.get(token, {}).items())
+
+    def delete_spill(self, token):
+        with self._lock:
+            self._spills.pop(token, None)
+
+    def delete(self, token):
+        with self._lock:
+            self._documents.pop(token, None)
+            self._spills.pop(token, None)
+
+
+class SQLiteBackend:
+    """
+    Sessions in a SQLite database in WAL mode, so replicas sharing the
+    file can read while one of them writes. One connection per thread.
+    Each save bumps the row's version, so cached copies can be checked.
+    Spilled transcript chunks are compressed blobs in transcript_chunks.
+    """
+
+    def __init__(self, path=SESSION_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "token TEXT PRIMARY KEY, document TEXT NOT NULL, updated_at REAL NOT NULL, "
+                "version INTEGER NOT NULL DEFAULT 1)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+            if "version" not in columns:
+                conn.execute("ALTER TABLE sessions ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcript_chunks ("
+                "token TEXT NOT NULL, start INTEGER NOT NULL, messages BLOB NOT NULL, PRIMARY KEY (token, start))"
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, token):
+        """(document, version) or None"""
+        row = self._connect().execute("SELECT document, version FROM sessions WHERE token = ?", (token,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def version(self, token):
+        row = self._connect().execute("SELECT version FROM sessions WHERE token = ?", (token,)).fetchone()
+        return row[0] if row else None
+
+    def save(self, token, document):
+        """Store the document and return its new version"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sessions (token, document, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(token) DO UPDATE SET document = excluded.document, "
+                "updated_at = excluded.updated_at, version = sessions.version + 1",
+                (token, document, time.time()),
+            )
+            # Same transaction, so this is the version of the row just written
+            return conn.execute("SELECT version FROM sessions WHERE token = ?", (token,)).fetchone()[0]
+
+    def save_spill(self, token, start, blob):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO transcript_chunks (token, start, messages) VALUES (?, ?, ?)",
+                (token, start, blob),
+            )
+
+    def load_spill(self, token):
+        """[(start, blob)] in message order"""
+        return self._connect().execute(
+            "SELECT start, messages FROM transcript_chunks WHERE token = ? ORDER BY start", (token,)
+        ).fetchall()
+
+    def delete_spill(self, token):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM transcript_chunks WHERE token = ?", (token,))
+
+    def tokens(self):
+        """Every stored session token, oldest update first"""
+        return [row[0] for row in self._connect().execute("SELECT token FROM sessions ORDER BY updated_at")]
+
+    def delete(self, token):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
+            conn.execute("DELETE FROM transcript_chunks WHERE token = ?", (token,))
+
+
+class SessionStore:
+    """
+    Write-through cache over a backend.
+
+    Saves go to the backend and the cache. A cached document is only used
+    while its version still matches the backend's, so a session that moved
+    to another replica and back is re-read instead of served stale; the
+    version lookup is much cheaper than reading and decoding the document.
+    Entries also expire after cache_ttl. Documents are cached as JSON text,
+    so callers always get a fresh copy they can mutate.
+    """
+
+    def __init__(self, backend, cache_size=SESSION_CACHE_SIZE, cache_ttl=SESSION_CACHE_TTL, clock=time.monotonic):
+        self.backend = backend
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._clock = clock
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.stale_hits = 0
+        self.backend_reads = 0
+        self.writes = 0
+
+    def _remember(self, token, document, version):
+        with self._lock:
+            self._cache[token] = (document, version, self._clock() + self.cache_ttl)
+            self._cache.move_to_end(token)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def load(self, token):
+        """Return the stored state dict for token, or None"""
+        with self._lock:
+            entry = self._cache.get(token)
+            if entry and entry[2] <= self._clock():
+                entry = None
+
+        if entry:
+            if self.backend.version(token) == entry[1]:
+                with self._lock:
+                    if token in self._cache:
+                        self._cache.move_to_end(token)
+                    self.cache_hits += 1
+                return decode_state(entry[0], self.backend, token)
+            with self._lock:
+                self.stale_hits += 1
+
+        stored = self.backend.load(token)
+        with self._lock:
+            self.backend_reads += 1
+        if stored is None:
+            with self._lock:
+                self._cache.pop(token, None)
+            return None
+        document, version = stored
+        self._remember(token, document, version)
+        return decode_state(document, self.backend, token)
+
+    def new_transcript(self, token, messages=()):
+        """Empty (or pre-filled) chat transcript that spills into this store's backend"""
+        transcript = BoundedTranscript(self.backend, token)
+        transcript.extend(messages)
+        return transcript
+
+    def save(self, token, state):
+        document = json.dumps({key: encode_value(state[key]) for key in SESSION_FIELDS if key in state})
+        version = self.backend.save(token, document)
+        self._remember(token, document, version)
+        with self._lock:
+            self.writes += 1
+
+    def delete(self, token):
+        self.backend.delete(token)
+        with self._lock:
+            self._cache.pop(token, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "cached": len(self._cache),
+                "cache_hits": self.cache_hits,
+                "stale_hits": self.stale_hits,
+                "backend_reads": self.backend_reads,
+                "writes": self.writes,
+            }
+
+
+def create_store(backend=SESSION_BACKEND):
+    if backend == "sqlite":
+        return SessionStore(SQLiteBackend())
+    if backend == "memory":
+        return SessionStore(MemoryBackend())
+    raise ValueError(f"Unknown SESSION_BACKEND: {backend!r}")
+
+
+session_store = create_store()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Single-flight deduplication of identical in-flight LLM prompts
+"""
+
+import threading
+
+
+class Abandoned(Exception):
+    """The leader stopped before finishing, so followers only got part of the result"""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        # True only once the leader's function returned or its stream was exhausted
+        self.complete = False
+        self.waiters = 0
+        # Streamed calls: chunks so far, and a condition signalled on each one
+        self.chunks = []
+        self.changed = threading.Condition()
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (or exception).
+    stream() does the same for generators, replaying the leader's chunks to
+    followers as they arrive. If a streaming leader is abandoned partway,
+    do() followers run the call again and stream() followers get Abandoned
+    after the partial chunks, so nobody mistakes them for a full answer.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.collapsed = 0
+
+    def _join(self, key):
+        """(call, leader) for a key, registering a new call if none is in flight"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.collapsed += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+        return call, leader
+
+    def _finish(self, key, call):
+        with self._lock:
+            del self._calls[key]
+        with call.changed:
+            call.done.set()
+            call.changed.notify_all()
+
+    def do(self, key, fn):
+        call, leader = self._join(key)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if not call.complete:
+                return self.do(key, fn)
+            return call.result
+
+        try:
+            call.result = fn()
+            call.complete = True
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            self._finish(key, call)
+        return call.result
+
+    def stream(self, key, fn):
+        """
+        Generator version of do(): fn() returns an iterable of text chunks.
+        The leader yields them as they arrive; followers replay the same
+        chunks without calling fn. If the leader stops early, followers get
+        what was produced so far and then Abandoned.
+        """
+        call, leader = self._join(key)
+        if not leader:
+            yield from self._follow(call)
+            return
+
+        try:
+            for chunk in fn():
+                with call.changed:
+                    call.chunks.append(chunk)
+                    call.changed.notify_all()
+                yield chunk
+            call.result = "".join(call.chunks)
+            call.complete = True
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            # Also runs when the consumer abandons the stream (GeneratorExit)
+            if call.result is None and call.error is None:
+                call.result = "".join(call.chunks)
+            self._finish(key, call)
+
+    def _follow(self, call):
+        sent = 0
+        while True:
+            with call.changed:
+                while sent == len(call.chunks) and not call.done.is_set():
+                    call.changed.wait()
+                pending = call.chunks[sent:]
+                finished = call.done.is_set()
+            yield from pending
+            sent += len(pending)
+            if finished:
+                break
+        if call.error is not None:
+            raise call.error
+        if not call.complete:
+            raise Abandoned("leader stopped before the stream finished")
+        if not call.chunks and call.result:
+            # The leader was a plain do() call
+            yield call.result
+
+    def stats(self):
+        with self._lock:
+            total = self.executed + self.collapsed
+            return {
+                "in_flight": len(self._calls),
+                "executed": self.executed,
+                "collapsed": self.collapsed,
+                "collapse_rate": round(self.collapsed / total, 3) if total else 0.0,
+            }
+
+
+# Shared by every Streamlit session in this process
+llm_flights = SingleFlight()
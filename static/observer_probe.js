@@ -0,0 +1,34 @@
+// Counts MutationObserver callbacks for every observer on the page, so the
+// legacy and component sidebar scripts can be compared (OBSERVER_PROBE=true).
+// Must load before the observers it should measure are created.
+//
+// Read window.__observerProbe.perSecond, or watch the console output.
+(function () {
+    if (window.__observerProbe) {
+        return;
+    }
+
+    const probe = { total: 0, perSecond: 0, history: [] };
+    const NativeObserver = window.MutationObserver;
+
+    window.MutationObserver = function (callback) {
+        return new NativeObserver(function (mutations, observer) {
+            probe.total += 1;
+            return callback(mutations, observer);
+        });
+    };
+    window.MutationObserver.prototype = NativeObserver.prototype;
+
+    let last = 0;
+    setInterval(function () {
+        probe.perSecond = probe.total - last;
+        last = probe.total;
+        probe.history.push(probe.perSecond);
+        if (probe.history.length > 60) {
+            probe.history.shift();
+        }
+        console.info('[observer-probe] MutationObserver callbacks/s:', probe.perSecond);
+    }, 1000);
+
+    window.__observerProbe = probe;
+})();
@@ -0,0 +1,123 @@
+// Sidebar toggle component for the TalentScout app.
+//
+// Observes only the sidebar node (attributes) and its parent (childList,
+// no subtree), coalesces callbacks into one update per animation frame and
+// only touches the DOM when something actually differs, so its own
+// updates don't re-trigger it.
+//
+// Stats: window.__sidebarToggle.stats; set
+// sessionStorage.sidebarObserverDebug = '1' to log callbacks per second.
+(function () {
+    if (window.__sidebarToggle) {
+        window.__sidebarToggle.schedule();
+        return;
+    }
+
+    const SIDEBAR_SELECTOR = 'section[data-testid="stSidebar"]';
+    const COLLAPSED_CONTROL_SELECTOR = '[data-testid="collapsedControl"]';
+    const STORAGE_KEY = 'sidebarCollapsed';
+    const SIDEBAR_WIDTH = '320px';
+
+    const stats = { callbacks: 0, updates: 0, domWrites: 0, callbacksPerSecond: 0 };
+    let sidebar = null;
+    let button = null;
+    let frame = 0;
+
+    const sidebarObserver = new MutationObserver(schedule);
+    const parentObserver = new MutationObserver(schedule);
+
+    function schedule() {
+        stats.callbacks += 1;
+        if (!frame) {
+            frame = requestAnimationFrame(update);
+        }
+    }
+
+    function isCollapsed() {
+        return sessionStorage.getItem(STORAGE_KEY) === 'true';
+    }
+
+    function setStyle(element, property, value) {
+        if (element.style[property] !== value) {
+            element.style[property] = value;
+            stats.domWrites += 1;
+        }
+    }
+
+    function attach(node) {
+        sidebarObserver.disconnect();
+        parentObserver.disconnect();
+        sidebar = node;
+        if (sidebar) {
+            sidebarObserver.observe(sidebar, { attributes: true, attributeFilter: ['style', 'class', 'aria-expanded'] });
+            if (sidebar.parentElement) {
+                parentObserver.observe(sidebar.parentElement, { childList: true });
+            }
+        }
+    }
+
+    function ensureButton() {
+        if (button && document.body.contains(button)) {
+            return;
+        }
+        button = document.querySelector('.sidebar-toggle') || document.createElement('button');
+        button.className = 'sidebar-toggle';
+        button.title = 'Toggle Sidebar';
+        button.addEventListener('click', function () {
+            sessionStorage.setItem(STORAGE_KEY, isCollapsed() ? 'false' : 'true');
+            schedule();
+        });
+        document.body.appendChild(button);
+        stats.domWrites += 1;
+    }
+
+    function update() {
+        frame = 0;
+        stats.updates += 1;
+
+        const current = document.querySelector(SIDEBAR_SELECTOR);
+        if (current !== sidebar) {
+            attach(current);
+        }
+        if (!sidebar) {
+            // Streamlit hasn't rendered the sidebar yet
+            setTimeout(schedule, 250);
+            return;
+        }
+
+        setStyle(sidebar, 'display', 'block');
+        setStyle(sidebar, 'visibility', 'visible');
+        setStyle(sidebar, 'opacity', '1');
+        setStyle(sidebar, 'width', SIDEBAR_WIDTH);
+        setStyle(sidebar, 'minWidth', SIDEBAR_WIDTH);
+
+        const collapsedControl = document.querySelector(COLLAPSED_CONTROL_SELECTOR);
+        if (collapsedControl) {
+            setStyle(collapsedControl, 'display', 'none');
+        }
+
+        ensureButton();
+        const collapsed = isCollapsed();
+        const label = collapsed ? '>>' : '<<';
+        if (button.textContent !== label) {
+            button.textContent = label;
+            stats.domWrites += 1;
+        }
+        if (document.body.classList.contains('sidebar-collapsed') !== collapsed) {
+            document.body.classList.toggle('sidebar-collapsed', collapsed);
+            stats.domWrites += 1;
+        }
+    }
+
+    let lastCallbacks = 0;
+    setInterval(function () {
+        stats.callbacksPerSecond = stats.callbacks - lastCallbacks;
+        lastCallbacks = stats.callbacks;
+        if (sessionStorage.getItem('sidebarObserverDebug') === '1') {
+            console.debug('[sidebar-toggle] observer callbacks/s:', stats.callbacksPerSecond, stats);
+        }
+    }, 1000);
+
+    window.__sidebarToggle = { stats: stats, schedule: schedule };
+    schedule();
+})();
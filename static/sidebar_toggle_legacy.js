@@ -0,0 +1,81 @@
+// Previous sidebar script, kept for before/after measurements (SIDEBAR_SCRIPT=legacy).
+// Observes all of document.body and recreates the toggle on every mutation.
+// Enhanced sidebar visibility and toggle script
+function ensureSidebarVisible() {
+    const sidebar = document.querySelector('[data-testid="stSidebar"]');
+    const sidebarSection = document.querySelector('section[data-testid="stSidebar"]');
+    const collapsedControl = document.querySelector('[data-testid="collapsedControl"]');
+    
+    // Hide collapse control
+    if (collapsedControl) {
+        collapsedControl.style.display = 'none';
+    }
+    
+    // Force sidebar visibility
+    [sidebar, sidebarSection].forEach(element => {
+        if (element) {
+            element.style.display = 'block';
+            element.style.visibility = 'visible';
+            element.style.opacity = '1';
+            element.style.width = '320px';
+            element.style.minWidth = '320px';
+        }
+    });
+    
+    // Add sidebar toggle functionality
+    addSidebarToggle();
+}
+
+function addSidebarToggle() {
+    // Remove existing toggle if present
+    const existingToggle = document.querySelector('.sidebar-toggle');
+    if (existingToggle) {
+        existingToggle.remove();
+    }
+    
+    // Create toggle button
+    const toggleButton = document.createElement('button');
+    toggleButton.className = 'sidebar-toggle';
+    toggleButton.innerHTML = '<<';
+    toggleButton.title = 'Toggle Sidebar';
+    
+    // Add click handler
+    toggleButton.addEventListener('click', function() {
+        const body = document.body;
+        const isCollapsed = body.classList.contains('sidebar-collapsed');
+        
+        if (isCollapsed) {
+            body.classList.remove('sidebar-collapsed');
+            toggleButton.innerHTML = '<<';
+            // Store state
+            sessionStorage.setItem('sidebarCollapsed', 'false');
+        } else {
+            body.classList.add('sidebar-collapsed');
+            toggleButton.innerHTML = '>>';
+            // Store state
+            sessionStorage.setItem('sidebarCollapsed', 'true');
+        }
+    });
+    
+    // Add to page
+    document.body.appendChild(toggleButton);
+    
+    // Restore previous state
+    const savedState = sessionStorage.getItem('sidebarCollapsed');
+    if (savedState === 'true') {
+        document.body.classList.add('sidebar-collapsed');
+        toggleButton.innerHTML = '>>';
+    }
+}
+
+// Run on page load
+document.addEventListener('DOMContentLoaded', ensureSidebarVisible);
+
+// Run after Streamlit updates
+setTimeout(ensureSidebarVisible, 100);
+setTimeout(ensureSidebarVisible, 500);
+setTimeout(ensureSidebarVisible, 1000);
+
+// Watch for changes and re-apply
+const observer = new MutationObserver(ensureSidebarVisible);
+observer.observe(document.body, { childList: true, subtree: true });
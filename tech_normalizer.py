@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Free-text tech stack entries -> canonical technology ids
+
+"ReactJS", "node.js", "Python3" and "JS" resolve through a precomputed
+alias table; typos like "pyhton" through a SymSpell-style index of the
+canonical ids' (and a few aliases') deletion variants, within a small edit
+distance. Ids are the question bank's tech ids, so a normalized stack
+picks bank questions directly.
+
+    python tech_normalizer.py "ReactJS / node.js and pyhton"
+"""
+
+import functools
+import re
+import sys
+import time
+
+from question_bank import GENERAL, question_bank
+
+ALIASES = {
+    "python": ["py", "python3", "python 3", "cpython"],
+    "javascript": ["js", "ecmascript", "es6", "es2015", "vanilla js", "vanillajs"],
+    "typescript": ["ts"],
+    "react": ["reactjs", "react.js", "react js", "react native", "next.js", "nextjs"],
+    "angular": ["angularjs", "angular.js", "angular js"],
+    "vue": ["vuejs", "vue.js", "vue js", "nuxt", "nuxt.js"],
+    "node": ["nodejs", "node.js", "node js", "express", "expressjs", "express.js"],
+    "django": ["django rest framework", "drf"],
+    "fastapi": ["fast api"],
+    "java": ["java se", "java ee", "j2ee"],
+    "spring": ["spring boot", "springboot", "spring framework"],
+    "kotlin": ["kt"],
+    "csharp": ["c#", "c sharp", ".net", "dotnet", ".net core", "asp.net", "asp.net core"],
+    "go": ["golang", "go lang"],
+    "rust": ["rustlang"],
+    "cpp": ["c++", "cplusplus", "c plus plus"],
+    "sql": ["mysql", "sqlite", "t-sql", "tsql", "pl/sql", "plsql", "sql server", "mssql", "oracle"],
+    "postgresql": ["postgres", "psql", "pgsql"],
+    "mongodb": ["mongo", "mongoose"],
+    "kubernetes": ["k8s", "kube"],
+    "aws": ["amazon web services", "ec2", "s3", "lambda"],
+    "git": ["github", "gitlab", "bitbucket"],
+    "linux": ["unix", "ubuntu", "bash", "shell scripting"],
+    "html": ["html5"],
+    "css": ["css3", "sass", "scss", "tailwind", "tailwindcss"],
+    "graphql": ["graph ql", "apollo"],
+    "rest": ["rest api", "restful", "rest apis", "restful apis"],
+    "machine-learning": ["machine learning", "ml", "scikit-learn", "sklearn", "deep learning"],
+    "tensorflow": ["tf", "keras"],
+    "pytorch": ["torch"],
+}
+
+# Aliases the typo index also covers, besides the canonical ids. Only
+# distinctive spellings: a loose alias like "oracle" or "nextjs" would pull
+# other real names ("Gradle", "NestJS") onto the wrong technology
+FUZZY_ALIASES = {"reactjs", "nodejs", "vuejs", "angularjs", "golang", "postgres", "springboot", "dotnet"}
+
+# Split on commas, semicolons, pipes, bullets, newlines, "and", and on
+# slashes/ampersands with spaces around them
+SEPARATOR_RE = re.compile(r"[,;|•\n]+|\band\b|\s+-\s+|\s+[/&]\s+", re.IGNORECASE)
+# Unspaced slashes/ampersands split too ("React/Node.js"), unless the whole
+# entry is an alias or one of these terms
+JOINER_RE = re.compile(r"[/&]+")
+COMPOUND_TERMS = {"ci/cd", "r&d", "tcp/ip", "ui/ux", "i/o", "a/b testing", "pl/sql"}
+VERSION_RE = re.compile(r"\s*v?\d+(?:\.\d+)*$")
+PUNCTUATION_RE = re.compile(r"[\s.\-_]+")
+# Most edits tolerated in a long entry, and the length from which it applies
+MAX_TYPOS = 2
+LONG_KEY = 8
+
+
+def is_compound(entry):
+    """True for entries like "PL/SQL" or "CI/CD" whose slash or ampersand is part of the name"""
+    key = " ".join(entry.lower().split())
+    return key in COMPOUND_TERMS or key in tech_normalizer.aliases
+
+
+def split_stack(text):
+    """Stack entries from a free-text answer, in order, without blanks"""
+    entries = []
+    for piece in SEPARATOR_RE.split(text):
+        piece = piece.strip(" \t-*").rstrip(".")
+        parts = JOINER_RE.split(piece) if JOINER_RE.search(piece) and not is_compound(piece) else [piece]
+        for entry in parts:
+            entry = entry.strip(" \t-*").rstrip(".")
+            if entry:
+                entries.append(entry)
+    return entries
+
+
+def edit_distance(a, b):
+    """Levenshtein distance where swapping two adjacent characters counts as one edit"""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def deletes(word, depth):
+    """The word with up to `depth` characters removed"""
+    found = frontier = {word}
+    for _ in range(depth):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        found = found | frontier
+    return found
+
+
+class DeleteIndex:
+    """
+    SymSpell-style typo index: every word is stored under each of its
+    deletion variants, so a query only generates its own variants and
+    measures the distance to the few words that share one.
+    """
+
+    def __init__(self, words=(), max_distance=MAX_TYPOS):
+        self.max_distance = max_distance
+        self.index = {}
+        for word in words:
+            for variant in deletes(word, max_distance):
+                self.index.setdefault(variant, set()).add(word)
+
+    def search(self, word, max_distance):
+        """[(distance, word)] within max_distance, closest first"""
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variant in deletes(word, max_distance):
+            candidates.update(self.index.get(variant, ()))
+        found = [(edit_distance(word, candidate), candidate) for candidate in candidates]
+        return sorted(match for match in found if match[0] <= max_distance)
+
+
+def compact(key):
+    """Alias key without spaces, dots, dashes and underscores ("React.js" -> "reactjs")"""
+    return PUNCTUATION_RE.sub("", key)
+
+
+def max_typos(key):
+    """Edit distance tolerated for a key; short names are too easy to confuse ("jest" vs "rest")"""
+    if len(key) <= 4:
+        return 0
+    return 1 if len(key) < LONG_KEY else MAX_TYPOS
+
+
+class TechNormalizer:
+    """
+    Alias lookups first (exact, then without a version suffix, then
+    without punctuation), then the delete index for typos of the canonical
+    ids and `fuzzy_aliases`. A fuzzy match that is ambiguous between
+    technologies counts as unknown.
+    """
+
+    def __init__(self, canonical, aliases=ALIASES, fuzzy_aliases=FUZZY_ALIASES):
+        self.aliases = {}
+        for tech in canonical:
+            self.aliases[tech] = tech
+            self.aliases[compact(tech)] = tech
+        for tech, names in aliases.items():
+            if tech not in canonical:
+                continue
+            for name in names:
+                self.aliases[name] = tech
+                self.aliases[compact(name)] = tech
+        fuzzy = {compact(tech) for tech in canonical}
+        fuzzy.update(compact(name) for name in fuzzy_aliases if compact(name) in self.aliases)
+        self.typos = DeleteIndex(fuzzy)
+        self.alias_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self.normalize = functools.lru_cache(maxsize=1024)(self._normalize)
+
+    def _normalize(self, entry):
+        key = " ".join(entry.lower().split())
+        for candidate in (key, VERSION_RE.sub("", key), compact(key), compact(VERSION_RE.sub("", key))):
+            if candidate in self.aliases:
+                self.alias_hits += 1
+                return self.aliases[candidate]
+
+        key = compact(key)
+        matches = self.typos.search(key, max_typos(key))
+        if matches:
+            best = matches[0][0]
+            techs = {self.aliases[word] for distance, word in matches if distance == best}
+            if len(techs) == 1:
+                self.fuzzy_hits += 1
+                return techs.pop()
+        self.misses += 1
+        return None
+
+    def normalize_stack(self, entries):
+        """Canonical ids for known entries, lowercased text for the rest; duplicates dropped"""
+        techs = []
+        for entry in entries:
+            tech = self.normalize(entry) or entry.lower().strip()
+            if tech and tech not in techs:
+                techs.append(tech)
+        return techs
+
+    def stats(self):
+        return {
+            "aliases": len(self.aliases),
+            "alias_hits": self.alias_hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+        }
+
+
+tech_normalizer = TechNormalizer([tech for tech in question_bank.techs() if tech != GENERAL])
+
+
+def main():
+    text = " ".join(sys.argv[1:]) or "ReactJS / node.js and pyhton, C#, k8s, Haskell"
+    for entry in split_stack(text):
+        started = time.perf_counter()
+        # Uncached, to time the lookup itself
+        tech = tech_normalizer._normalize(entry)
+        elapsed = time.perf_counter() - started
+        print(f"{entry!r:>14} -> {tech or '?':<18} {elapsed * 1e6:7.1f} µs")
+    print(tech_normalizer.stats())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,32 @@
+from question_bank import GENERAL, difficulties_for, question_bank
+from tech_normalizer import split_stack, tech_normalizer
+
+
+def generate_questions(stack, experience="", count=4, per_tech=2):
+    """`count` screening questions for a list of technologies, padded with general ones"""
+    difficulties = difficulties_for(experience)
+    questions = []
+    # "ReactJS", "JS" and "pyhton" map to bank ids; duplicates like "JS, JavaScript" collapse
+    for tech in tech_normalizer.normalize_stack(stack):
+        if tech in question_bank and tech != GENERAL:
+            questions.extend(q.text for q in question_bank.sample(tech, per_tech, difficulties) if q.text not in questions)
+
+    # Add general questions if not enough tech-specific ones
+    if len(questions) < count:
+        questions.extend(q.text for q in question_bank.sample(GENERAL, count - len(questions), difficulties))
+
+    return questions[:count]
+
+
 def generate_technical_questions(tech_stack):
-    techs = [t.strip() for t in tech_stack.split(",")]
+    techs = split_stack(tech_stack)
 
     questions = []
     for tech in techs:
+        canonical = tech_normalizer.normalize(tech)
+        if canonical in question_bank:
+            questions.extend(q.text for q in question_bank.sample(canonical, 3))
+            continue
         questions.append(f"What are the core concepts of {tech}?")
         questions.append(f"Explain a real-world project where you used {tech}.")
         questions.append(f"What challenges have you faced while working with {tech}?")
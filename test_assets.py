@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test the minified, content-hashed theme asset
+"""
+
+import os
+import tempfile
+
+from assets import build_theme_asset, minify_css, script_loader_html, static_script, theme_loader_html
+
+
+def test_minify_css():
+    css = """
+    /* Sidebar */
+    [data-testid="stSidebar"] > div ,
+    .a:hover {
+        color: #fff !important;
+        margin: 0 auto;
+    }
+    """
+    assert minify_css(css) == '[data-testid="stSidebar"]>div,.a:hover{color:#fff !important;margin:0 auto}'
+
+
+def test_hashed_asset_changes_with_content():
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "theme.css")
+        static_dir = os.path.join(tmp, "static")
+
+        with open(source, "w") as f:
+            f.write(".stApp { color: red; }")
+        href, css = build_theme_asset(source, static_dir)
+        assert css == ".stApp{color:red}"
+        filename = href.split("/")[-1].split("?")[0]
+        with open(os.path.join(static_dir, filename)) as f:
+            assert f.read() == css
+
+        build_theme_asset.cache_clear()
+        with open(source, "w") as f:
+            f.write(".stApp { color: blue; }")
+        new_href, _ = build_theme_asset(source, static_dir)
+        assert new_href != href
+        build_theme_asset.cache_clear()
+
+
+def test_loader_html():
+    assert '"app/static/theme.abc.min.css"' in theme_loader_html(href="app/static/theme.abc.min.css")
+    assert '".stApp{color:red}"' in theme_loader_html(css=".stApp{color:red}")
+
+
+def test_sidebar_script_loader():
+    """Scripts are versioned by content and inline code can't close the tag"""
+    src, code = static_script("sidebar_toggle.js")
+    assert src.startswith("app/static/sidebar_toggle.js?v=")
+    assert "requestAnimationFrame" in code
+
+    html = script_loader_html("talentscout-probe", code="console.log('</script>')")
+    assert html.count("</script>") == 1
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Theme Asset")
+    print("=" * 50)
+
+    for test in [test_minify_css, test_hashed_asset_changes_with_content, test_loader_html, test_sidebar_script_loader]:
+        test()
+        print(f"✅ {test.__name__} passed")
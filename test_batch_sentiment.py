@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test batch sentiment scoring against the per-message rules
+"""
+
+import os
+import tempfile
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch_sentiment import CATEGORY_LABELS, read_transcripts, score_batch, synthetic_messages  # noqa: E402
+from lexicon import LEXICON  # noqa: E402
+from session_store import SessionStore, SQLiteBackend  # noqa: E402
+from transcript import BoundedTranscript  # noqa: E402
+
+
+def scalar_sentiment(text):
+    """app.py's analyze_sentiment"""
+    found = LEXICON.scan(text)
+    if found.has("nervous"):
+        return "nervous"
+    elif found.has("excited"):
+        return "excited"
+    elif found.count("positive") > found.count("negative"):
+        return "positive"
+    elif found.count("negative") > found.count("positive"):
+        return "negative"
+    return "neutral"
+
+
+MESSAGES = [
+    "I'm so EXCITED to be here!",
+    "Honestly a bit nervous, but excited too",
+    "Great, great, great - though it was a bad day",
+    "That seems unlikely",
+    "",
+    "I love Python but hate YAML, and the tooling is awful",
+    "good\x00bad",
+    "Worried.",
+]
+
+
+def test_matches_per_message_rules():
+    categories, polarity = score_batch(MESSAGES)
+    assert list(CATEGORY_LABELS[categories]) == [scalar_sentiment(m) for m in MESSAGES]
+    assert categories.dtype == np.int8
+    assert polarity.tolist() == pytest.approx([0.3, 0.3, 0.0, 0.0, 0.0, -0.3, 0.0, -0.3])
+
+
+def test_synthetic_batch_agrees_with_scalar():
+    messages = synthetic_messages(2000, seed=7)
+    categories, _ = score_batch(messages, chunk_size=300)
+    assert list(CATEGORY_LABELS[categories]) == [scalar_sentiment(m) for m in messages]
+
+
+def test_process_pool_preserves_order():
+    messages = synthetic_messages(1000, seed=3)
+    serial = score_batch(messages)
+    parallel = score_batch(messages, workers=2, chunk_size=250)
+    assert np.array_equal(serial[0], parallel[0])
+    assert np.array_equal(serial[1], parallel[1])
+
+
+def test_empty_batch():
+    categories, polarity = score_batch([])
+    assert len(categories) == 0 and len(polarity) == 0
+
+
+def test_read_transcripts():
+    """Spilled chunks and recent messages both come from the session backend"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SessionStore(SQLiteBackend(os.path.join(tmp, "sessions.db")))
+        transcript = BoundedTranscript(store.backend, "a", keep=2)
+        transcript.extend([("user", "hi"), ("assistant", "Hello!"), ("user", "I'm nervous"), ("user", "ok")])
+        assert transcript.spilled > 0
+        store.save("a", {"chat": transcript})
+        store.save("b", {"chat": [("user", "great")]})
+
+        backend = SQLiteBackend(os.path.join(tmp, "sessions.db"))
+        assert read_transcripts(backend, ["a"]) == ["hi", "I'm nervous", "ok"]
+        assert len(read_transcripts(backend, ["a"], role=None)) == 4
+        assert read_transcripts(backend) == ["hi", "I'm nervous", "ok", "great"]
+        assert read_transcripts(backend, ["missing"]) == []
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Batch Sentiment")
+    print("=" * 50)
+
+    for test in [test_matches_per_message_rules, test_synthetic_batch_agrees_with_scalar,
+                 test_process_pool_preserves_order, test_empty_batch, test_read_transcripts]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test the windowed chat history view
+"""
+
+from chat_history import ChatHistoryView, format_message, SEPARATOR
+from transcript import memory_report
+
+
+def make_chat(count):
+    return [("user" if i % 2 == 0 else "assistant", f"message {i}") for i in range(count)]
+
+
+def test_short_chat_has_no_archive():
+    view = ChatHistoryView(window=4, page_size=2)
+    chat = make_chat(3)
+    assert view.window_start(len(chat)) == 0
+    assert view.archive_markdown(chat) == ""
+
+
+def test_archive_hidden_until_loaded():
+    view = ChatHistoryView(window=4, page_size=2)
+    chat = make_chat(10)
+    assert view.window_start(len(chat)) == 6
+    assert view.archive_start(len(chat)) == 6
+    assert view.archive_markdown(chat) == ""
+
+
+def test_load_earlier_reveals_pages():
+    view = ChatHistoryView(window=4, page_size=2)
+    chat = make_chat(10)
+
+    view.load_earlier(len(chat))
+    assert view.archive_start(len(chat)) == 4
+    assert view.archive_markdown(chat) == SEPARATOR.join(format_message(r, m) for r, m in chat[4:6])
+
+    for _ in range(5):
+        view.load_earlier(len(chat))
+    assert view.archive_start(len(chat)) == 0
+    assert view.archive_markdown(chat).startswith(format_message(*chat[0]))
+
+
+def test_archive_grows_incrementally():
+    """Messages leaving the window are appended to the cached block"""
+    view = ChatHistoryView(window=4, page_size=100)
+    chat = make_chat(6)
+    view.load_earlier(len(chat))
+    first = view.archive_markdown(chat)
+    assert view._range == (0, 2)
+
+    chat.extend(make_chat(8)[6:])
+    second = view.archive_markdown(chat)
+    assert view._range == (0, 4)
+    assert second.startswith(first)
+    assert second.endswith("message 3")
+
+
+def test_only_the_revealed_range_is_kept():
+    view = ChatHistoryView(window=4, page_size=2)
+    chat = make_chat(100)
+    view.load_earlier(len(chat))
+    assert view.archive_markdown(chat) == SEPARATOR.join(format_message(r, m) for r, m in chat[94:96])
+    assert view._range == (94, 96)
+    assert "message 0" not in view._text
+    assert memory_report({"history_view": view}, ["history_view"])["history_view"] > len(view._text)
+
+
+def test_large_blocks_are_not_cached():
+    view = ChatHistoryView(window=4, page_size=100, max_cached=50)
+    chat = make_chat(50)
+    view.load_earlier(len(chat))
+    text = view.archive_markdown(chat)
+    assert text.startswith(format_message(*chat[0]))
+    assert view._text == "" and view._range == (0, 0)
+    assert view.archive_markdown(chat) == text
+
+
+def test_revealed_page_stays_anchored():
+    """New messages don't push the revealed page's oldest messages out"""
+    view = ChatHistoryView(window=4, page_size=2)
+    chat = make_chat(10)
+    view.load_earlier(len(chat))
+    first = view.archive_markdown(chat)
+    assert view._range == (4, 6)
+
+    chat.extend(make_chat(13)[10:])
+    second = view.archive_markdown(chat)
+    assert view._range == (4, 9)
+    assert second.startswith(first)
+    assert second.endswith("message 8")
+
+
+def test_loading_more_prepends_to_the_cached_block():
+    view = ChatHistoryView(window=4, page_size=2)
+    chat = make_chat(10)
+    view.load_earlier(len(chat))
+    first = view.archive_markdown(chat)
+    view.load_earlier(len(chat))
+    second = view.archive_markdown(chat)
+    assert view._range == (2, 6)
+    assert second.endswith(first)
+    assert second == SEPARATOR.join(format_message(r, m) for r, m in chat[2:6])
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Chat History Window")
+    print("=" * 50)
+
+    for test in [test_short_chat_has_no_archive, test_archive_hidden_until_loaded,
+                 test_load_earlier_reveals_pages, test_archive_grows_incrementally,
+                 test_only_the_revealed_range_is_kept, test_large_blocks_are_not_cached,
+                 test_revealed_page_stays_anchored, test_loading_more_prepends_to_the_cached_block]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test the local Gemini stand-in and use it for reproducible latency checks
+"""
+
+import json
+import time
+import urllib.error
+import urllib.request
+
+from fake_gemini import FakeAPIError, FakeBehavior, FakeGenaiClient, start_server
+from hedging import Hedger
+from rate_limiter import GeminiGuard
+
+REQUEST = {"contents": [{"role": "user", "parts": [{"text": "hello"}]}]}
+
+
+def post(server, path):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.server_port}{path}",
+        data=json.dumps(REQUEST).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.read().decode("utf-8")
+
+
+def test_generate_content_endpoint():
+    server = start_server(FakeBehavior(mode="canned", canned_text="Hi there!"))
+    try:
+        body = json.loads(post(server, "/v1beta/models/gemini-2.0-flash-exp:generateContent"))
+        assert body["candidates"][0]["content"]["parts"][0]["text"] == "Hi there!"
+
+        stream = post(server, "/v1beta/models/gemini-1.5-flash:streamGenerateContent?alt=sse")
+        events = [json.loads(line[len("data: "):]) for line in stream.split("\r\n") if line.startswith("data: ")]
+        assert "".join(e["candidates"][0]["content"]["parts"][0]["text"] for e in events) == "Hi there!"
+    finally:
+        server.shutdown()
+
+
+def test_injected_http_errors():
+    server = start_server(FakeBehavior(errors="429=1.0"))
+    try:
+        post(server, "/v1beta/models/gemini-2.0-flash-exp:generateContent")
+    except urllib.error.HTTPError as e:
+        assert e.code == 429
+        assert json.loads(e.read())["error"]["status"] == "RESOURCE_EXHAUSTED"
+    else:
+        raise AssertionError("expected a 429")
+    finally:
+        server.shutdown()
+
+
+def test_in_process_client():
+    client = FakeGenaiClient(FakeBehavior(mode="echo"))
+    assert client.models.generate_content(model="m", contents="hi").text == "[fake] hi"
+    assert "".join(c.text for c in client.models.generate_content_stream(model="m", contents="hello")) == "[fake] hello"
+
+    failing = FakeGenaiClient(FakeBehavior(errors={503: 1.0}))
+    try:
+        failing.models.generate_content(model="m", contents="hi")
+    except FakeAPIError as e:
+        assert e.code == 503
+    else:
+        raise AssertionError("expected a 503")
+
+
+def test_breaker_stops_calls_during_outage():
+    """With the API returning 429s, the breaker caps wasted round trips"""
+    client = FakeGenaiClient(FakeBehavior(errors={429: 1.0}))
+    guard = GeminiGuard(rpm=1000, tpm=10 ** 6, failure_threshold=3, reset_timeout=60)
+
+    for _ in range(20):
+        if not guard.acquire("hi"):
+            continue
+        try:
+            client.models.generate_content(model="gemini-2.0-flash-exp", contents="hi")
+        except FakeAPIError as e:
+            guard.record_failure(e)
+
+    assert client.behavior.requests == 3
+
+
+def test_hedging_cuts_tail_latency():
+    """A slow primary tail is bounded by the hedge delay plus the backup latency"""
+    client = FakeGenaiClient(FakeBehavior(latency="fixed:0.01", model_latency={"primary": "fixed:1.0"}))
+    hedger = Hedger(delay=0.05)
+
+    started = time.monotonic()
+    text = hedger.call(lambda: client.models.generate_content(model="primary", contents="hi").text,
+                       lambda: client.models.generate_content(model="backup", contents="hi").text)
+
+    assert text == "[fake] hi"
+    assert time.monotonic() - started < 0.5
+    assert hedger.stats()["backup_wins"] == 1
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Fake Gemini Backend")
+    print("=" * 50)
+
+    for test in [test_generate_content_endpoint, test_injected_http_errors, test_in_process_client,
+                 test_breaker_stops_calls_during_outage, test_hedging_cuts_tail_latency]:
+        test()
+        print(f"✅ {test.__name__} passed")
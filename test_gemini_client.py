@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Test Gemini connection pool statistics
+"""
+
+from gemini_client import PoolStats
+
+
+def test_pool_stats_tracking():
+    """In-flight, peak and error counts follow tracked calls"""
+    stats = PoolStats()
+
+    with stats.track():
+        with stats.track():
+            assert stats.snapshot()["in_flight"] == 2
+
+    try:
+        with stats.track():
+            raise RuntimeError("503 UNAVAILABLE")
+    except RuntimeError:
+        pass
+
+    snapshot = stats.snapshot()
+    assert snapshot["requests"] == 3
+    assert snapshot["errors"] == 1
+    assert snapshot["in_flight"] == 0
+    assert snapshot["peak_in_flight"] == 2
+    assert snapshot["open_connections"] is None
+
+
+if __name__ == "__main__":
+    test_pool_stats_tracking()
+    print("✅ test_pool_stats_tracking passed")
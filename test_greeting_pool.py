@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test the pre-generated greeting pool
+"""
+
+import json
+import os
+import tempfile
+
+from config import GREETING_KEYWORDS
+from greeting_pool import POOL_KEYS, GreetingPool, generate_pool, match_keyword, parse_response_list
+from rate_limiter import GeminiGuard
+
+
+def fake_generate(prompt):
+    if "technical question" in prompt:
+        return '```json\n["Nice answer! 👍", "Well put!"]\n```'
+    keyword = prompt.split("'")[1]
+    return json.dumps([f"{keyword.title()}! Welcome!", f"{keyword.title()} and hello!"])
+
+
+def test_parse_and_match():
+    assert parse_response_list('```json\n["a", " b ", 3]\n```') == ["a", "b"]
+    assert parse_response_list("not json") == []
+    assert match_keyword("Good morning!") == "good morning"
+    assert match_keyword("what's up") is None
+
+
+def test_generate_and_serve_from_disk():
+    """A generated pool is persisted and served without further LLM calls"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pool.json")
+        pool = GreetingPool(path=path, max_age=3600)
+        assert pool.pick("greeting", "hi") is None
+        assert pool.is_stale()
+
+        pool.update(generate_pool(fake_generate, count=2))
+        assert not pool.is_stale()
+
+        reloaded = GreetingPool(path=path, max_age=3600)
+        assert reloaded.pick("greeting", "Hola amigo") in ["Hola! Welcome!", "Hola and hello!"]
+        assert reloaded.pick("encouragement") in ["Nice answer! 👍", "Well put!"]
+
+
+def test_partial_pool_stays_stale():
+    """Keywords that failed to generate keep the pool stale for a retry"""
+    def flaky_generate(prompt):
+        if "'hi'" in prompt:
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+        return fake_generate(prompt)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = GreetingPool(path=os.path.join(tmp, "pool.json"), max_age=3600)
+        pool.update(generate_pool(flaky_generate, count=2))
+
+        assert pool.is_stale()
+        assert pool.pick("greeting", "hello") is not None
+        assert len(pool._load()["greeting"]) == len(GREETING_KEYWORDS) - 1
+
+
+def test_refresh_regenerates_only_missing_keys():
+    """A retry after a partial refresh asks only for what is missing"""
+    prompts = []
+
+    def counting_generate(prompt):
+        prompts.append(prompt)
+        return fake_generate(prompt)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = GreetingPool(path=os.path.join(tmp, "pool.json"), max_age=3600)
+        pool.update(generate_pool(fake_generate, count=2, keys=[("greeting", "hello")]))
+        assert pool.stale_keys() == [key for key in POOL_KEYS if key != ("greeting", "hello")]
+
+        pool.update(generate_pool(counting_generate, count=2, keys=pool.stale_keys()))
+        assert len(prompts) == len(POOL_KEYS) - 1
+        assert not pool.is_stale()
+        assert not GreetingPool(path=pool.path, max_age=3600).is_stale()
+
+
+def test_reserve_keeps_quota_for_live_calls():
+    guard = GeminiGuard(rpm=4, tpm=10000)
+    assert guard.acquire("pool", reserve=2)
+    assert guard.acquire("pool", reserve=2)
+    assert not guard.acquire("pool", reserve=2)
+    assert guard.acquire("live") and guard.acquire("live")
+    assert not guard.acquire("live")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Greeting Pool")
+    print("=" * 50)
+
+    for test in [test_parse_and_match, test_generate_and_serve_from_disk, test_partial_pool_stays_stale,
+                 test_refresh_regenerates_only_missing_keys, test_reserve_keeps_quota_for_live_calls]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test hedged requests across the primary and backup models
+"""
+
+import time
+
+from hedging import Hedger, LatencyTracker
+
+
+def slow(value, seconds):
+    def call():
+        time.sleep(seconds)
+        return value
+    return call
+
+
+def failing():
+    raise RuntimeError("503 UNAVAILABLE")
+
+
+def test_fast_primary_is_not_hedged():
+    hedger = Hedger(delay=0.5)
+    assert hedger.call(slow("primary", 0), slow("backup", 0)) == "primary"
+    assert hedger.stats()["hedged"] == 0
+
+
+def test_slow_primary_loses_to_backup():
+    hedger = Hedger(delay=0.02)
+    started = time.monotonic()
+
+    assert hedger.call(slow("primary", 0.5), slow("backup", 0.01)) == "backup"
+    assert time.monotonic() - started < 0.3
+    assert hedger.stats()["backup_wins"] == 1
+
+
+def test_failed_primary_fires_backup_immediately():
+    hedger = Hedger(delay=5)
+    assert hedger.call(failing, slow("backup", 0)) == "backup"
+
+
+def test_both_failing_raises():
+    hedger = Hedger(delay=0.01)
+    try:
+        hedger.call(failing, failing)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the last error to be raised")
+
+
+def test_percentile_delay():
+    """Without a fixed delay the hedge fires at the observed p90"""
+    hedger = Hedger(delay="p90", percentile=0.9, min_samples=10, default_delay=3.0)
+    assert hedger.delay() == 3.0
+
+    for i in range(1, 11):
+        hedger.latency.record(i / 10)
+    assert hedger.delay() == 0.9
+
+    tracker = LatencyTracker()
+    assert tracker.percentile(0.9) is None
+    for value in (3, 1, 2, 4):
+        tracker.record(value)
+    assert tracker.percentile(0.5) == 2
+    assert tracker.percentile(0.0) == 1
+    assert tracker.percentile(1.0) == 4
+
+
+def test_only_hedged_primaries_are_timed():
+    hedger = Hedger(delay=5)
+    hedger.call(slow("primary", 0.02), slow("backup", 0))
+    assert len(hedger.latency) == 1
+    assert hedger.latency.percentile(1.0) >= 0.02
+
+    # A failed primary has no latency worth hedging against
+    hedger.call(failing, slow("backup", 0))
+    assert len(hedger.latency) == 1
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Hedged Requests")
+    print("=" * 50)
+
+    for test in [test_fast_primary_is_not_hedged, test_slow_primary_loses_to_backup,
+                 test_failed_primary_fires_backup_immediately, test_both_failing_raises,
+                 test_percentile_delay, test_only_hedged_primaries_are_timed]:
+        test()
+        print(f"✅ {test.__name__} passed")
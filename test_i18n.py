@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the compiled prompt catalogs
+"""
+
+import os
+import re
+import tempfile
+
+import i18n
+from config import I18N_LANGUAGES
+from fallback_responses import get_fallback_response
+from prompts import get_prompt
+
+PLACEHOLDER_RE = re.compile(r"\{\w+\}")
+
+
+def test_po_round_trip_through_mo():
+    entries = [
+        ("Hello!", "¡Hola!", "app.py:1"),
+        ('Type "go"\nthen wait', 'Escribe "go"\ny espera', "app.py:2"),
+        ("Untranslated", "", "app.py:3"),
+    ]
+    with tempfile.TemporaryDirectory() as locale_dir:
+        po_path = os.path.join(locale_dir, "es", "LC_MESSAGES", f"{i18n.DOMAIN}.po")
+        i18n.write_po(po_path, entries)
+        parsed = i18n.read_po(po_path)
+        assert parsed["Hello!"] == "¡Hola!"
+        assert parsed['Type "go"\nthen wait'] == 'Escribe "go"\ny espera'
+
+        i18n.write_mo(i18n.mo_path("es", locale_dir), parsed)
+        catalog = i18n.catalog("es", locale_dir, ("es",))
+        assert catalog.gettext("Hello!") == "¡Hola!"
+        assert catalog.gettext('Type "go"\nthen wait') == 'Escribe "go"\ny espera'
+        # Missing translations fall back to the English source
+        assert catalog.gettext("Untranslated") == "Untranslated"
+
+
+def test_catalogs_load_once_and_unknown_languages_get_english():
+    i18n.catalog.cache_clear()
+    assert i18n.translate("Great! What's your phone number?", "en") == "Great! What's your phone number?"
+    assert i18n.translate("Great! What's your phone number?", "zh-cn") == "Great! What's your phone number?"
+    for _ in range(3):
+        i18n.translate("Great! What's your phone number?", "es")
+    assert i18n.catalog.cache_info().currsize == 3
+    assert i18n.normalize_language("pt-BR") == "pt"
+
+
+def test_every_prompt_is_translated_with_its_placeholders():
+    messages = i18n.extract_messages(i18n.SOURCE_FILES)
+    assert "What position are you applying for?" in messages
+    for lang in I18N_LANGUAGES:
+        translated = i18n.read_po(os.path.join(i18n.LOCALE_DIR, lang, "LC_MESSAGES", f"{i18n.DOMAIN}.po"))
+        for message in messages:
+            assert translated.get(message), (lang, message)
+            assert sorted(PLACEHOLDER_RE.findall(message)) == sorted(PLACEHOLDER_RE.findall(translated[message])), (lang, message)
+
+
+def test_compiled_catalogs_match_sources():
+    for lang in I18N_LANGUAGES:
+        translated = i18n.read_po(os.path.join(i18n.LOCALE_DIR, lang, "LC_MESSAGES", f"{i18n.DOMAIN}.po"))
+        catalog = i18n.catalog(lang)
+        for message, text in translated.items():
+            if message:
+                assert catalog.gettext(message) == text, f"{lang}: run `python i18n.py compile`"
+
+
+def test_prompt_helpers_take_a_language():
+    assert get_prompt("greeting").startswith("Hello!")
+    assert get_prompt("greeting", "es").startswith("¡Hola!")
+    assert get_prompt("missing", "es") == ""
+    assert "start screening" in get_fallback_response("random message", lang="de")
+    assert get_fallback_response("random message", lang="de") != get_fallback_response("random message")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Prompt Catalogs")
+    print("=" * 50)
+
+    for test in [test_po_round_trip_through_mo, test_catalogs_load_once_and_unknown_languages_get_english,
+                 test_every_prompt_is_translated_with_its_placeholders, test_compiled_catalogs_match_sources,
+                 test_prompt_helpers_take_a_language]:
+        test()
+        print(f"✅ {test.__name__} passed")
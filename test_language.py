@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test per-session language detection
+"""
+
+from language import SessionLanguage, is_linguistic
+
+
+class FakeDetector:
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return self.answers(text)
+
+
+def test_non_linguistic_input():
+    for text in ["5", "jane@example.com", "+1 (555) 010-0100", "https://example.com/cv", "Python", ""]:
+        assert not is_linguistic(text), text
+    assert is_linguistic("I enjoy writing tests")
+    assert is_linguistic("Me gustan las pruebas")
+
+
+def test_skipped_fields_and_short_ascii_never_detect():
+    detector = FakeDetector(lambda text: [("fr", 0.99)])
+    language = SessionLanguage(detect=detector)
+
+    assert language.detect("Jane Doe", field="name") == "en"
+    assert language.detect("Berlin, Germany", field="location") == "en"
+    assert language.detect("5", field="experience") == "en"
+    assert language.detect("Sounds good to me") == "en"
+    assert detector.calls == []
+    assert language.stats()["skipped"] == 3
+
+
+def test_detects_once_then_trusts_confident_guess():
+    detector = FakeDetector(lambda text: [("es", 0.999), ("pt", 0.001)])
+    language = SessionLanguage(detect=detector, min_confidence=0.9, decay=0.97, short_text=10)
+
+    assert language.detect("Me encanta trabajar con Python y Django") == "es"
+    assert language.detect("Los decoradores envuelven una función") == "es"
+    assert language.detect("Las tuplas son inmutables y las listas no") == "es"
+    assert len(detector.calls) == 1
+
+
+def test_redetects_when_confidence_decays():
+    detector = FakeDetector(lambda text: [("en", 0.95)])
+    language = SessionLanguage(detect=detector, min_confidence=0.9, decay=0.97, short_text=10)
+
+    for i in range(6):
+        language.detect(f"This is a longer answer number {i} about generators")
+    assert len(detector.calls) == 3
+
+
+def test_non_ascii_text_in_english_session_redetects_immediately():
+    detector = FakeDetector(lambda text: [("de", 0.99)] if "ü" in text else [("en", 0.999)])
+    language = SessionLanguage(detect=detector, min_confidence=0.9, decay=1.0, short_text=10)
+
+    assert language.detect("I have worked with Python for years") == "en"
+    assert language.detect("Ich würde gerne über Python sprechen") == "de"
+    assert len(detector.calls) == 2
+
+
+def test_memoizes_repeated_text_and_survives_errors():
+    def broken(text):
+        raise RuntimeError("No features in text.")
+
+    language = SessionLanguage(detect=broken, short_text=10)
+    assert language.detect("Something that cannot be detected") == "en"
+
+    detector = FakeDetector(lambda text: [("it", 0.5)])
+    language = SessionLanguage(detect=detector, short_text=10)
+    for _ in range(3):
+        assert language.detect("Mi piace molto programmare") == "it"
+    assert len(detector.calls) == 1
+
+
+def test_repeated_text_reports_the_current_language():
+    """A memo hit must agree with SessionLanguage.language, which app.py stores"""
+    detector = FakeDetector(lambda text: [("es", 0.99)] if "Hola" in text else [("en", 0.99)])
+    language = SessionLanguage(detect=detector, short_text=10, min_confidence=0.5, decay=0.1)
+    assert language.detect("I have worked with Python for years") == "en"
+    assert language.detect("Hola, me gusta mucho programar") == "es"
+    assert language.detect("I have worked with Python for years") == language.language == "es"
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Language Detection")
+    print("=" * 50)
+
+    for test in [test_non_linguistic_input, test_skipped_fields_and_short_ascii_never_detect,
+                 test_detects_once_then_trusts_confident_guess, test_redetects_when_confidence_decays,
+                 test_non_ascii_text_in_english_session_redetects_immediately,
+                 test_memoizes_repeated_text_and_survives_errors,
+                 test_repeated_text_reports_the_current_language]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test lazy imports and the startup import profiler
+"""
+
+import builtins
+import sys
+
+from lazy_imports import lazy_import, lazy_import_times, is_installed, StartupProfiler
+
+
+def test_is_installed_does_not_import():
+    sys.modules.pop("wave", None)
+    assert is_installed("wave")
+    assert "wave" not in sys.modules
+    assert not is_installed("definitely_not_a_module_xyz")
+    assert not is_installed("definitely_not_a_package_xyz.sub")
+
+
+def test_lazy_import_loads_once_and_records_time():
+    sys.modules.pop("colorsys", None)
+    lazy_import_times.pop("colorsys", None)
+
+    module = lazy_import("colorsys")
+    assert module is sys.modules["colorsys"]
+    assert lazy_import_times["colorsys"] >= 0
+
+    lazy_import_times["colorsys"] = -1.0
+    assert lazy_import("colorsys") is module
+    assert lazy_import_times["colorsys"] == -1.0
+
+
+def test_profiler_times_first_imports_and_restores_import():
+    sys.modules.pop("quopri", None)
+    original = builtins.__import__
+
+    profiler = StartupProfiler()
+    profiler.start()
+    assert profiler.running
+    import os  # noqa: F401 - already loaded, not timed
+    import quopri  # noqa: F401
+    profiler.stop()
+
+    assert builtins.__import__ is original
+    assert "quopri" in profiler.timings
+    assert "os" not in profiler.timings
+    assert profiler.total is not None
+    assert profiler.report(top=1)[0][0] in profiler.timings
+    assert "first script run" in profiler.format_report()
+
+    # Streamlit reruns call start() again; only the first run is profiled
+    profiler.start()
+    assert not profiler.running
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Lazy Imports")
+    print("=" * 50)
+
+    for test in [test_is_installed_does_not_import, test_lazy_import_loads_once_and_records_time,
+                 test_profiler_times_first_imports_and_restores_import]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test the compiled keyword lexicon and the detectors built on it
+"""
+
+from fallback_responses import get_fallback_response
+from greeting_pool import match_keyword
+from lexicon import Lexicon, LEXICON
+
+
+def test_whole_words_only():
+    found = LEXICON.scan("That seems unlikely, and I'm unhappy about the badge")
+    assert not found.has("positive")
+    assert not found.has("negative")
+
+    found = LEXICON.scan("I like it, but I'm a bit worried.")
+    assert found.terms("positive") == ["like"]
+    assert found.has("negative") and found.has("nervous")
+
+
+def test_counts_distinct_terms_per_category():
+    found = LEXICON.scan("Great, great, GREAT and good")
+    assert found.count("positive") == 2
+    assert found.count("negative") == 0
+
+
+def test_phrases_and_positions():
+    found = LEXICON.scan("Well, good   morning to you")
+    assert found.terms("greeting") == ["good morning"]
+    assert found.first_position("greeting") == 6
+    assert found.first_position("tech") is None
+
+
+def test_custom_lexicon_shared_terms():
+    lexicon = Lexicon({"a": ["x y", "z"], "b": ["z"]})
+    found = lexicon.scan("z then x y")
+    assert found.terms("a") == ["z", "x y"]
+    assert found.terms("b") == ["z"]
+
+    # Prefix-factored pattern still respects word boundaries and prefers longer terms
+    lexicon = Lexicon({"g": ["hi", "high five"]})
+    assert not lexicon.scan("high").has("g")
+    assert lexicon.scan("high five!").terms("g") == ["high five"]
+    assert lexicon.scan("hi, high five").terms("g") == ["hi", "high five"]
+
+
+def test_greeting_keyword_and_fallback_intents():
+    assert match_keyword("Hi, good evening!") == "good evening"
+    assert match_keyword("this is it") is None
+    assert "wonderful to hear" in get_fallback_response("I'm excited!")
+    assert "technical skills" in get_fallback_response("I code in Python")
+    # "this" no longer reads as a greeting
+    assert not get_fallback_response("this").startswith("Hello!")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Keyword Lexicon")
+    print("=" * 50)
+
+    for test in [test_whole_words_only, test_counts_distinct_terms_per_category, test_phrases_and_positions,
+                 test_custom_lexicon_shared_terms, test_greeting_keyword_and_fallback_intents]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test the background LLM worker pool
+"""
+
+import threading
+import time
+
+from llm_worker import LLMWorkerPool
+
+
+def wait_for(pool, job):
+    for _ in range(200):
+        status, result = pool.poll(job)
+        if status != "pending":
+            return status, result
+        time.sleep(0.01)
+    raise AssertionError("job never finished")
+
+
+def test_job_result():
+    pool = LLMWorkerPool(max_workers=2, max_pending=4, job_timeout=5)
+    job = pool.submit(lambda text: text.upper(), "hello")
+
+    assert wait_for(pool, job) == ("done", "HELLO")
+
+
+def test_errors_become_none():
+    """A failing job resolves to None so the caller uses its fallback"""
+    def fail():
+        raise RuntimeError("503 UNAVAILABLE")
+
+    pool = LLMWorkerPool(max_workers=1, max_pending=2, job_timeout=5)
+    assert wait_for(pool, pool.submit(fail)) == ("done", None)
+
+
+def test_global_cap_and_timeout():
+    """Jobs beyond max_pending are rejected and slow jobs time out"""
+    release = threading.Event()
+    pool = LLMWorkerPool(max_workers=1, max_pending=2, job_timeout=0.05)
+
+    first = pool.submit(release.wait)
+    second = pool.submit(release.wait)
+    assert pool.submit(release.wait) is None
+    assert pool.stats()["rejected"] == 1
+
+    time.sleep(0.1)
+    assert pool.poll(first) == ("timeout", None)
+
+    release.set()
+    wait_for(pool, second)
+    for _ in range(100):
+        if pool.stats()["pending"] == 0:
+            break
+        time.sleep(0.01)
+    assert pool.submit(lambda: "ok") is not None
+
+
+if __name__ == "__main__":
+    print("🧪 Testing LLM Worker Pool")
+    print("=" * 50)
+
+    for test in [test_job_result, test_errors_become_none, test_global_cap_and_timeout]:
+        test()
+        print(f"✅ {test.__name__} passed")
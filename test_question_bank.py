@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test the indexed technical question bank
+"""
+
+import json
+import os
+import random
+import tempfile
+
+import tech_questions
+from question_bank import BUILTIN_GENERAL, DIFFICULTIES, GENERAL, Question, QuestionBank, difficulties_for, question_bank
+from tech_questions import generate_questions, generate_technical_questions
+
+
+def make_bank(rows):
+    return QuestionBank([Question(f"{tech}-{i}", tech, difficulty, topic, f"{tech} {difficulty} {topic} {i}?")
+                         for i, (tech, difficulty, topic) in enumerate(rows)])
+
+
+def test_shipped_bank_is_indexed():
+    assert len(question_bank) > 200
+    assert {"python", "javascript", "react", "java", "django", GENERAL} <= set(question_bank.techs())
+    for tech in question_bank.techs():
+        assert question_bank.ids(tech), tech
+    question_id = question_bank.ids("python", "medium")[0]
+    question = question_bank.get(question_id)
+    assert question.tech == "python" and question.difficulty == "medium"
+
+
+def test_load_validates_records():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bank.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"id": "a", "tech": "Go", "difficulty": "easy", "topic": "x", "question": "Q?"}) + "\n\n")
+        bank = QuestionBank.load(path)
+        assert "go" in bank and len(bank.ids("go")) == 1
+        # No general questions in the file: the built-in ones fill in
+        assert bank.ids(GENERAL) == [q.id for q in BUILTIN_GENERAL]
+
+        # Bad records are skipped and counted instead of failing the import
+        with open(path, "a", encoding="utf-8") as f:
+            for record in [{"id": "b", "tech": "go", "difficulty": "expert", "question": "Q?"},
+                           {"id": "a", "tech": "go", "difficulty": "hard", "question": "Duplicate?"},
+                           {"id": "c", "tech": 7, "difficulty": "easy", "question": "Q?"},
+                           {"id": "d", "tech": "go", "question": "Q?"},
+                           ["not", "an", "object"],
+                           "just a string",
+                           {"id": "e", "tech": "go", "difficulty": "hard", "question": "Kept?"}]:
+                f.write(json.dumps(record) + "\n")
+            f.write("{not json\n")
+        bank = QuestionBank.load(path)
+        assert bank.ids("go") == ["a", "e"]
+        assert bank.get("a").text == "Q?"
+        assert bank.skipped == 7 and bank.stats()["skipped"] == 7
+
+        assert QuestionBank.load(os.path.join(tmp, "missing.jsonl")).techs() == [GENERAL]
+
+
+def test_screening_without_a_bank_still_gets_questions():
+    """A missing bank file must not leave generate_questions() empty (the app indexes [0])"""
+    with tempfile.TemporaryDirectory() as tmp:
+        empty = QuestionBank.load(os.path.join(tmp, "missing.jsonl"))
+    shipped = tech_questions.question_bank
+    tech_questions.question_bank = empty
+    try:
+        questions = generate_questions(["python", "react"], "3")
+    finally:
+        tech_questions.question_bank = shipped
+    assert len(questions) == 4
+    assert set(questions) == {q.text for q in BUILTIN_GENERAL}
+
+
+def test_relative_bank_path_is_found_from_any_directory():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            bank = QuestionBank.load("data/question_bank.jsonl")
+        finally:
+            os.chdir(cwd)
+    assert len(bank) == len(question_bank)
+
+
+def test_sample_prefers_difficulty_then_distinct_topics():
+    bank = make_bank([("go", "easy", "a")] * 5 + [("go", "hard", "a"), ("go", "hard", "b"), ("go", "hard", "c")])
+    rng = random.Random(1)
+    for _ in range(20):
+        picked = bank.sample("go", 3, ("hard", "easy"), rng)
+        assert [q.difficulty for q in picked] == ["hard"] * 3
+        assert len({q.topic for q in picked}) == 3
+
+    # Not enough distinct topics: repeats fill the remaining slots
+    assert len(bank.sample("go", 6, ("easy",), rng)) == 5
+    assert bank.sample("cobol", 2) == []
+
+
+def test_difficulty_follows_experience():
+    assert difficulties_for("1 year")[0] == "easy"
+    assert difficulties_for("3")[0] == "medium"
+    assert difficulties_for("about 8 years")[0] == "hard"
+    assert difficulties_for("") == ("medium", "easy", "hard")
+    assert sorted(difficulties_for("12")) == sorted(DIFFICULTIES)
+
+
+def test_generate_questions_pads_with_general():
+    questions = generate_questions(["Python", " React "], "4 years")
+    assert len(questions) == 4 and len(set(questions)) == 4
+    python_questions = {question_bank.get(i).text for i in question_bank.ids("python")}
+    assert sum(q in python_questions for q in questions) == 2
+
+    general = {question_bank.get(i).text for i in question_bank.ids(GENERAL)}
+    assert all(q in general for q in generate_questions(["cobol"]))
+
+    technical = generate_technical_questions("python, cobol")
+    assert len(technical) == 5
+    assert technical[3] == "What are the core concepts of cobol?"
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Question Bank")
+    print("=" * 50)
+
+    for test in [test_shipped_bank_is_indexed, test_load_validates_records,
+                 test_sample_prefers_difficulty_then_distinct_topics, test_difficulty_follows_experience,
+                 test_generate_questions_pads_with_general, test_screening_without_a_bank_still_gets_questions,
+                 test_relative_bank_path_is_found_from_any_directory]:
+        test()
+        print(f"✅ {test.__name__} passed")
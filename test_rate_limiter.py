@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test the Gemini token-bucket limiter and circuit breaker
+"""
+
+from rate_limiter import GeminiGuard, is_quota_or_server_error, is_transport_error
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ApiError(Exception):
+    def __init__(self, code):
+        super().__init__(f"{code} error")
+        self.code = code
+
+
+def test_error_classification():
+    """Only quota and server errors count against the breaker"""
+    assert is_quota_or_server_error(ApiError(429))
+    assert is_quota_or_server_error(ApiError(503))
+    assert not is_quota_or_server_error(ApiError(400))
+    assert is_quota_or_server_error(Exception("429 RESOURCE_EXHAUSTED"))
+    assert is_transport_error(TimeoutError("read timed out"))
+    assert is_transport_error(ConnectionResetError())
+    assert is_transport_error(type("ReadTimeout", (type("TimeoutException", (Exception,), {}),), {})())
+    assert not is_transport_error(ApiError(400))
+
+
+def test_requests_per_minute():
+    """The request bucket refills at the configured RPM"""
+    clock = FakeClock()
+    guard = GeminiGuard(rpm=2, tpm=10000, clock=clock)
+
+    assert guard.acquire("hi")
+    assert guard.acquire("hi")
+    assert not guard.acquire("hi")
+
+    clock.now = 30
+    assert guard.acquire("hi")
+    assert guard.stats()["rejected"] == 1
+
+
+def test_tokens_per_minute():
+    """Large prompts are rejected once the TPM budget is spent"""
+    clock = FakeClock()
+    guard = GeminiGuard(rpm=100, tpm=100, clock=clock)
+
+    assert guard.acquire("x" * 300)
+    assert not guard.acquire("x" * 300)
+
+
+def test_breaker_opens_and_recovers():
+    """Repeated 429s open the breaker; a half-open probe closes it again"""
+    clock = FakeClock()
+    guard = GeminiGuard(rpm=100, tpm=10000, failure_threshold=2, reset_timeout=10, clock=clock)
+
+    for _ in range(2):
+        assert guard.acquire("hi")
+        guard.record_failure(ApiError(429))
+    assert guard.stats()["breaker_state"] == "open"
+    assert not guard.acquire("hi")
+
+    # Only one probe is allowed through once the timeout has passed
+    clock.now = 11
+    assert guard.acquire("hi")
+    assert not guard.acquire("hi")
+    guard.record_success()
+    assert guard.stats()["breaker_state"] == "closed"
+    assert guard.acquire("hi")
+
+
+def test_failed_probe_reopens():
+    clock = FakeClock()
+    guard = GeminiGuard(rpm=100, tpm=10000, failure_threshold=1, reset_timeout=10, clock=clock)
+
+    guard.acquire("hi")
+    guard.record_failure(ApiError(500))
+    clock.now = 11
+    assert guard.acquire("hi")
+    guard.record_failure(ApiError(503))
+    assert guard.stats()["breaker_state"] == "open"
+    assert not guard.acquire("hi")
+
+
+def test_timeouts_count_as_failures():
+    """A timeout means the API never answered, so it must not close the breaker"""
+    clock = FakeClock()
+    guard = GeminiGuard(rpm=100, tpm=10000, failure_threshold=2, reset_timeout=10, clock=clock)
+
+    for _ in range(2):
+        assert guard.acquire("hi")
+        guard.record_failure(TimeoutError("timed out"))
+    assert guard.stats()["breaker_state"] == "open"
+
+
+def test_abandoned_probe_is_released():
+    """A probe that ends without an outcome doesn't block the breaker forever"""
+    clock = FakeClock()
+    guard = GeminiGuard(rpm=100, tpm=10000, failure_threshold=1, reset_timeout=10, clock=clock)
+
+    assert guard.acquire("hi")
+    guard.record_failure(ApiError(503))
+    clock.now = 11
+    assert guard.acquire("hi")
+    assert not guard.acquire("hi")
+
+    guard.release()
+    assert guard.acquire("hi")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Gemini Rate Limiter")
+    print("=" * 50)
+
+    for test in [test_error_classification, test_requests_per_minute, test_tokens_per_minute,
+                 test_breaker_opens_and_recovers, test_failed_probe_reopens, test_timeouts_count_as_failures,
+                 test_abandoned_probe_is_released]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test the process-wide AI response cache
+"""
+
+from response_cache import ResponseCache, normalize_message
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_normalized_hits():
+    """Repeats like "Hi" / " hi! " share one entry"""
+    cache = ResponseCache(max_entries=10, ttls={"greeting": 60})
+    cache.set("greeting", "Hi", "model", "Hello there!")
+
+    assert normalize_message("  Hi!  ") == "hi"
+    assert cache.get("greeting", " hi! ", "model") == "Hello there!"
+    assert cache.get("greeting", "hi", "other-model") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry():
+    """Entries expire after the TTL for their context"""
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=10, ttls={"greeting": 60, "general": 0}, clock=clock)
+    cache.set("greeting", "hello", "model", "Welcome!")
+    cache.set("general", "hello", "model", "Never cached")
+
+    clock.now = 59
+    assert cache.get("greeting", "hello", "model") == "Welcome!"
+    assert cache.get("general", "hello", "model") is None
+
+    clock.now = 61
+    assert cache.get("greeting", "hello", "model") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted first"""
+    cache = ResponseCache(max_entries=2, ttls={"greeting": 60})
+    cache.set("greeting", "hi", "model", "a")
+    cache.set("greeting", "hello", "model", "b")
+    cache.get("greeting", "hi", "model")
+    cache.set("greeting", "hey", "model", "c")
+
+    assert cache.get("greeting", "hello", "model") is None
+    assert cache.get("greeting", "hi", "model") == "a"
+    assert cache.get("greeting", "hey", "model") == "c"
+    assert cache.stats()["evictions"] == 1
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Response Cache")
+    print("=" * 50)
+
+    for test in [test_normalized_hits, test_ttl_expiry, test_lru_eviction]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test the script run counters and the throttled stats log
+"""
+
+from run_stats import PeriodicStatsLog, ScriptRunStats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_run_counters():
+    stats = ScriptRunStats()
+    stats.record_run()
+    stats.record_fragment_run("chat_pane")
+    stats.record_fragment_run("chat_pane")
+    assert stats.runs == 1
+    assert stats.fragment_runs["chat_pane"] == 2
+
+
+def test_stats_log_is_throttled():
+    clock = FakeClock()
+    log = PeriodicStatsLog(60, clock=clock)
+    calls = []
+
+    def collect():
+        calls.append(1)
+        return {"requests": len(calls)}
+
+    assert log.maybe_log(collect)
+    clock.now = 30
+    assert not log.maybe_log(collect)
+    clock.now = 61
+    assert log.maybe_log(collect)
+    # Only collected when actually logged
+    assert len(calls) == 2
+
+
+def test_stats_log_disabled():
+    assert not PeriodicStatsLog(0).maybe_log(lambda: {})
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Run Stats")
+    print("=" * 50)
+
+    for test in [test_run_counters, test_stats_log_is_throttled, test_stats_log_disabled]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test the server-side session store and its backends
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+
+from session_store import SessionStore, MemoryBackend, SQLiteBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def sample_state():
+    return {
+        "chat": [("user", "hi"), ("assistant", "Hello! What's your full name?")],
+        "step": 2,
+        "data": {"name": "Jane Doe", "tech_stack": ["python"]},
+        "tech_questions": [],
+        "current_question_index": 0,
+        "question_answers": [],
+        "pending_reply": object(),
+    }
+
+
+def check_round_trip(backend):
+    store = SessionStore(backend)
+    store.save("token", sample_state())
+
+    state = store.load("token")
+    assert state["chat"] == [("user", "hi"), ("assistant", "Hello! What's your full name?")]
+    assert state["data"]["tech_stack"] == ["python"]
+    assert "pending_reply" not in state
+    assert store.load("missing") is None
+
+    store.delete("token")
+    assert store.load("token") is None
+
+
+def test_memory_backend_round_trip():
+    check_round_trip(MemoryBackend())
+
+
+def test_sqlite_backend_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        check_round_trip(SQLiteBackend(os.path.join(tmp, "sessions.db")))
+
+
+def test_sqlite_rehydrates_in_new_process_store():
+    """A second store on the same file (another replica) sees the session"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+        SessionStore(SQLiteBackend(path)).save("token", sample_state())
+
+        replica = SessionStore(SQLiteBackend(path))
+        assert replica.load("token")["step"] == 2
+        assert replica.stats()["backend_reads"] == 1
+
+
+def test_sqlite_uses_wal():
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = SQLiteBackend(os.path.join(tmp, "sessions.db"))
+        assert backend._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_reads_served_from_cache():
+    backend = MemoryBackend()
+    store = SessionStore(backend)
+    store.save("token", sample_state())
+
+    for _ in range(3):
+        store.load("token")
+    assert store.stats()["cache_hits"] == 3
+    assert store.stats()["backend_reads"] == 0
+
+
+def test_loaded_state_is_a_copy():
+    store = SessionStore(MemoryBackend())
+    store.save("token", sample_state())
+    store.load("token")["chat"].append(("user", "mutated"))
+    assert len(store.load("token")["chat"]) == 2
+
+
+def test_cache_expires_and_evicts():
+    clock = FakeClock()
+    backend = MemoryBackend()
+    store = SessionStore(backend, cache_size=1, cache_ttl=10, clock=clock)
+    store.save("a", sample_state())
+    store.save("b", sample_state())
+    assert store.stats()["cached"] == 1
+
+    store.load("a")
+    assert store.stats()["backend_reads"] == 1
+
+    clock.now = 11
+    store.load("a")
+    assert store.stats()["backend_reads"] == 2
+
+
+def test_bounce_between_replicas_is_not_served_stale():
+    """A -> B -> A: replica A re-reads the turns saved on B instead of its cached copy"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+        replica_a = SessionStore(SQLiteBackend(path))
+        replica_b = SessionStore(SQLiteBackend(path))
+
+        replica_a.save("token", sample_state())
+        state = replica_b.load("token")
+        state["step"] = 5
+        replica_b.save("token", state)
+
+        assert replica_a.load("token")["step"] == 5
+        assert replica_a.stats()["stale_hits"] == 1
+        assert replica_a.load("token")["step"] == 5
+        assert replica_a.stats()["cache_hits"] == 1
+
+
+def test_sqlite_adds_version_to_old_table():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE sessions (token TEXT PRIMARY KEY, document TEXT NOT NULL, updated_at REAL NOT NULL)")
+            conn.execute("INSERT INTO sessions VALUES ('token', '{\"step\": 3}', 0)")
+        backend = SQLiteBackend(path)
+        assert backend.load("token") == ('{"step": 3}', 1)
+        assert backend.save("token", "{}") == 2
+
+
+def test_memory_backend_is_bounded():
+    clock = FakeClock()
+    backend = MemoryBackend(max_sessions=2, idle_ttl=60, clock=clock)
+    for token in ("a", "b", "c"):
+        backend.save(token, "{}")
+    assert backend.load("a") is None
+    assert backend.load("b") == ("{}", 1)
+
+    clock.now = 61
+    assert backend.load("c") is None
+    assert backend.evicted == 2
+
+
+def test_sqlite_concurrent_writers():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SessionStore(SQLiteBackend(os.path.join(tmp, "sessions.db")))
+
+        def worker(n):
+            for i in range(20):
+                store.save(f"token-{n}", dict(sample_state(), step=i))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fresh = SessionStore(SQLiteBackend(os.path.join(tmp, "sessions.db")))
+        assert all(fresh.load(f"token-{n}")["step"] == 19 for n in range(4))
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Session Store")
+    print("=" * 50)
+
+    for test in [test_memory_backend_round_trip, test_sqlite_backend_round_trip,
+                 test_sqlite_rehydrates_in_new_process_store, test_sqlite_uses_wal,
+                 test_reads_served_from_cache, test_loaded_state_is_a_copy,
+                 test_cache_expires_and_evicts, test_bounce_between_replicas_is_not_served_stale,
+                 test_sqlite_adds_version_to_old_table, test_memory_backend_is_bounded,
+                 test_sqlite_concurrent_writers]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test single-flight deduplication of identical prompts
+"""
+
+import threading
+import time
+
+from singleflight import Abandoned, SingleFlight
+
+TIMEOUT = 5
+
+
+def wait_until(predicate, timeout=TIMEOUT):
+    """Bounded wait for another thread, so a regression fails instead of hanging"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for other threads"
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_execution():
+    """A burst of identical prompts results in one call"""
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        assert release.wait(TIMEOUT)
+        return "Hello!"
+
+    def worker():
+        results.append(flights.do("prompt", fetch))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    assert started.wait(TIMEOUT)
+
+    followers = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in followers:
+        thread.start()
+    wait_until(lambda: flights.stats()["collapsed"] == 5)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(TIMEOUT)
+        assert not thread.is_alive()
+
+    assert len(calls) == 1
+    assert results == ["Hello!"] * 6
+    assert flights.stats()["collapsed"] == 5
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_sequential_calls_execute_again():
+    flights = SingleFlight()
+    assert flights.do("a", lambda: 1) == 1
+    assert flights.do("a", lambda: 2) == 2
+    assert flights.stats()["executed"] == 2
+
+
+def test_errors_are_not_retained():
+    flights = SingleFlight()
+
+    def fail():
+        raise RuntimeError("429 RESOURCE_EXHAUSTED")
+
+    try:
+        flights.do("a", fail)
+    except RuntimeError:
+        pass
+    assert flights.do("a", lambda: "ok") == "ok"
+
+
+def test_streams_are_shared_with_followers():
+    """Followers replay the leader's chunks; a concurrent do() gets the joined text"""
+    flights = SingleFlight()
+    first_chunk = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        yield "Hel"
+        first_chunk.set()
+        assert release.wait(TIMEOUT)
+        yield "lo!"
+
+    results = {}
+    leader = threading.Thread(target=lambda: results.setdefault("leader", "".join(flights.stream("prompt", fetch))))
+    leader.start()
+    # The leader has sent "Hel" and is waiting for the rest
+    assert first_chunk.wait(TIMEOUT)
+
+    followers = [
+        threading.Thread(target=lambda: results.setdefault("stream", "".join(flights.stream("prompt", fetch)))),
+        threading.Thread(target=lambda: results.setdefault("do", flights.do("prompt", lambda: "other"))),
+    ]
+    for thread in followers:
+        thread.start()
+    wait_until(lambda: flights.stats()["collapsed"] == 2)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(TIMEOUT)
+        assert not thread.is_alive()
+
+    assert len(calls) == 1
+    assert results == {"leader": "Hello!", "stream": "Hello!", "do": "Hello!"}
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_abandoned_stream_releases_followers():
+    flights = SingleFlight()
+
+    def fetch():
+        yield "partial"
+        yield "never sent"
+
+    leader = flights.stream("prompt", fetch)
+    assert next(leader) == "partial"
+    follower = flights.stream("prompt", fetch)
+    assert next(follower) == "partial"
+    leader.close()
+    try:
+        next(follower)
+    except Abandoned:
+        pass
+    else:
+        raise AssertionError("a partial stream was passed off as complete")
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_do_follower_of_abandoned_stream_runs_again():
+    flights = SingleFlight()
+
+    def fetch():
+        yield "partial"
+        yield "never sent"
+
+    leader = flights.stream("prompt", fetch)
+    assert next(leader) == "partial"
+    results = []
+    follower = threading.Thread(target=lambda: results.append(flights.do("prompt", lambda: "full answer")))
+    follower.start()
+    wait_until(lambda: flights.stats()["collapsed"] == 1)
+    leader.close()
+    follower.join(TIMEOUT)
+    assert not follower.is_alive()
+    assert results == ["full answer"]
+    assert flights.stats()["executed"] == 2
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Single-Flight Deduplication")
+    print("=" * 50)
+
+    for test in [test_concurrent_calls_share_one_execution, test_sequential_calls_execute_again,
+                 test_errors_are_not_retained, test_streams_are_shared_with_followers,
+                 test_abandoned_stream_releases_followers, test_do_follower_of_abandoned_stream_runs_again]:
+        test()
+        print(f"✅ {test.__name__} passed")
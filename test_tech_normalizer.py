@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test tech stack parsing and normalization
+"""
+
+import time
+
+from tech_normalizer import DeleteIndex, TechNormalizer, edit_distance, split_stack, tech_normalizer
+from tech_questions import generate_questions
+
+
+def test_split_stack_separators():
+    assert split_stack("Python, React") == ["Python", "React"]
+    assert split_stack("React/Node.js and MongoDB") == ["React", "Node.js", "MongoDB"]
+    assert split_stack("- Python\n- Django;\n• Docker & Kubernetes | AWS") == ["Python", "Django", "Docker", "Kubernetes", "AWS"]
+    assert split_stack("Android, Pandas") == ["Android", "Pandas"]
+    assert split_stack(" , \n") == []
+
+
+def test_slash_and_ampersand_names_stay_whole():
+    assert split_stack("PL/SQL, CI/CD and R&D") == ["PL/SQL", "CI/CD", "R&D"]
+    assert tech_normalizer.normalize_stack(split_stack("PL/SQL, Python")) == ["sql", "python"]
+    assert split_stack("Oracle / PL/SQL") == ["Oracle", "PL/SQL"]
+    assert split_stack("HTML/CSS & JS") == ["HTML", "CSS", "JS"]
+
+
+def test_aliases_versions_and_punctuation():
+    cases = {
+        "ReactJS": "react", "react.js": "react", "Python3": "python", "Python 3.11": "python",
+        "node.js": "node", "JS": "javascript", "Java Script": "javascript", "C#": "csharp",
+        ".NET": "csharp", "C++": "cpp", "Golang": "go", "Postgres": "postgresql", "k8s": "kubernetes",
+        "Spring Boot": "spring", "HTML5": "html",
+    }
+    for entry, tech in cases.items():
+        assert tech_normalizer.normalize(entry) == tech, entry
+
+
+def test_typos_within_edit_distance():
+    for entry, tech in {"pyhton": "python", "Djnago": "django", "javascrpit": "javascript",
+                        "typescipt": "typescript", "kubernets": "kubernetes", "rusty": "rust"}.items():
+        assert tech_normalizer.normalize(entry) == tech, entry
+    # Too short to guess, or nothing close
+    assert tech_normalizer.normalize("jav") is None
+    assert tech_normalizer.normalize("Haskell") is None
+
+
+def test_ambiguous_typo_is_unknown():
+    normalizer = TechNormalizer(["react", "reach"], aliases={})
+    assert normalizer.normalize("reacx") is None
+    assert normalizer.normalize("raect") == "react"
+
+
+def test_near_miss_real_names_are_not_guessed():
+    """Real technologies one edit away from an alias or a short id stay unknown"""
+    for entry in ["Gradle", "NestJS", "Jest", "Deno", "Dart", "Helm", "Svelte", "Mocha", "Redux"]:
+        assert tech_normalizer.normalize(entry) is None, entry
+    # Distinctive aliases still tolerate a typo
+    assert tech_normalizer.normalize("golnag") == "go"
+    assert tech_normalizer.normalize("postgress") == "postgresql"
+
+
+def test_delete_index_matches_brute_force():
+    words = ["python", "pytorch", "react", "redis", "rest", "rust", "ruby", "java", "javascript"]
+    index = DeleteIndex(words)
+    for query in ["pyton", "reddis", "jav", "rast", "javascirpt", "xyz"]:
+        expected = sorted((edit_distance(query, w), w) for w in words if edit_distance(query, w) <= 2)
+        assert index.search(query, 2) == expected, query
+    assert edit_distance("pyhton", "python") == 1
+
+
+def test_lookups_are_sub_millisecond():
+    entries = ["ReactJS", "pyhton", "kubernets", "Haskell", "javascrpit"] * 20
+    started = time.perf_counter()
+    for entry in entries:
+        tech_normalizer._normalize(entry)
+    assert (time.perf_counter() - started) / len(entries) < 0.001
+
+
+def test_generate_questions_uses_normalized_stack():
+    questions = generate_questions(split_stack("ReactJS / JS and javascript"), "3 years")
+    assert len(questions) == 4
+    stats = tech_normalizer.stats()
+    assert stats["alias_hits"] > 0 and stats["aliases"] > 100
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Tech Stack Normalization")
+    print("=" * 50)
+
+    for test in [test_split_stack_separators, test_slash_and_ampersand_names_stay_whole,
+                 test_aliases_versions_and_punctuation,
+                 test_typos_within_edit_distance, test_ambiguous_typo_is_unknown,
+                 test_near_miss_real_names_are_not_guessed,
+                 test_delete_index_matches_brute_force, test_lookups_are_sub_millisecond,
+                 test_generate_questions_uses_normalized_stack]:
+        test()
+        print(f"✅ {test.__name__} passed")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test the bounded chat transcript and its spilled chunks
+"""
+
+import gzip
+import json
+import os
+import tempfile
+
+from chat_history import ChatHistoryView
+from session_store import SessionStore, MemoryBackend, SQLiteBackend
+from transcript import BoundedTranscript, MISSING_MESSAGE, deep_sizeof, memory_report
+
+
+def messages(count):
+    return [("user" if i % 2 == 0 else "assistant", f"message {i}") for i in range(count)]
+
+
+def test_tail_is_bounded_and_spill_is_batched():
+    backend = MemoryBackend()
+    transcript = BoundedTranscript(backend, "token", keep=5)
+    transcript.extend(messages(9))
+    assert transcript.spilled == 0
+
+    transcript.append(("user", "message 9"))
+    assert transcript.spilled == 5
+    assert len(transcript._recent) == 5
+    assert len(transcript) == 10
+    assert len(backend.load_spill("token")) == 1
+
+    transcript.extend(messages(100)[10:])
+    assert len(transcript._recent) < 10
+    assert len(transcript) == 100
+
+
+def test_behaves_like_the_list_it_replaces():
+    backend = MemoryBackend()
+    expected = messages(23)
+    transcript = BoundedTranscript(backend, "token", keep=4)
+    transcript.extend(expected)
+
+    assert list(transcript) == expected
+    assert transcript[0] == expected[0]
+    assert transcript[-1] == expected[-1]
+    assert transcript[3:7] == expected[3:7]
+    assert transcript[20:] == expected[20:]
+    assert transcript[-3:] == expected[-3:]
+    assert bool(transcript)
+    assert not BoundedTranscript(backend, "empty")
+
+
+def test_recent_slices_do_not_read_the_backend():
+    backend = MemoryBackend()
+    transcript = BoundedTranscript(backend, "token", keep=4)
+    transcript.extend(messages(20))
+    backend.delete_spill("token")
+    assert transcript[-4:] == messages(20)[-4:]
+
+
+def test_history_view_over_transcript():
+    transcript = BoundedTranscript(MemoryBackend(), "token", keep=4)
+    transcript.extend(messages(30))
+    view = ChatHistoryView(window=4, page_size=100)
+    view.load_earlier(len(transcript))
+    assert view.archive_markdown(transcript).count("message") == 26
+
+
+def test_another_replica_reads_the_spilled_messages():
+    """Spilled chunks live in the shared backend, not on the first replica's disk"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+        replica_a = SessionStore(SQLiteBackend(path))
+        transcript = replica_a.new_transcript("token")
+        transcript.extend(messages(20))
+        replica_a.save("token", {"chat": transcript, "step": 8})
+        document = json.loads(replica_a.backend.load("token")[0])
+        assert document["chat"] == {"spilled": transcript.spilled, "recent": [list(m) for m in transcript._recent]}
+
+        restored = SessionStore(SQLiteBackend(path)).load("token")["chat"]
+        assert isinstance(restored, BoundedTranscript)
+        assert list(restored) == messages(20)
+        assert restored[0] == messages(20)[0]
+
+        restored.append(("user", "more"))
+        restored.delete()
+        assert replica_a.backend.load_spill("token") == []
+
+
+def test_respill_after_lost_save_does_not_duplicate():
+    backend = MemoryBackend()
+    transcript = BoundedTranscript(backend, "token", keep=2)
+    transcript.extend(messages(4))
+    # The document saved before that spill still says nothing was spilled
+    stale = BoundedTranscript(backend, "token", keep=2, recent=messages(3))
+    stale.append(messages(4)[3])
+    assert list(stale) == messages(4)
+    assert len(backend.load_spill("token")) == 1
+
+
+def test_missing_chunks_become_placeholders():
+    backend = MemoryBackend()
+    transcript = BoundedTranscript(backend, "token", keep=4)
+    transcript.extend(messages(20))
+    backend.delete_spill("token")
+    assert len(list(transcript)) == 20
+    assert transcript[0] == MISSING_MESSAGE
+    view = ChatHistoryView(window=4, page_size=100)
+    view.load_earlier(len(transcript))
+    assert "unavailable" in view.archive_markdown(transcript)
+
+
+def test_legacy_spill_file_moves_into_the_backend():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "token.jsonl.gz")
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for message in messages(10):
+                f.write(json.dumps(message) + "\n")
+        backend = MemoryBackend()
+        document = {"path": path, "spilled": 10, "recent": messages(12)[10:]}
+        transcript = BoundedTranscript.from_document(document, backend, "token")
+        assert list(transcript) == messages(12)
+        assert not os.path.exists(path)
+
+
+def test_memory_report():
+    big = [("assistant", "x" * 1000)] * 50
+    bounded = BoundedTranscript(MemoryBackend(), "token", keep=5)
+    bounded.extend(big)
+
+    assert deep_sizeof(bounded) < deep_sizeof(list(big))
+    report = memory_report({"chat": bounded, "step": 8, "data": {"name": "Jane"}}, ("chat", "step", "data", "x"))
+    assert set(report) == {"chat", "step", "data", "total"}
+    assert report["total"] == report["chat"] + report["step"] + report["data"]
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Bounded Transcript")
+    print("=" * 50)
+
+    for test in [test_tail_is_bounded_and_spill_is_batched, test_behaves_like_the_list_it_replaces,
+                 test_recent_slices_do_not_read_the_backend, test_history_view_over_transcript,
+                 test_another_replica_reads_the_spilled_messages, test_respill_after_lost_save_does_not_duplicate,
+                 test_missing_chunks_become_placeholders, test_legacy_spill_file_moves_into_the_backend,
+                 test_memory_report]:
+        test()
+        print(f"✅ {test.__name__} passed")
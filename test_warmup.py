@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the process warm-up and readiness signal
+"""
+
+import json
+import os
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+
+from warmup import Warmup, Skipped, start_readiness_server
+
+
+def get_status(server):
+    url = f"http://127.0.0.1:{server.server_port}/ready"
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_runs_tasks_once_and_writes_ready_file():
+    calls = []
+
+    def skipped():
+        raise Skipped("not installed")
+
+    def broken():
+        raise RuntimeError("boom")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ready_file = os.path.join(tmp, "ready")
+        state = Warmup([("ok", lambda: calls.append(1)), ("skip", skipped), ("broken", broken)], ready_file)
+        state.start()
+        state.start()
+        assert state.wait(5)
+
+        assert calls == [1]
+        assert state.results["ok"]["status"] == "ok"
+        assert state.results["skip"]["status"] == "skipped: not installed"
+        assert state.results["broken"]["status"] == "error: boom"
+        with open(ready_file) as f:
+            assert set(json.load(f)) == {"ok", "skip", "broken"}
+
+
+def test_stale_ready_file_removed_on_start():
+    release = threading.Event()
+    with tempfile.TemporaryDirectory() as tmp:
+        ready_file = os.path.join(tmp, "ready")
+        open(ready_file, "w").close()
+
+        state = Warmup([("slow", release.wait)], ready_file)
+        state.start()
+        assert not os.path.exists(ready_file)
+        release.set()
+        assert state.wait(5)
+        assert os.path.exists(ready_file)
+
+
+def test_readiness_endpoint():
+    release = threading.Event()
+    state = Warmup([("slow", release.wait)], ready_file=None)
+    server = start_readiness_server(state, host="127.0.0.1", port=0)
+    try:
+        state.start()
+        status, body = get_status(server)
+        assert status == 503
+        assert body["ready"] is False
+
+        release.set()
+        state.wait(5)
+        status, body = get_status(server)
+        assert status == 200
+        assert body["tasks"]["slow"]["status"] == "ok"
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Warm-up")
+    print("=" * 50)
+
+    for test in [test_runs_tasks_once_and_writes_ready_file, test_stale_ready_file_removed_on_start,
+                 test_readiness_endpoint]:
+        test()
+        print(f"✅ {test.__name__} passed")
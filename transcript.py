@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Chat transcript with a bounded in-memory tail
+
+Older messages are stored as gzip-compressed JSON-lines chunks in the
+session backend, next to the session document, so any replica that loads
+the session can read them back when something asks (e.g. "Load earlier").
+"""
+
+import gzip
+import json
+import os
+import sys
+
+from config import TRANSCRIPT_KEEP
+
+# Stands in for spilled messages the backend no longer has
+MISSING_MESSAGE = ("assistant", "_(earlier message unavailable)_")
+
+
+def pack_messages(messages):
+    return gzip.compress("".join(json.dumps(message) + "\n" for message in messages).encode("utf-8"))
+
+
+def unpack_messages(blob):
+    return [tuple(json.loads(line)) for line in gzip.decompress(blob).decode("utf-8").splitlines()]
+
+
+class BoundedTranscript:
+    """
+    List-like sequence of (role, message) tuples.
+
+    At most 2 * keep messages are resident; when the tail reaches that,
+    everything but the last `keep` is spilled as one chunk, so spilling is
+    batched rather than done per message. `storage` is a session backend
+    (save_spill / load_spill / delete_spill); chunks are keyed by their
+    first message index, so re-spilling after a lost document save
+    overwrites instead of duplicating.
+    """
+
+    def __init__(self, storage, token, keep=TRANSCRIPT_KEEP, spilled=0, recent=()):
+        self.storage = storage
+        self.token = token
+        self.keep = max(1, keep)
+        self.spilled = spilled
+        self._recent = [tuple(message) for message in recent]
+
+    def __len__(self):
+        return self.spilled + len(self._recent)
+
+    def __iter__(self):
+        if self.spilled:
+            yield from self._read_spilled()
+        yield from self._recent
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if start >= self.spilled and step == 1:
+                return self._recent[start - self.spilled:max(start, stop) - self.spilled]
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transcript index out of range")
+        if index >= self.spilled:
+            return self._recent[index - self.spilled]
+        return self._read_spilled()[index]
+
+    def append(self, message):
+        self._recent.append(tuple(message))
+        if len(self._recent) >= 2 * self.keep:
+            self._spill(len(self._recent) - self.keep)
+
+    def extend(self, messages):
+        for message in messages:
+            self.append(message)
+
+    def _spill(self, count):
+        self.storage.save_spill(self.token, self.spilled, pack_messages(self._recent[:count]))
+        del self._recent[:count]
+        self.spilled += count
+
+    def _read_spilled(self):
+        """Exactly `spilled` messages; gaps (e.g. an evicted session) become MISSING_MESSAGE"""
+        messages = []
+        for start, blob in self.storage.load_spill(self.token):
+            if start >= self.spilled:
+                break
+            messages.extend([MISSING_MESSAGE] * (start - len(messages)))
+            messages[start:] = unpack_messages(blob)
+        messages = messages[:self.spilled]
+        return messages + [MISSING_MESSAGE] * (self.spilled - len(messages))
+
+    def delete(self):
+        """Remove the spilled messages from the backend"""
+        self.storage.delete_spill(self.token)
+
+    def to_document(self):
+        """JSON-able form for the session store; spilled chunks are stored separately"""
+        return {"spilled": self.spilled, "recent": self._recent}
+
+    @classmethod
+    def from_document(cls, document, storage, token, keep=TRANSCRIPT_KEEP):
+        transcript = cls(storage, token, keep, document["spilled"], document["recent"])
+        legacy_path = document.get("path")
+        if legacy_path and transcript.spilled and os.path.exists(legacy_path) and not storage.load_spill(token):
+            # Spilled to a local file by an older version; move it into the backend
+            with gzip.open(legacy_path, "rt", encoding="utf-8") as f:
+                spilled = [tuple(json.loads(line)) for line in f][:transcript.spilled]
+            storage.save_spill(token, 0, pack_messages(spilled))
+            os.remove(legacy_path)
+        return transcript
+
+
+def deep_sizeof(value, seen=None):
+    """Approximate resident bytes of strings, numbers and nested containers"""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, BoundedTranscript):
+        size += deep_sizeof(value._recent, seen)
+    elif isinstance(value, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(deep_sizeof(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += deep_sizeof(vars(value), seen)
+    return size
+
+
+def memory_report(state, fields):
+    """Bytes held per session-state field, plus the total"""
+    report = {field: deep_sizeof(state[field]) for field in fields if field in state}
+    report["total"] = sum(report.values())
+    return report
@@ -1,2 +1,17 @@
+import json
+
+
 def is_exit_command(text):
     return text.lower() in ["exit", "quit", "bye"]
+
+
+def parse_json_reply(text):
+    """JSON value from a model reply, tolerating ```json code fences; None if it doesn't parse"""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.index("\n") + 1:] if "\n" in text else ""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Process-level warm-up of the NLP models and Gemini client
+
+Preloads langdetect's language profiles, TextBlob's sentiment lexicon and
+the pooled Gemini client once per process, then signals readiness through
+WARMUP_READY_FILE and, if WARMUP_READY_PORT is set, GET /ready.
+
+Run the app through this module so warm-up starts with the server rather
+than with the first candidate's session:
+
+    WARMUP_READY_PORT=8502 python warmup.py [streamlit run options]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import WARMUP_READY_FILE, WARMUP_READY_PORT
+from lazy_imports import lazy_import, is_installed
+
+
+class Skipped(Exception):
+    """A warm-up task that doesn't apply here (dependency or key missing)"""
+
+
+def warm_langdetect():
+    if not is_installed("langdetect"):
+        raise Skipped("langdetect not installed")
+    # The first detection loads every language profile into DetectorFactory
+    from language import detect_probabilities
+    detect_probabilities("Warming up the language detector")
+
+
+def warm_textblob():
+    if not is_installed("textblob"):
+        raise Skipped("textblob not installed")
+    # The sentiment lexicon is parsed on the first .sentiment access
+    lazy_import("textblob").TextBlob("A great warm-up").sentiment
+
+
+def warm_gemini():
+    if not is_installed("google.genai"):
+        raise Skipped("google-genai not installed")
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        raise Skipped("GOOGLE_API_KEY not set")
+    from gemini_client import shared_client
+    # Builds the client (and imports google.genai/httpx) without spending quota
+    shared_client(api_key)
+
+
+DEFAULT_TASKS = [("langdetect", warm_langdetect), ("textblob", warm_textblob), ("gemini", warm_gemini)]
+
+
+class Warmup:
+    """
+    Runs the warm-up tasks once on a background thread.
+
+    A failing task is recorded and doesn't block readiness: the app falls
+    back per feature, so a container without e.g. textblob is still usable.
+    """
+
+    def __init__(self, tasks=DEFAULT_TASKS, ready_file=WARMUP_READY_FILE):
+        self.tasks = list(tasks)
+        self.ready_file = ready_file
+        self.results = {}
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start warming up; later calls are no-ops"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            if self.ready_file and os.path.exists(self.ready_file):
+                # Left over from a previous process
+                os.remove(self.ready_file)
+            self._thread = threading.Thread(target=self.run, name="warmup", daemon=True)
+            self._thread.start()
+
+    def run(self):
+        for name, task in self.tasks:
+            started = time.perf_counter()
+            try:
+                task()
+                status = "ok"
+            except Skipped as e:
+                status = f"skipped: {e}"
+            except Exception as e:
+                status = f"error: {e}"
+            self.results[name] = {"status": status, "seconds": round(time.perf_counter() - started, 3)}
+            print(f"[warmup] {name}: {status} ({self.results[name]['seconds'] * 1000:.0f} ms)")
+
+        if self.ready_file:
+            tmp_path = f"{self.ready_file}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.results, f)
+            os.replace(tmp_path, self.ready_file)
+        self._ready.set()
+
+    def is_ready(self):
+        return self._ready.is_set()
+
+    def wait(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    def stats(self):
+        return {"ready": self.is_ready(), "tasks": dict(self.results)}
+
+
+warmup = Warmup()
+
+
+class ReadinessHandler(BaseHTTPRequestHandler):
+    """GET /ready: 200 once warm, 503 while warming"""
+
+    warmup = warmup
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/ready":
+            self.send_error(404)
+            return
+        status = 200 if self.warmup.is_ready() else 503
+        body = json.dumps(self.warmup.stats()).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_readiness_server(state=warmup, host="0.0.0.0", port=WARMUP_READY_PORT):
+    """Serve /ready on a daemon thread; returns the server (see server.server_port)"""
+    handler = type("Handler", (ReadinessHandler,), {"warmup": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="readiness", daemon=True).start()
+    return server
+
+
+def main():
+    from dotenv import load_dotenv
+    from streamlit.web import cli as stcli
+
+    # Run as a script this module is __main__; without this, app.py's
+    # `from warmup import warmup` would load a second copy with its own,
+    # never-started Warmup instead of the one warmed up below
+    sys.modules.setdefault("warmup", sys.modules[__name__])
+
+    load_dotenv()
+    warmup.start()
+    if WARMUP_READY_PORT:
+        start_readiness_server()
+
+    # Same process as the warm-up, so sessions reuse what it loaded
+    sys.argv = ["streamlit", "run", os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py"), *sys.argv[1:]]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())